@@ -0,0 +1,55 @@
+"""Change notifications for SlotPlanner data.
+
+This module provides a small publish/subscribe bus that handlers use to
+announce which records changed, and a queue that merges those announcements
+so each view refreshes once per event loop pass.
+"""
+
+from collections.abc import Callable
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from app.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class DataBus(QObject):
+    """Signals emitted when application data changes."""
+
+    # Names of tandems that were added, updated, renamed or removed
+    tandems_changed = Signal(set)
+
+
+class DirtyKeyQueue(QObject):
+    """Collects changed keys and passes them to a callback in one batch."""
+
+    def __init__(self, callback: Callable[[set[str]], None], parent: QObject | None = None):
+        """Initialize the queue.
+
+        Args:
+            callback: Function called with all keys collected since the last flush
+            parent: Optional Qt parent object
+        """
+        super().__init__(parent)
+        self._callback = callback
+        self._keys: set[str] = set()
+
+    def add(self, keys: set[str]) -> None:
+        """Queue changed keys and schedule a flush on the next event loop pass.
+
+        Args:
+            keys: Keys that changed
+        """
+        if not keys:
+            return
+        if not self._keys:
+            QTimer.singleShot(0, self.flush)
+        self._keys |= keys
+
+    def flush(self) -> None:
+        """Pass all queued keys to the callback."""
+        keys, self._keys = self._keys, set()
+        if keys:
+            logger.debug("Flushing %d changed keys", len(keys))
+            self._callback(keys)
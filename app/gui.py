@@ -8,14 +8,17 @@ import sys
 import traceback
 from datetime import datetime
 
-from PySide6.QtCore import QFile, QIODevice
+from PySide6.QtCore import QFile, QIODevice, QSignalBlocker
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import QApplication, QComboBox, QLabel, QMainWindow, QPushButton, QSlider, QTextEdit
 
 from app import handlers
 from app.config.logging_config import get_logger
+from app.data_bus import DataBus, DirtyKeyQueue
+from app.handlers.base_handler import BaseHandler
 from app.storage import Storage
 from app.ui_feedback import create_feedback_manager
+from app.ui_teachers import refresh_tandems_table
 from app.utils import get_translations
 from app.version import get_version
 
@@ -43,6 +46,14 @@ class SlotPlannerApp(QMainWindow):
             self.previous_year = None
             self.previous_year_index = 0
 
+            # Set up by setup_feedback_system; None until then or if it fails
+            self.feedback_manager = None
+
+            # Handlers announce changed tandems here; the table refreshes once per event loop pass
+            self.bus = DataBus(self)
+            self._tandems_queue = DirtyKeyQueue(self._refresh_changed_tandems, self)
+            self.bus.tandems_changed.connect(self._tandems_queue.add)
+
             # Load and setup UI
             self.setup_ui()
             self.setup_callbacks()
@@ -116,7 +127,7 @@ class SlotPlannerApp(QMainWindow):
             else:
                 logger.warning("buttonSave not found")
 
-            combo_year = self.ui.findChild(QComboBox, "comboYearSelect")
+            combo_year = BaseHandler.get_year_combo(self)
             if combo_year:
                 combo_year.currentTextChanged.connect(lambda: handlers.main_on_year_changed(self, self.storage))
                 logger.debug("Connected comboYearSelect")
@@ -214,7 +225,7 @@ class SlotPlannerApp(QMainWindow):
                         QMessageBox.critical(self, get_translations("error"), f"An error occurred:\n{str(e)}")
 
                 button.clicked.connect(safe_callback)
-                logger.debug(f"Connected {button_name}")
+                logger.debug("Connected %s", button_name)
             else:
                 logger.warning(f"{button_name} not found")
         except Exception as e:
@@ -252,7 +263,7 @@ class SlotPlannerApp(QMainWindow):
                         return update_label
 
                     slider.valueChanged.connect(make_update_callback(label, weight_key))
-                    logger.debug(f"Connected {slider_name}")
+                    logger.debug("Connected %s", slider_name)
                 else:
                     if not slider:
                         logger.warning(f"{slider_name} not found")
@@ -268,6 +279,7 @@ class SlotPlannerApp(QMainWindow):
         try:
             self.feedback_manager = create_feedback_manager(self)
             self.feedback_manager.show_ready()
+            self.storage.on_save_error = self._on_background_save_failed
             logger.info("UI feedback system initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize UI feedback system: {e}")
@@ -275,24 +287,27 @@ class SlotPlannerApp(QMainWindow):
 
     def initialize_data(self):
         """Initialize the application with default data and populate year dropdown."""
-        if hasattr(self, "feedback_manager") and self.feedback_manager:
+        if self.feedback_manager:
             self.feedback_manager.show_status(get_translations("status_initializing_data"), show_progress=True)
 
         # Populate year dropdown with current and next school years
         current_year = datetime.now().year
-        combo_year = self.ui.findChild(QComboBox, "comboYearSelect")
-
-        # Add current and next 5 school years
-        for i in range(6):
-            year_start = current_year + i
-            year_end = year_start + 1
-            year_text = f"{year_start}_{year_end}"
-            combo_year.addItem(year_text)
-
-        # Set current year as default
-        current_school_year = f"{current_year}_{current_year + 1}"
-        combo_year.setCurrentText(current_school_year)
+        combo_year = BaseHandler.get_year_combo(self)
+
+        # Fill the dropdown without triggering a year change; the data is loaded once below
+        with QSignalBlocker(combo_year):
+            # Add current and next 5 school years
+            for i in range(6):
+                year_start = current_year + i
+                year_end = year_start + 1
+                year_text = f"{year_start}_{year_end}"
+                combo_year.addItem(year_text)
+
+            # Set current year (the first entry) as default
+            current_school_year = f"{current_year}_{current_year + 1}"
+            combo_year.setCurrentIndex(0)
         self.previous_year = current_school_year
+        self.previous_year_index = combo_year.currentIndex()
 
         # Load storage paths into UI
         handlers.settings_load_paths_into_ui(self, self.storage)
@@ -306,11 +321,24 @@ class SlotPlannerApp(QMainWindow):
         # Update UI with current language translations
         self.update_ui_translations()
 
-        if hasattr(self, "feedback_manager") and self.feedback_manager:
+        if self.feedback_manager:
             self.feedback_manager.show_ready()
 
+    def _refresh_changed_tandems(self, keys: set[str]):
+        """Update the tandems table rows for tandems announced on the data bus."""
+        data = self.storage.load(BaseHandler.get_current_year(self)) or {}
+        refresh_tandems_table(self.ui, data, changed_keys=keys)
+
+    def _on_background_save_failed(self, year: str):
+        """Report a failed debounced save in the status bar."""
+        if self.feedback_manager:
+            self.feedback_manager.show_error(get_translations("error_background_save_failed").format(year=year))
+
     def closeEvent(self, event):
         """Handle application close event with unsaved changes check."""
+        # Write any debounced edits before comparing against stored data
+        self.storage.flush()
+
         # Check for unsaved changes before closing
         if handlers._unsaved_changes(self, self.storage):
             from PySide6.QtWidgets import QMessageBox
@@ -4,11 +4,15 @@ This module provides base functionality and utilities shared across
 all handler modules.
 """
 
+import os
 import traceback
 from collections.abc import Callable
+from functools import cache
 from typing import Any
 
-from PySide6.QtWidgets import QMessageBox, QWidget
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+from PySide6.QtUiTools import QUiLoader
+from PySide6.QtWidgets import QComboBox, QMessageBox, QTableWidget, QWidget
 
 from app.config.logging_config import get_logger
 from app.utils import show_error
@@ -16,6 +20,35 @@ from app.utils import show_error
 logger = get_logger(__name__)
 
 
+@cache
+def _read_ui_file(ui_path: str) -> QByteArray:
+    """Read a .ui file once and keep its contents in memory.
+
+    Failed reads raise and are therefore not cached, so a later call retries.
+    The contents are kept as a QByteArray, which buffers share without copying.
+
+    Args:
+        ui_path: Path of the .ui file
+
+    Returns:
+        QByteArray: Contents of the .ui file
+    """
+    with open(ui_path, "rb") as f:
+        return QByteArray(f.read())
+
+
+@cache
+def _ui_loader() -> QUiLoader:
+    """Get the loader shared by all dialogs, created on first use.
+
+    Creating it lazily keeps it from being built before the QApplication exists.
+
+    Returns:
+        QUiLoader: Loader for .ui files
+    """
+    return QUiLoader()
+
+
 class BaseHandler:
     """Base class providing common handler functionality."""
 
@@ -45,6 +78,102 @@ class BaseHandler:
 
             return None
 
+    @staticmethod
+    def get_year_combo(window: QWidget) -> QComboBox | None:
+        """Get the school year combo box of the main window.
+
+        The combo box is resolved once and cached on the window so repeated
+        handler calls don't walk the widget tree.
+
+        Args:
+            window: Main application window instance
+
+        Returns:
+            Year selection combo box, or None if the UI has none
+        """
+        combo = getattr(window, "_year_combo", None)
+        if combo is None:
+            combo = window.ui.findChild(QComboBox, "comboYearSelect")
+            window._year_combo = combo
+        return combo
+
+    @staticmethod
+    def get_current_year(window: QWidget) -> str:
+        """Get the currently selected school year from the main window.
+
+        Args:
+            window: Main application window instance
+
+        Returns:
+            Selected school year in format "YYYY_YYYY"
+        """
+        return BaseHandler.get_year_combo(window).currentText()
+
+    @staticmethod
+    def get_availability_table(dialog: QWidget) -> QTableWidget | None:
+        """Get the availability table of a teacher or child dialog.
+
+        The table is resolved once and cached on the dialog so adding or
+        removing rows doesn't walk the widget tree on every click.
+
+        Args:
+            dialog: Dialog containing the availability table
+
+        Returns:
+            Availability table widget, or None if the dialog has none
+        """
+        table = getattr(dialog, "_availability_table", None)
+        if table is None:
+            table = dialog.findChild(QTableWidget, "tableAvailability")
+            dialog._availability_table = table
+        return table
+
+    @staticmethod
+    def load_ui_dialog(ui_path: str, window: QWidget) -> QWidget | None:
+        """Create a dialog from a .ui file whose contents are cached after the first read.
+
+        Args:
+            ui_path: Path of the .ui file
+            window: Parent window, also used to report load errors
+
+        Returns:
+            The loaded dialog, or None if it could not be loaded
+        """
+        ui_name = os.path.basename(ui_path)
+        try:
+            ui_data = _read_ui_file(ui_path)
+        except OSError as e:
+            error_msg = f"Cannot open {ui_name}: {e}"
+            logger.error(error_msg)
+            show_error(error_msg, window)
+            return None
+
+        buffer = QBuffer()
+        buffer.setData(ui_data)
+        buffer.open(QIODevice.ReadOnly)
+        dialog = _ui_loader().load(buffer, window)
+        buffer.close()
+
+        if not dialog:
+            error_msg = f"Failed to load {ui_name} - loader returned None"
+            logger.error(error_msg)
+            show_error(error_msg, window)
+            return None
+
+        return dialog
+
+    @staticmethod
+    def index_children(widget: QWidget) -> dict[str, QWidget]:
+        """Map object names to child widgets using a single tree traversal.
+
+        Args:
+            widget: Parent widget (usually a dialog) to index
+
+        Returns:
+            Dictionary of object name to child widget for all named children
+        """
+        return {child.objectName(): child for child in widget.findChildren(QWidget) if child.objectName()}
+
     @staticmethod
     def confirm_action(parent: QWidget, title: str, message: str) -> bool:
         """Show a confirmation dialog to the user.
@@ -107,7 +236,7 @@ class BaseHandler:
             # Set parent to None to ensure proper destruction
             widget.setParent(None)
 
-            logger.debug(f"Successfully cleaned up widget: {widget.objectName()}")
+            logger.debug("Successfully cleaned up widget: %s", widget.objectName())
 
         except Exception as e:
             logger.error(f"Error during widget cleanup: {e}")
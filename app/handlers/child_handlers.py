@@ -4,23 +4,31 @@ This module contains all handlers for child-related functionality
 including adding, editing, and deleting children.
 """
 
-from PySide6.QtCore import QFile, Qt
-from PySide6.QtUiTools import QUiLoader
+import copy
+
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
-    QCheckBox,
-    QComboBox,
-    QLineEdit,
+    QAbstractItemView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
-    QPushButton,
     QTableWidget,
     QWidget,
 )
 
 from app.config.logging_config import get_logger
 from app.storage import Storage
-from app.ui_teachers import refresh_children_table, refresh_tandems_table, refresh_teacher_table
+from app.ui_teachers import (
+    DAY_OPTIONS,
+    DEFAULT_END_TIME,
+    DEFAULT_START_TIME,
+    TIME_OPTIONS,
+    ChoiceDelegate,
+    append_availability_row,
+    fill_availability_table,
+    read_availability_rows,
+    refresh_children_table,
+)
 from app.utils import get_translations, show_error
 from app.validation import Validator
 
@@ -28,16 +36,37 @@ from .base_handler import BaseHandler
 
 logger = get_logger(__name__)
 
+_CHILD_DIALOG_UI = "app/ui/add_child.ui"
+
+# Object names of the buttons required by the child dialogs
+_CHILD_DIALOG_BUTTONS = ("buttonAddSlot", "buttonRemoveSlot", "buttonOk", "buttonCancel")
+
+# Translation keys for the texts of the child dialog buttons, labels and check box
+_CHILD_DIALOG_TEXTS = {
+    "buttonAddSlot": "add_time_slot",
+    "buttonRemoveSlot": "remove_selected",
+    "buttonOk": "save_child",
+    "buttonCancel": "cancel",
+    "childNameLabel": "child_name_label",
+    "earlyPreferenceLabel": "early_time_preference",
+    "preferredTeachersLabel": "preferred_teachers",
+    "earlyPreferenceCheckBox": "prefer_early_time_slots",
+}
+
 
 def _setup_availability_table_headers(dialog: QWidget) -> None:
-    """Set up translated headers for the availability table in dialog.
+    """Set up translated headers and combo box editors for the availability table in dialog.
 
     Args:
         dialog: Dialog containing the availability table
     """
-    table = dialog.findChild(QTableWidget, "tableAvailability")
+    table = BaseHandler.get_availability_table(dialog)
     if table:
         table.setHorizontalHeaderLabels([get_translations("day"), get_translations("start"), get_translations("end")])
+        table.setItemDelegateForColumn(0, ChoiceDelegate(DAY_OPTIONS, table))
+        table.setItemDelegateForColumn(1, ChoiceDelegate(TIME_OPTIONS, table))
+        table.setItemDelegateForColumn(2, ChoiceDelegate(TIME_OPTIONS, table))
+        table.setEditTriggers(QAbstractItemView.AllEditTriggers)
 
 
 def _setup_child_dialog_translations(dialog: QWidget) -> None:
@@ -46,45 +75,14 @@ def _setup_child_dialog_translations(dialog: QWidget) -> None:
     Args:
         dialog: Child dialog widget
     """
-    from PySide6.QtWidgets import QCheckBox, QGroupBox, QLabel, QPushButton
-
-    # Update button text
-    add_slot_btn = dialog.findChild(QPushButton, "buttonAddSlot")
-    if add_slot_btn:
-        add_slot_btn.setText(get_translations("add_time_slot"))
-
-    remove_slot_btn = dialog.findChild(QPushButton, "buttonRemoveSlot")
-    if remove_slot_btn:
-        remove_slot_btn.setText(get_translations("remove_selected"))
-
-    save_btn = dialog.findChild(QPushButton, "buttonOk")
-    if save_btn:
-        save_btn.setText(get_translations("save_child"))
-
-    cancel_btn = dialog.findChild(QPushButton, "buttonCancel")
-    if cancel_btn:
-        cancel_btn.setText(get_translations("cancel"))
-
-    # Update labels
-    name_label = dialog.findChild(QLabel, "childNameLabel")
-    if name_label:
-        name_label.setText(get_translations("child_name_label"))
+    widgets = BaseHandler.index_children(dialog)
 
-    early_pref_label = dialog.findChild(QLabel, "earlyPreferenceLabel")
-    if early_pref_label:
-        early_pref_label.setText(get_translations("early_time_preference"))
+    for object_name, translation_key in _CHILD_DIALOG_TEXTS.items():
+        widget = widgets.get(object_name)
+        if widget:
+            widget.setText(get_translations(translation_key))
 
-    preferred_teachers_label = dialog.findChild(QLabel, "preferredTeachersLabel")
-    if preferred_teachers_label:
-        preferred_teachers_label.setText(get_translations("preferred_teachers"))
-
-    # Update checkboxes
-    early_pref_checkbox = dialog.findChild(QCheckBox, "earlyPreferenceCheckBox")
-    if early_pref_checkbox:
-        early_pref_checkbox.setText(get_translations("prefer_early_time_slots"))
-
-    # Update group boxes
-    availability_group = dialog.findChild(QGroupBox, "availabilityGroupBox")
+    availability_group = widgets.get("availabilityGroupBox")
     if availability_group:
         availability_group.setTitle(get_translations("weekly_availability"))
 
@@ -100,22 +98,8 @@ def child_open_add_dialog(window: QWidget, storage: Storage) -> None:
     def _open_dialog():
         logger.info("Opening add child dialog")
 
-        loader = QUiLoader()
-        file = QFile("app/ui/add_child.ui")
-
-        if not file.open(QFile.ReadOnly):
-            error_msg = f"Cannot open add_child.ui: {file.errorString()}"
-            logger.error(error_msg)
-            show_error(error_msg, window)
-            return
-
-        add_child_dialog = loader.load(file, window)
-        file.close()
-
+        add_child_dialog = BaseHandler.load_ui_dialog(_CHILD_DIALOG_UI, window)
         if not add_child_dialog:
-            error_msg = "Failed to load add_child.ui - loader returned None"
-            logger.error(error_msg)
-            show_error(error_msg, window)
             return
 
         add_child_dialog.setWindowTitle(get_translations("add_child"))
@@ -133,7 +117,7 @@ def child_open_add_dialog(window: QWidget, storage: Storage) -> None:
         # Show the dialog
         logger.debug("Showing child dialog")
         result = add_child_dialog.exec()
-        logger.debug(f"Child dialog closed with result: {result}")
+        logger.debug("Child dialog closed with result: %s", result)
 
         # Proper cleanup to prevent memory leaks
         BaseHandler.cleanup_widget(add_child_dialog)
@@ -170,7 +154,7 @@ def child_edit_selected(window: QWidget, storage: Storage) -> None:
         logger.info(f"Opening edit dialog for child: {child_name}")
 
         # Load child data
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year) or storage.get_default_data_structure()
         child_data = data.get("children", {}).get(child_name)
 
@@ -179,7 +163,7 @@ def child_edit_selected(window: QWidget, storage: Storage) -> None:
             return
 
         # Open edit dialog with pre-populated data
-        _open_child_edit_dialog(window, storage, child_name, child_data)
+        _open_child_edit_dialog(window, storage, child_name, child_data, data)
 
     BaseHandler.safe_execute(_edit_child, parent=window)
 
@@ -212,7 +196,7 @@ def child_delete_selected(window: QWidget, storage: Storage) -> None:
         child_name = name_item.text()
 
         # Check for dependencies (tandems)
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year) or storage.get_default_data_structure()
 
         # Find tandems containing this child
@@ -224,7 +208,7 @@ def child_delete_selected(window: QWidget, storage: Storage) -> None:
         # Build confirmation message
         message = f"Are you sure you want to delete child '{child_name}'?"
         if affected_tandems:
-            message += f"\n\nThis will also remove the following tandems:\n• {chr(10).join(affected_tandems)}"
+            message += "\n\nThis will also remove the following tandems:\n• " + "\n• ".join(affected_tandems)
 
         # Confirm deletion
         reply = QMessageBox.question(
@@ -253,10 +237,9 @@ def child_delete_selected(window: QWidget, storage: Storage) -> None:
         if success:
             logger.info(f"Successfully deleted child {child_name} and {len(affected_tandems)} tandems")
 
-            # Refresh all tables
-            refresh_teacher_table(window.ui, data)
+            # Teachers don't show child data; removed tandems lose their rows
             refresh_children_table(window.ui, data)
-            refresh_tandems_table(window.ui, data)
+            window.bus.tandems_changed.emit(set(affected_tandems))
 
             BaseHandler.show_info(
                 window,
@@ -279,30 +262,26 @@ def _setup_child_dialog(dialog: QWidget, window: QWidget, storage: Storage) -> N
         window: Main window instance
         storage: Storage instance
     """
-    # Find buttons with error checking
-    button_add_slot = dialog.findChild(QPushButton, "buttonAddSlot")
-    button_remove_slot = dialog.findChild(QPushButton, "buttonRemoveSlot")
-    button_save = dialog.findChild(QPushButton, "buttonOk")
-    button_cancel = dialog.findChild(QPushButton, "buttonCancel")
-
-    missing_buttons = []
-    if not button_add_slot:
-        missing_buttons.append("buttonAddSlot")
-    if not button_remove_slot:
-        missing_buttons.append("buttonRemoveSlot")
-    if not button_save:
-        missing_buttons.append("buttonOk")
-    if not button_cancel:
-        missing_buttons.append("buttonCancel")
-
+    # Find buttons with error checking, resolving all of them in one traversal
+    widgets = BaseHandler.index_children(dialog)
+    missing_buttons = [name for name in _CHILD_DIALOG_BUTTONS if name not in widgets]
     if missing_buttons:
         error_msg = f"Missing buttons in add_child.ui: {', '.join(missing_buttons)}"
         logger.error(error_msg)
         show_error(error_msg, window)
         return
 
+    button_add_slot = widgets["buttonAddSlot"]
+    button_remove_slot = widgets["buttonRemoveSlot"]
+    button_save = widgets["buttonOk"]
+    button_cancel = widgets["buttonCancel"]
+
+    # Load the year once; the save below updates the same data
+    year = BaseHandler.get_current_year(window)
+    data = storage.load(year) or storage.get_default_data_structure()
+
     # Populate available teachers in the list
-    _populate_teachers_list(dialog, window, storage)
+    _populate_teachers_list(dialog, data)
 
     # Connect buttons with safe error handling
     button_add_slot.clicked.connect(
@@ -313,28 +292,24 @@ def _setup_child_dialog(dialog: QWidget, window: QWidget, storage: Storage) -> N
     )
     button_cancel.clicked.connect(dialog.reject)
     button_save.clicked.connect(
-        lambda: BaseHandler.safe_execute(child_save_from_dialog, dialog, window, storage, parent=dialog)
+        lambda: BaseHandler.safe_execute(child_save_from_dialog, dialog, window, storage, data, parent=dialog)
     )
 
     logger.debug("Child dialog buttons connected")
 
 
-def _populate_teachers_list(dialog: QWidget, window: QWidget, storage: Storage) -> None:
+def _populate_teachers_list(dialog: QWidget, data: dict) -> None:
     """Populate the preferred teachers list with available teachers.
 
     Args:
         dialog: Child dialog instance
-        window: Main window instance
-        storage: Storage instance
+        data: Data of the current year
     """
     teachers_list = dialog.findChild(QListWidget, "preferredTeachersList")
     if not teachers_list:
         logger.warning("preferredTeachersList not found in dialog")
         return
 
-    # Get current teachers data
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
-    data = storage.load(year) or storage.get_default_data_structure()
     teachers = data.get("teachers", {})
 
     # Populate list with teachers
@@ -345,7 +320,7 @@ def _populate_teachers_list(dialog: QWidget, window: QWidget, storage: Storage)
         item.setCheckState(Qt.Unchecked)
         teachers_list.addItem(item)
 
-    logger.debug(f"Populated {len(teachers)} teachers in preferred teachers list")
+    logger.debug("Populated %d teachers in preferred teachers list", len(teachers))
 
 
 def child_dialog_add_availability_row(dialog: QWidget) -> None:
@@ -356,49 +331,7 @@ def child_dialog_add_availability_row(dialog: QWidget) -> None:
     """
     logger.debug("Adding availability row to child dialog")
 
-    table = dialog.findChild(QTableWidget, "tableAvailability")
-    if not table:
-        logger.error("tableAvailability not found in dialog")
-        return
-
-    row = table.rowCount()
-    table.insertRow(row)
-    logger.debug(f"Inserted row {row}")
-
-    # Setup day dropdown
-    combo_day = QComboBox()
-    combo_day.addItems(["Mo", "Di", "Mi", "Do", "Fr"])
-    combo_day.setCurrentIndex(0)
-    combo_day.setEditable(False)
-    table.setCellWidget(row, 0, combo_day)
-
-    # Generate time options (7:00 - 20:45 with 15min intervals)
-    times = []
-    for h in range(7, 21):
-        for m in (0, 15, 30, 45):
-            times.append(f"{h:02}:{m:02}")
-
-    # Setup start time dropdown
-    combo_start = QComboBox()
-    combo_start.setEditable(False)
-    combo_start.addItems(times)
-    default_start_index = times.index("08:00") if "08:00" in times else 0
-    combo_start.setCurrentIndex(default_start_index)
-
-    combo_start.currentTextChanged.connect(lambda text: logger.debug(f"Start time changed to: {text}"))
-    table.setCellWidget(row, 1, combo_start)
-
-    # Setup end time dropdown
-    combo_end = QComboBox()
-    combo_end.setEditable(False)
-    combo_end.addItems(times)
-    default_end_index = times.index("17:00") if "17:00" in times else len(times) - 1
-    combo_end.setCurrentIndex(default_end_index)
-
-    combo_end.currentTextChanged.connect(lambda text: logger.debug(f"End time changed to: {text}"))
-    table.setCellWidget(row, 2, combo_end)
-
-    logger.debug("Availability row added successfully")
+    _add_availability_row_with_data(dialog, DAY_OPTIONS[0], DEFAULT_START_TIME, DEFAULT_END_TIME)
 
 
 def child_dialog_remove_selected_row(dialog: QWidget) -> None:
@@ -409,7 +342,7 @@ def child_dialog_remove_selected_row(dialog: QWidget) -> None:
     """
     logger.debug("Removing selected availability row")
 
-    table = dialog.findChild(QTableWidget, "tableAvailability")
+    table = BaseHandler.get_availability_table(dialog)
     if not table:
         logger.error("tableAvailability not found in dialog")
         return
@@ -417,21 +350,24 @@ def child_dialog_remove_selected_row(dialog: QWidget) -> None:
     selected = table.currentRow()
     if selected >= 0:
         table.removeRow(selected)
-        logger.debug(f"Removed row {selected}")
+        logger.debug("Removed row %d", selected)
     else:
         logger.debug("No row selected to remove")
         show_error(get_translations("error_please_select_row_remove"), dialog)
 
 
-def child_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage) -> None:
+def child_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage, data: dict | None = None) -> None:
     """Save child data from the add child dialog.
 
     Args:
         dialog: Child dialog instance
         window: Main window instance
         storage: Storage instance for data persistence
+        data: Data of the current year loaded when the dialog was opened; loaded
+            from storage if not given
     """
-    name_field = dialog.findChild(QLineEdit, "childNameLineEdit")
+    widgets = BaseHandler.index_children(dialog)
+    name_field = widgets.get("childNameLineEdit")
     if not name_field:
         show_error(get_translations("error_child_name_field_not_found"), dialog)
         return
@@ -457,11 +393,11 @@ def child_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage) -
     name = name_field.text().replace(" ", "_").strip()
 
     # Get early preference
-    early_checkbox = dialog.findChild(QCheckBox, "earlyPreferenceCheckBox")
+    early_checkbox = widgets.get("earlyPreferenceCheckBox")
     early_preference = early_checkbox.isChecked() if early_checkbox else False
 
     # Get preferred teachers
-    teachers_list = dialog.findChild(QListWidget, "preferredTeachersList")
+    teachers_list = widgets.get("preferredTeachersList")
     preferred_teachers = []
     if teachers_list:
         for i in range(teachers_list.count()):
@@ -469,39 +405,12 @@ def child_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage) -
             if item.checkState() == Qt.Checked:
                 preferred_teachers.append(item.text())
 
-    # Get availability
-    table = dialog.findChild(QTableWidget, "tableAvailability")
+    # Get availability from table, validating the slots and the complete availability together
+    table = BaseHandler.get_availability_table(dialog)
+    rows = read_availability_rows(table) if table else []
     availability = {}
-
-    if table:
-        for row in range(table.rowCount()):
-            day_widget = table.cellWidget(row, 0)
-            start_widget = table.cellWidget(row, 1)
-            end_widget = table.cellWidget(row, 2)
-
-            if any(w is None for w in [day_widget, start_widget, end_widget]):
-                continue  # skip incomplete rows
-
-            day = day_widget.currentText()
-            start = start_widget.currentText()
-            end = end_widget.currentText()
-
-            # Validate time slot
-            slot_validation = Validator.validate_time_slot(start, end)
-            if not slot_validation.is_valid:
-                show_error(
-                    get_translations("invalid_time_slot_text").format(
-                        day=day, error=slot_validation.get_error_message()
-                    ),
-                    dialog,
-                )
-                return
-
-            availability.setdefault(day, []).append([start, end])
-
-    # Validate complete child data
-    if availability:
-        availability_validation = Validator.validate_teacher_availability(availability)
+    if rows:
+        availability_validation, availability = Validator.validate_availability_rows(rows)
         if not availability_validation.is_valid:
             show_error(
                 f"Child availability validation failed:\n\n{availability_validation.get_error_message()}", dialog
@@ -521,8 +430,9 @@ def child_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage) -
                 return
 
     # Save child data
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
-    data = storage.load(year) or storage.get_default_data_structure()
+    year = BaseHandler.get_current_year(window)
+    if data is None:
+        data = storage.load(year) or storage.get_default_data_structure()
 
     data.setdefault("children", {})[name] = {
         "early_preference": early_preference,
@@ -535,10 +445,8 @@ def child_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage) -
         logger.info(f"Successfully saved child: {name}")
         dialog.accept()
 
-        # Refresh all tables
-        refresh_teacher_table(window.ui, data)
+        # A new child only appears in the children table
         refresh_children_table(window.ui, data)
-        refresh_tandems_table(window.ui, data)
 
         if hasattr(window, "feedback_manager") and window.feedback_manager:
             window.feedback_manager.show_success(get_translations("success_child_saved").format(name=name))
@@ -547,7 +455,9 @@ def child_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage) -
         show_error(get_translations("error_failed_save_child_data"), dialog)
 
 
-def _open_child_edit_dialog(window: QWidget, storage: Storage, child_name: str, child_data: dict) -> None:
+def _open_child_edit_dialog(
+    window: QWidget, storage: Storage, child_name: str, child_data: dict, data: dict | None = None
+) -> None:
     """Open the child edit dialog with pre-populated data.
 
     Args:
@@ -555,25 +465,13 @@ def _open_child_edit_dialog(window: QWidget, storage: Storage, child_name: str,
         storage: Storage instance
         child_name: Name of child to edit
         child_data: Existing child data
+        data: Data of the current year the child was read from; loaded from
+            storage if not given
     """
     logger.info(f"Opening edit dialog for child: {child_name}")
 
-    loader = QUiLoader()
-    file = QFile("app/ui/add_child.ui")
-
-    if not file.open(QFile.ReadOnly):
-        error_msg = f"Cannot open add_child.ui: {file.errorString()}"
-        logger.error(error_msg)
-        show_error(error_msg, window)
-        return
-
-    edit_child_dialog = loader.load(file, window)
-    file.close()
-
+    edit_child_dialog = BaseHandler.load_ui_dialog(_CHILD_DIALOG_UI, window)
     if not edit_child_dialog:
-        error_msg = "Failed to load add_child.ui - loader returned None"
-        logger.error(error_msg)
-        show_error(error_msg, window)
         return
 
     edit_child_dialog.setWindowTitle(f"{get_translations('edit_child')}: {child_name}")
@@ -585,37 +483,40 @@ def _open_child_edit_dialog(window: QWidget, storage: Storage, child_name: str,
     # Set up dialog UI translations
     _setup_child_dialog_translations(edit_child_dialog)
 
+    if data is None:
+        year = BaseHandler.get_current_year(window)
+        data = storage.load(year) or storage.get_default_data_structure()
+
     # Pre-populate the dialog with existing data
-    _populate_child_edit_dialog(edit_child_dialog, child_name, child_data, window, storage)
+    _populate_child_edit_dialog(edit_child_dialog, child_name, child_data, data)
 
     # Setup dialog functionality for editing
-    _setup_child_edit_dialog(edit_child_dialog, window, storage, child_name, child_data)
+    _setup_child_edit_dialog(edit_child_dialog, window, storage, child_name, data)
 
     # Show the dialog
     logger.debug("Showing child edit dialog")
     result = edit_child_dialog.exec()
-    logger.debug(f"Child edit dialog closed with result: {result}")
+    logger.debug("Child edit dialog closed with result: %s", result)
 
     # Proper cleanup to prevent memory leaks
     BaseHandler.cleanup_widget(edit_child_dialog)
 
 
-def _populate_child_edit_dialog(
-    dialog: QWidget, child_name: str, child_data: dict, window: QWidget, storage: Storage
-) -> None:
+def _populate_child_edit_dialog(dialog: QWidget, child_name: str, child_data: dict, data: dict) -> None:
     """Pre-populate the child edit dialog with existing data.
 
     Args:
         dialog: Child edit dialog instance
         child_name: Name of the child being edited
         child_data: Existing child data
-        window: Main window instance
-        storage: Storage instance
+        data: Data of the current year
     """
-    logger.debug(f"Pre-populating child edit dialog for: {child_name}")
+    logger.debug("Pre-populating child edit dialog for: %s", child_name)
+
+    widgets = BaseHandler.index_children(dialog)
 
     # Set child name (enable editing with warning)
-    name_field = dialog.findChild(QLineEdit, "childNameLineEdit")
+    name_field = widgets.get("childNameLineEdit")
     if name_field:
         name_field.setText(child_name)
         name_field.setReadOnly(False)  # Allow name changes during edit
@@ -625,22 +526,20 @@ def _populate_child_edit_dialog(
         )
 
     # Set early preference checkbox
-    early_checkbox = dialog.findChild(QCheckBox, "checkEarlyPreference")
+    early_checkbox = widgets.get("checkEarlyPreference")
     if early_checkbox:
         early_preference = child_data.get("early_preference", False)
         early_checkbox.setChecked(early_preference)
-        logger.debug(f"Set early preference to: {early_preference}")
+        logger.debug("Set early preference to: %s", early_preference)
 
     # Populate preferred teachers list
-    teachers_list = dialog.findChild(QListWidget, "listAvailableTeachers")
+    teachers_list = widgets.get("listAvailableTeachers")
     if teachers_list:
         # Clear existing items
         teachers_list.clear()
 
         # Get current teachers and preferred teachers
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
-        current_data = storage.load(year) or storage.get_default_data_structure()
-        available_teachers = list(current_data.get("teachers", {}).keys())
+        available_teachers = list(data.get("teachers", {}).keys())
         preferred_teachers = child_data.get("preferred_teachers", [])
 
         # Add all available teachers with checkboxes
@@ -650,26 +549,18 @@ def _populate_child_edit_dialog(
             item.setCheckState(Qt.Checked if teacher in preferred_teachers else Qt.Unchecked)
             teachers_list.addItem(item)
 
-        logger.debug(f"Populated {len(available_teachers)} teachers, {len(preferred_teachers)} preferred")
+        logger.debug("Populated %d teachers, %d preferred", len(available_teachers), len(preferred_teachers))
 
     # Populate availability table
-    availability_table = dialog.findChild(QTableWidget, "tableAvailability")
+    availability_table = BaseHandler.get_availability_table(dialog)
     if availability_table:
-        # Clear existing rows
-        availability_table.setRowCount(0)
-
-        # Add rows for existing availability
-        availability = child_data.get("availability", {})
-        for day, slots in availability.items():
-            for slot in slots:
-                if len(slot) == 2:
-                    _add_availability_row_with_data(dialog, day, slot[0], slot[1])
-
-        logger.debug(f"Pre-populated {sum(len(slots) for slots in availability.values())} availability slots")
+        # Replace any existing rows with the existing availability
+        slot_count = fill_availability_table(availability_table, child_data.get("availability", {}))
+        logger.debug("Pre-populated %d availability slots", slot_count)
 
 
 def _setup_child_edit_dialog(
-    dialog: QWidget, window: QWidget, storage: Storage, original_child_name: str, original_child_data: dict
+    dialog: QWidget, window: QWidget, storage: Storage, original_child_name: str, data: dict
 ) -> None:
     """Setup button connections for the child edit dialog.
 
@@ -678,30 +569,22 @@ def _setup_child_edit_dialog(
         window: Main window instance
         storage: Storage instance
         original_child_name: The original name of the child being edited
-        original_child_data: The original child data for comparison
+        data: Data of the current year, updated in place on save
     """
-    # Find buttons with error checking
-    button_add_slot = dialog.findChild(QPushButton, "buttonAddSlot")
-    button_remove_slot = dialog.findChild(QPushButton, "buttonRemoveSlot")
-    button_save = dialog.findChild(QPushButton, "buttonOk")
-    button_cancel = dialog.findChild(QPushButton, "buttonCancel")
-
-    missing_buttons = []
-    if not button_add_slot:
-        missing_buttons.append("buttonAddSlot")
-    if not button_remove_slot:
-        missing_buttons.append("buttonRemoveSlot")
-    if not button_save:
-        missing_buttons.append("buttonOk")
-    if not button_cancel:
-        missing_buttons.append("buttonCancel")
-
+    # Find buttons with error checking, resolving all of them in one traversal
+    widgets = BaseHandler.index_children(dialog)
+    missing_buttons = [name for name in _CHILD_DIALOG_BUTTONS if name not in widgets]
     if missing_buttons:
         error_msg = f"Missing buttons in child edit dialog: {', '.join(missing_buttons)}"
         logger.error(error_msg)
         show_error(error_msg, window)
         return
 
+    button_add_slot = widgets["buttonAddSlot"]
+    button_remove_slot = widgets["buttonRemoveSlot"]
+    button_save = widgets["buttonOk"]
+    button_cancel = widgets["buttonCancel"]
+
     # Connect buttons with safe error handling
     button_add_slot.clicked.connect(
         lambda: BaseHandler.safe_execute(child_dialog_add_availability_row, dialog, parent=dialog)
@@ -712,14 +595,16 @@ def _setup_child_edit_dialog(
     button_cancel.clicked.connect(dialog.reject)
     button_save.clicked.connect(
         lambda: BaseHandler.safe_execute(
-            child_update_from_edit_dialog, dialog, window, storage, original_child_name, parent=dialog
+            child_update_from_edit_dialog, dialog, window, storage, original_child_name, data, parent=dialog
         )
     )
 
     logger.debug("Child edit dialog buttons connected")
 
 
-def child_update_from_edit_dialog(dialog: QWidget, window: QWidget, storage: Storage, original_child_name: str) -> None:
+def child_update_from_edit_dialog(
+    dialog: QWidget, window: QWidget, storage: Storage, original_child_name: str, data: dict | None = None
+) -> None:
     """Update child data from the edit dialog.
 
     Args:
@@ -727,15 +612,23 @@ def child_update_from_edit_dialog(dialog: QWidget, window: QWidget, storage: Sto
         window: Main window instance
         storage: Storage instance for data persistence
         original_child_name: Original name of the child being edited
+        data: Data of the current year loaded when the dialog was opened; loaded
+            from storage if not given
     """
-    logger.debug(f"Updating child data for: {original_child_name}")
+    logger.debug("Updating child data for: %s", original_child_name)
 
     # Get current year
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
-    data = storage.load(year) or storage.get_default_data_structure()
+    year = BaseHandler.get_current_year(window)
+    if data is None:
+        data = storage.load(year) or storage.get_default_data_structure()
+    else:
+        # The dialog reuses this dict for every click, so a failed save must leave it unchanged
+        data = copy.deepcopy(data)
+
+    widgets = BaseHandler.index_children(dialog)
 
     # Get the (possibly changed) child name
-    name_field = dialog.findChild(QLineEdit, "childNameLineEdit")
+    name_field = widgets.get("childNameLineEdit")
     if not name_field:
         show_error(get_translations("error_child_name_field_not_found"), dialog)
         return
@@ -756,8 +649,6 @@ def child_update_from_edit_dialog(dialog: QWidget, window: QWidget, storage: Sto
             return
 
         # Confirm name change with user
-        from PySide6.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             dialog,
             "Confirm Name Change",
@@ -772,50 +663,24 @@ def child_update_from_edit_dialog(dialog: QWidget, window: QWidget, storage: Sto
     child_name = new_child_name
 
     # Get early preference
-    early_checkbox = dialog.findChild(QCheckBox, "checkEarlyPreference")
+    early_checkbox = widgets.get("checkEarlyPreference")
     early_preference = early_checkbox.isChecked() if early_checkbox else False
 
     # Get preferred teachers from list
     preferred_teachers = []
-    teachers_list = dialog.findChild(QListWidget, "listAvailableTeachers")
+    teachers_list = widgets.get("listAvailableTeachers")
     if teachers_list:
         for i in range(teachers_list.count()):
             item = teachers_list.item(i)
             if item.checkState() == Qt.Checked:
                 preferred_teachers.append(item.text())
 
-    # Get availability from table
+    # Get availability from table, validating the slots and the complete availability together
+    table = BaseHandler.get_availability_table(dialog)
+    rows = read_availability_rows(table) if table else []
     availability = {}
-    table = dialog.findChild(QTableWidget, "tableAvailability")
-    if table:
-        for row in range(table.rowCount()):
-            day_widget = table.cellWidget(row, 0)
-            start_widget = table.cellWidget(row, 1)
-            end_widget = table.cellWidget(row, 2)
-
-            if any(w is None for w in [day_widget, start_widget, end_widget]):
-                continue
-
-            day = day_widget.currentText()
-            start = start_widget.currentText()
-            end = end_widget.currentText()
-
-            # Validate time slot
-            slot_validation = Validator.validate_time_slot(start, end)
-            if not slot_validation.is_valid:
-                show_error(
-                    get_translations("invalid_time_slot_text").format(
-                        day=day, error=slot_validation.get_error_message()
-                    ),
-                    dialog,
-                )
-                return
-
-            availability.setdefault(day, []).append([start, end])
-
-    # Validate complete child data
-    if availability:
-        availability_validation = Validator.validate_teacher_availability(availability)
+    if rows:
+        availability_validation, availability = Validator.validate_availability_rows(rows)
         if not availability_validation.is_valid:
             show_error(
                 f"Child availability validation failed:\n\n{availability_validation.get_error_message()}", dialog
@@ -835,6 +700,7 @@ def child_update_from_edit_dialog(dialog: QWidget, window: QWidget, storage: Sto
                 return
 
     # Handle name change and update all references
+    renamed_tandems: set[str] = set()
     if name_changed:
         changes_made = []
 
@@ -848,10 +714,12 @@ def child_update_from_edit_dialog(dialog: QWidget, window: QWidget, storage: Sto
         for tandem_name, tandem_data in data.get("tandems", {}).items():
             if tandem_data.get("child1") == original_child_name:
                 tandem_data["child1"] = child_name
+                renamed_tandems.add(tandem_name)
                 tandems_updated += 1
                 changes_made.append(f"Updated tandem '{tandem_name}' child1 reference")
             if tandem_data.get("child2") == original_child_name:
                 tandem_data["child2"] = child_name
+                renamed_tandems.add(tandem_name)
                 tandems_updated += 1
                 changes_made.append(f"Updated tandem '{tandem_name}' child2 reference")
 
@@ -883,10 +751,9 @@ def child_update_from_edit_dialog(dialog: QWidget, window: QWidget, storage: Sto
         logger.info(f"Successfully {action} child: {original_child_name} -> {child_name}")
         dialog.accept()
 
-        # Refresh all tables
-        refresh_teacher_table(window.ui, data)
+        # Tandems only change when the child was renamed
         refresh_children_table(window.ui, data)
-        refresh_tandems_table(window.ui, data)
+        window.bus.tandems_changed.emit(renamed_tandems)
 
         if hasattr(window, "feedback_manager") and window.feedback_manager:
             if name_changed:
@@ -909,41 +776,11 @@ def _add_availability_row_with_data(dialog: QWidget, day: str, start_time: str,
         start_time: Start time
         end_time: End time
     """
-    table = dialog.findChild(QTableWidget, "tableAvailability")
+    table = BaseHandler.get_availability_table(dialog)
     if not table:
         logger.error("tableAvailability not found in dialog")
         return
 
-    row = table.rowCount()
-    table.insertRow(row)
-
-    # Setup day dropdown
-    combo_day = QComboBox()
-    combo_day.addItems(["Mo", "Di", "Mi", "Do", "Fr"])
-    combo_day.setCurrentText(day)
-    combo_day.setEditable(False)
-    table.setCellWidget(row, 0, combo_day)
-
-    # Generate time options
-    times = []
-    for h in range(7, 21):
-        for m in (0, 15, 30, 45):
-            times.append(f"{h:02}:{m:02}")
-
-    # Setup start time dropdown
-    combo_start = QComboBox()
-    combo_start.setEditable(False)
-    combo_start.addItems(times)
-    combo_start.setCurrentText(start_time)
-    combo_start.currentTextChanged.connect(lambda text: logger.debug(f"Start time changed to: {text}"))
-    table.setCellWidget(row, 1, combo_start)
-
-    # Setup end time dropdown
-    combo_end = QComboBox()
-    combo_end.setEditable(False)
-    combo_end.addItems(times)
-    combo_end.setCurrentText(end_time)
-    combo_end.currentTextChanged.connect(lambda text: logger.debug(f"End time changed to: {text}"))
-    table.setCellWidget(row, 2, combo_end)
-
-    logger.debug(f"Added pre-populated availability row: {day} {start_time}-{end_time}")
+    row = append_availability_row(table, day, start_time, end_time)
+
+    logger.debug("Added availability row %d: %s %s-%s", row, day, start_time, end_time)
@@ -6,11 +6,12 @@ loading, saving, year changes, and application lifecycle events.
 
 from typing import Any
 
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import QComboBox, QLabel, QMessageBox, QSlider, QSpinBox, QTableWidget, QTextEdit, QWidget
 
 from app.config.logging_config import get_logger
-from app.storage import Storage
-from app.ui_teachers import refresh_children_table, refresh_tandems_table, refresh_teacher_table
+from app.storage import DEFAULT_WEIGHTS, Storage
+from app.ui_teachers import refresh_all_tables
 from app.utils import get_translations
 from app.version import get_version
 
@@ -28,11 +29,11 @@ def main_on_load_clicked(window: QWidget, storage: Storage) -> None:
     """
 
     def _load_data():
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year)
 
         if data is not None:
-            window.previous_year_index = window.ui.findChild(QComboBox, "comboYearSelect").currentIndex()
+            window.previous_year_index = BaseHandler.get_year_combo(window).currentIndex()
             logger.info(f"Successfully loaded data for year {year}")
         else:
             logger.info(f"No data found for year {year}, using default structure")
@@ -42,9 +43,7 @@ def main_on_load_clicked(window: QWidget, storage: Storage) -> None:
         if hasattr(window, "feedback_manager") and window.feedback_manager:
             window.feedback_manager.show_status(get_translations("status_refreshing_tables"), show_progress=True)
 
-        refresh_teacher_table(window.ui, data)
-        refresh_children_table(window.ui, data)
-        refresh_tandems_table(window.ui, data)
+        refresh_all_tables(window.ui, data)
 
         if hasattr(window, "feedback_manager") and window.feedback_manager:
             window.feedback_manager.show_success(get_translations("success_data_loaded"))
@@ -63,7 +62,7 @@ def main_on_save_clicked(window: QWidget, storage: Storage) -> None:
     """
 
     def _save_data():
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         return _save_data_for_year(window, storage, year, show_feedback=True)
 
     BaseHandler.safe_execute(_save_data, parent=window)
@@ -98,9 +97,7 @@ def _save_data_for_year(window: QWidget, storage: Storage, year: str, show_feedb
     if show_feedback and hasattr(window, "feedback_manager") and window.feedback_manager:
         window.feedback_manager.show_status("Updating tables...", show_progress=True)
 
-        refresh_teacher_table(window.ui, data)
-        refresh_children_table(window.ui, data)
-        refresh_tandems_table(window.ui, data)
+        refresh_all_tables(window.ui, data)
 
         if success:
             window.feedback_manager.show_success(get_translations("success_data_saved_and_updated"))
@@ -118,7 +115,7 @@ def collect_data_from_ui(window: QWidget, storage: Storage) -> dict:
     Returns:
         Complete data dictionary with all current UI state
     """
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+    year = BaseHandler.get_current_year(window)
 
     # Start with existing data to preserve non-UI data
     data = storage.load(year) or storage.get_default_data_structure()
@@ -163,7 +160,7 @@ def collect_data_from_ui(window: QWidget, storage: Storage) -> dict:
             teachers_data[teacher_name] = {"availability": availability}
 
         data["teachers"] = teachers_data
-        logger.debug(f"Collected {len(teachers_data)} teachers from UI")
+        logger.debug("Collected %d teachers from UI", len(teachers_data))
 
     # Collect children data from table
     children_table = window.ui.findChild(QTableWidget, "tableChildren")
@@ -222,7 +219,7 @@ def collect_data_from_ui(window: QWidget, storage: Storage) -> dict:
             }
 
         data["children"] = children_data
-        logger.debug(f"Collected {len(children_data)} children from UI")
+        logger.debug("Collected %d children from UI", len(children_data))
 
     # Collect tandems data from table
     tandems_table = window.ui.findChild(QTableWidget, "tableTandems")
@@ -253,7 +250,7 @@ def collect_data_from_ui(window: QWidget, storage: Storage) -> dict:
             tandems_data[tandem_name] = {"child1": child1, "child2": child2, "priority": priority}
 
         data["tandems"] = tandems_data
-        logger.debug(f"Collected {len(tandems_data)} tandems from UI")
+        logger.debug("Collected %d tandems from UI", len(tandems_data))
 
     # Collect optimization weights from settings tab
     weights = {}
@@ -271,17 +268,10 @@ def collect_data_from_ui(window: QWidget, storage: Storage) -> dict:
             weights[key] = spin_box.value()
         else:
             # Use default if widget not found
-            defaults = {
-                "preferred_teacher": 5,
-                "priority_early_slot": 3,
-                "tandem_fulfilled": 4,
-                "teacher_pause_respected": 1,
-                "preserve_existing_plan": 10,
-            }
-            weights[key] = defaults.get(key, 5)
+            weights[key] = DEFAULT_WEIGHTS.get(key, 5)
 
     data["weights"] = weights
-    logger.debug(f"Collected optimization weights: {weights}")
+    logger.debug("Collected optimization weights: %s", weights)
 
     return data
 
@@ -293,7 +283,7 @@ def _force_reload_year_data(window: QWidget, storage: Storage) -> None:
         window: Main application window
         storage: Storage instance
     """
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+    year = BaseHandler.get_current_year(window)
     data = storage.load(year) or storage.get_default_data_structure()
 
     logger.info(f"Force reloading data for year {year}")
@@ -303,9 +293,7 @@ def _force_reload_year_data(window: QWidget, storage: Storage) -> None:
         window.feedback_manager.show_status(f"Loading data for {year}...", show_progress=True)
 
     # Clear and refresh all tables with new year data
-    refresh_teacher_table(window.ui, data)
-    refresh_children_table(window.ui, data)
-    refresh_tandems_table(window.ui, data)
+    refresh_all_tables(window.ui, data)
 
     # Load schedule results for the new year
     _load_schedule_results_for_year(window, storage, year)
@@ -351,7 +339,7 @@ def _load_weights_into_ui(window: QWidget, data: dict) -> None:
                 default_val = defaults.get(key, 5)
                 label.setText(f"Value: {value} (Default: {default_val}, Range: 0-20)")
 
-    logger.debug(f"Loaded weights into UI: {weights}")
+    logger.debug("Loaded weights into UI: %s", weights)
 
 
 def _load_schedule_results_for_year(window: QWidget, storage: Storage, year: str) -> None:
@@ -362,47 +350,50 @@ def _load_schedule_results_for_year(window: QWidget, storage: Storage, year: str
         storage: Storage instance
         year: School year to load results for
     """
-    from PySide6.QtWidgets import QComboBox
 
     # Get schedule history combo box
     combo_history = window.ui.findChild(QComboBox, "comboScheduleHistory")
     if not combo_history:
         return
 
-    # Clear and populate the combo box with saved results
-    combo_history.clear()
-
     results = storage.get_schedule_results(year)
+    current_result = storage.get_current_schedule_result(year) if results else None
+
+    # Refill the combo box without emitting selection changes; the selected result is displayed once below
+    with QSignalBlocker(combo_history):
+        combo_history.clear()
+
+        # Add results to combo box (most recent first)
+        for result in results:
+            display_text = f"{result['readable_timestamp']} - {result.get('description', 'Schedule Result')}"
+            combo_history.addItem(display_text, result["id"])
+
+        if current_result:
+            # Find and select the current result in combo box
+            index = combo_history.findData(current_result["id"])
+            if index >= 0:
+                combo_history.setCurrentIndex(index)
+        elif results:
+            # Select the most recent result by default
+            combo_history.setCurrentIndex(0)
+
     if not results:
         combo_history.setPlaceholderText(get_translations("no_saved_results_for_year"))
         _clear_schedule_display(window)
-        logger.debug(f"No schedule results found for year {year}")
+        logger.debug("No schedule results found for year %s", year)
         return
 
-    # Add results to combo box (most recent first)
-    for result in results:
-        display_text = f"{result['readable_timestamp']} - {result.get('description', 'Schedule Result')}"
-        combo_history.addItem(display_text, result["id"])
-
-    # Load the current schedule result if one is selected
-    current_result = storage.get_current_schedule_result(year)
     if current_result:
-        # Find and select the current result in combo box
-        current_id = current_result["id"]
-        for i in range(combo_history.count()):
-            if combo_history.itemData(i) == current_id:
-                combo_history.setCurrentIndex(i)
-                break
-
         # Display the current result
         _display_schedule_result(window, current_result)
-        logger.debug(f"Loaded current schedule result {current_id} for year {year}")
+        logger.debug("Loaded current schedule result %s for year %s", current_result["id"], year)
     else:
-        # Select the most recent result by default
-        combo_history.setCurrentIndex(0)
-        _display_schedule_result(window, results[0])
+        # Results only hold summaries; the full most recent result is loaded for display
+        latest_result = storage.get_schedule_result_by_id(year, results[0]["id"])
+        if latest_result:
+            _display_schedule_result(window, latest_result)
         storage.set_current_schedule(year, results[0]["id"])
-        logger.debug(f"Selected most recent schedule result for year {year}")
+        logger.debug("Selected most recent schedule result for year %s", year)
 
 
 def _clear_schedule_display(window: QWidget) -> None:
@@ -474,7 +465,7 @@ def _display_schedule_result(window: QWidget, result: dict[str, Any]) -> None:
 
         status_label.setText(status_text)
 
-    logger.debug(f"Displayed schedule result from {timestamp} with {len(violations)} violations")
+    logger.debug("Displayed schedule result from %s with %d violations", timestamp, len(violations))
 
 
 def _unsaved_changes(window: QWidget, storage: Storage) -> bool:
@@ -491,7 +482,7 @@ def _unsaved_changes(window: QWidget, storage: Storage) -> bool:
         True if there are unsaved changes, False otherwise
     """
     try:
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         return _has_unsaved_changes_for_year(window, storage, year)
     except Exception as e:
         logger.error(f"Error checking for unsaved changes: {e}")
@@ -513,12 +504,12 @@ def _has_unsaved_changes_for_year(window: QWidget, storage: Storage, year: str)
         if not year:
             return False
 
-        logger.debug(f"Checking for unsaved changes in year: {year}")
+        logger.debug("Checking for unsaved changes in year: %s", year)
 
         # Load stored data for the specified year
         stored_data = storage.load(year)
         if stored_data is None:
-            logger.debug(f"No stored data found for {year}, treating as new data")
+            logger.debug("No stored data found for %s, treating as new data", year)
             stored_data = storage.get_default_data_structure()
 
         # Build current_data from UI state - this represents what's currently shown
@@ -541,13 +532,13 @@ def _has_unsaved_changes_for_year(window: QWidget, storage: Storage, year: str)
         has_changes = stored_normalized != current_normalized
 
         if has_changes:
-            logger.debug(f"Unsaved changes detected for year {year}")
+            logger.debug("Unsaved changes detected for year %s", year)
             # Log specific differences for debugging
             for section in ["teachers", "children", "tandems", "weights"]:
                 if stored_normalized.get(section) != current_normalized.get(section):
-                    logger.debug(f"Changes detected in section: {section}")
+                    logger.debug("Changes detected in section: %s", section)
         else:
-            logger.debug(f"No unsaved changes for year {year}")
+            logger.debug("No unsaved changes for year %s", year)
 
         return has_changes
 
@@ -568,13 +559,13 @@ def main_on_year_changed(window: QWidget, storage: Storage) -> None:
     """
 
     def _handle_year_change():
-        combo = window.ui.findChild(QComboBox, "comboYearSelect")
+        combo = BaseHandler.get_year_combo(window)
         current_selection = combo.currentText()
 
         # Get the previous year that was displayed in UI before this change
         previous_year = getattr(window, "previous_year", None)
 
-        logger.debug(f"Year change detected: {previous_year} -> {current_selection}")
+        logger.debug("Year change detected: %s -> %s", previous_year, current_selection)
 
         # If we have a previous year and it's different from current selection
         if previous_year and previous_year != current_selection:
@@ -608,9 +599,8 @@ def main_on_year_changed(window: QWidget, storage: Storage) -> None:
                 elif result == QMessageBox.Cancel:
                     logger.info("Year change cancelled by user")
                     # Revert the combo box to previous selection
-                    combo.blockSignals(True)
-                    combo.setCurrentIndex(getattr(window, "previous_year_index", 0))
-                    combo.blockSignals(False)
+                    with QSignalBlocker(combo):
+                        combo.setCurrentIndex(getattr(window, "previous_year_index", 0))
                     return  # Don't update previous_year tracking
             else:
                 logger.debug("No unsaved changes detected, proceeding to load new year data")
@@ -624,7 +614,7 @@ def main_on_year_changed(window: QWidget, storage: Storage) -> None:
         # Update tracking variables for next change
         window.previous_year = current_selection
         window.previous_year_index = combo.currentIndex()
-        logger.debug(f"Updated previous_year tracking to: {window.previous_year}")
+        logger.debug("Updated previous_year tracking to: %s", window.previous_year)
 
     BaseHandler.safe_execute(_handle_year_change, parent=window)
 
@@ -649,10 +639,9 @@ def main_on_schedule_history_changed(window: QWidget, storage: Storage) -> None:
     """
 
     def _handle_schedule_selection():
-        from PySide6.QtWidgets import QComboBox
 
         combo_history = window.ui.findChild(QComboBox, "comboScheduleHistory")
-        year_combo = window.ui.findChild(QComboBox, "comboYearSelect")
+        year_combo = BaseHandler.get_year_combo(window)
 
         if not combo_history or not year_combo:
             return
@@ -686,10 +675,9 @@ def main_on_delete_schedule_clicked(window: QWidget, storage: Storage) -> None:
     """
 
     def _delete_schedule():
-        from PySide6.QtWidgets import QComboBox
 
         combo_history = window.ui.findChild(QComboBox, "comboScheduleHistory")
-        year_combo = window.ui.findChild(QComboBox, "comboYearSelect")
+        year_combo = BaseHandler.get_year_combo(window)
 
         if not combo_history or not year_combo:
             return
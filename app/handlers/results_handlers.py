@@ -4,9 +4,9 @@ This module contains handlers for schedule creation and export functionality.
 """
 
 import traceback
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from PySide6.QtWidgets import QComboBox, QProgressBar, QTableWidget, QTableWidgetItem, QTextEdit, QWidget
+from PySide6.QtWidgets import QProgressBar, QTableWidget, QTableWidgetItem, QTextEdit, QWidget
 
 try:
     from ortools.sat.python import cp_model
@@ -19,6 +19,7 @@ except ImportError:
 from app.config.logging_config import get_logger
 from app.storage import Storage
 from app.utils import get_translations, show_error
+from app.validation import Validator
 
 from .base_handler import BaseHandler
 
@@ -51,7 +52,7 @@ def results_create_schedule(window: QWidget, storage: Storage) -> None:
             window.feedback_manager.show_status("Preparing schedule optimization...", show_progress=True)
 
         # Get current data
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year) or storage.get_default_data_structure()
 
         teachers = data.get("teachers", {})
@@ -199,7 +200,7 @@ def results_export_pdf(window: QWidget, storage: Storage) -> None:
         logger.info("Starting PDF export")
 
         # Get current data
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year) or storage.get_default_data_structure()
 
         schedule = data.get("schedule", {})
@@ -432,6 +433,34 @@ def create_optimized_schedule(teachers, children, tandems, weights, worker=None)
     return schedule, violations
 
 
+def _slot_fits_in_periods(day_slots, time_slot):
+    """Check if a 45-minute lesson starting at time_slot fits into one of the periods.
+
+    Args:
+        day_slots: List of [start, end] periods in HH:MM format
+        time_slot: Lesson start time in HH:MM format
+
+    Returns:
+        True if the lesson lies completely within one period, False otherwise
+        (also if any time is malformed)
+    """
+    slot_start = Validator.parse_minutes(time_slot)
+    if slot_start is None:
+        return False
+    slot_end = slot_start + 45
+
+    for start_str, end_str in day_slots:
+        period_start = Validator.parse_minutes(start_str)
+        period_end = Validator.parse_minutes(end_str)
+        if period_start is None or period_end is None:
+            return False
+
+        # Slot must fit completely within available period
+        if period_start <= slot_start and slot_end <= period_end:
+            return True
+    return False
+
+
 def _teacher_available_at_time(teacher_data, day, time_slot):
     """Check if teacher is available at specific day/time."""
     availability = teacher_data.get("availability", {})
@@ -440,24 +469,7 @@ def _teacher_available_at_time(teacher_data, day, time_slot):
     if not day_slots:  # No slots for this day means not available
         return False
 
-    # Check if time_slot falls within any availability window
-    # Time slot must start within available period and have room for 45 minutes
-    from datetime import datetime
-
-    try:
-        slot_start = datetime.strptime(time_slot, "%H:%M")
-        slot_end = slot_start + timedelta(minutes=45)
-
-        for start_str, end_str in day_slots:
-            period_start = datetime.strptime(start_str, "%H:%M")
-            period_end = datetime.strptime(end_str, "%H:%M")
-
-            # Slot must fit completely within available period
-            if period_start <= slot_start and slot_end <= period_end:
-                return True
-        return False
-    except ValueError:
-        return False
+    return _slot_fits_in_periods(day_slots, time_slot)
 
 
 def _child_available_at_time(child_data, day, time_slot):
@@ -470,24 +482,7 @@ def _child_available_at_time(child_data, day, time_slot):
     if not day_slots:  # No slots for this day means not available
         return False
 
-    # Check if time_slot falls within any availability window
-    # Time slot must start within available period and have room for 45 minutes
-    from datetime import datetime
-
-    try:
-        slot_start = datetime.strptime(time_slot, "%H:%M")
-        slot_end = slot_start + timedelta(minutes=45)
-
-        for start_str, end_str in day_slots:
-            period_start = datetime.strptime(start_str, "%H:%M")
-            period_end = datetime.strptime(end_str, "%H:%M")
-
-            # Slot must fit completely within available period
-            if period_start <= slot_start and slot_end <= period_end:
-                return True
-        return False
-    except ValueError:
-        return False
+    return _slot_fits_in_periods(day_slots, time_slot)
 
 
 def _check_schedule_violations(schedule, teachers, children, tandems):
@@ -827,19 +822,12 @@ def _convert_to_time_range(time_slot):
     Returns:
         Time range string in format "HH:MM–HH:MM"
     """
-    try:
-        from datetime import datetime, timedelta
-
-        # Parse the start time
-        start_time = datetime.strptime(time_slot, "%H:%M")
-
-        # Add 45 minutes for the end time
-        end_time = start_time + timedelta(minutes=45)
-
-        # Format as range
-        return f"{start_time.strftime('%H:%M')}–{end_time.strftime('%H:%M')}"
-
-    except ValueError:
+    start_minutes = Validator.parse_minutes(time_slot)
+    if start_minutes is None:
         # If parsing fails, return the original time slot
         logger.warning(f"Could not parse time slot: {time_slot}")
         return time_slot
+
+    # Add 45 minutes for the end time (wrapping at midnight like a clock time)
+    end_minutes = (start_minutes + 45) % (24 * 60)
+    return f"{start_minutes // 60:02d}:{start_minutes % 60:02d}–{end_minutes // 60:02d}:{end_minutes % 60:02d}"
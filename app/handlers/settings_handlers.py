@@ -9,7 +9,7 @@ import os
 from PySide6.QtWidgets import QComboBox, QFileDialog, QLabel, QLineEdit, QMessageBox, QSlider, QWidget
 
 from app.config.logging_config import get_logger
-from app.storage import Storage
+from app.storage import DEFAULT_WEIGHTS, Storage
 from app.validation import Validator
 
 from .base_handler import BaseHandler
@@ -34,13 +34,7 @@ def _get_current_default_weights() -> dict:
         logger.warning(f"Failed to load custom default weights: {e}")
 
     # Fallback to hardcoded defaults
-    return {
-        "preferred_teacher": 5,
-        "priority_early_slot": 3,
-        "tandem_fulfilled": 4,
-        "teacher_pause_respected": 1,
-        "preserve_existing_plan": 10,
-    }
+    return dict(DEFAULT_WEIGHTS)
 
 
 def settings_reset_weights(window: QWidget, storage: Storage) -> None:
@@ -97,7 +91,7 @@ def settings_save_weights(window: QWidget, storage: Storage) -> None:
     """
 
     def _save_weights():
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year) or storage.get_default_data_structure()
 
         # Collect current weight values
@@ -289,7 +283,7 @@ def _save_path_settings(window: QWidget, storage: Storage) -> None:
         with open(config_file, "w", encoding="utf-8") as f:
             json.dump(config, f, indent=2)
 
-        logger.debug(f"Saved path settings to {config_file}")
+        logger.debug("Saved path settings to %s", config_file)
 
     except Exception as e:
         logger.error(f"Failed to save path settings: {e}")
@@ -314,7 +308,7 @@ def load_path_settings(storage: Storage) -> None:
             if "export_path" in config:
                 storage.export_dir = os.path.abspath(config["export_path"])
 
-            logger.debug(f"Loaded path settings from {config_file}")
+            logger.debug("Loaded path settings from %s", config_file)
         else:
             # No config file exists, ensure we use absolute defaults
             storage.data_dir = os.path.abspath(storage.data_dir)
@@ -463,7 +457,7 @@ def settings_load_weights_into_ui(window: QWidget, storage: Storage) -> None:
         window: Main application window instance
         storage: Storage instance for data persistence
     """
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+    year = BaseHandler.get_current_year(window)
     data = storage.load(year)
 
     if not data or "weights" not in data:
@@ -496,7 +490,7 @@ def settings_load_weights_into_ui(window: QWidget, storage: Storage) -> None:
                 label.setText(f"Value: {value} (Default: {default_val}, Range: 0-20)")
 
     if loaded_count > 0:
-        logger.debug(f"Loaded {loaded_count} weight values into UI for year {year}")
+        logger.debug("Loaded %d weight values into UI for year %s", loaded_count, year)
     else:
         logger.warning("No weight sliders found to load values into")
 
@@ -575,6 +569,6 @@ def settings_load_language_into_ui(window: QWidget, storage: Storage) -> None:
     index = combo_language.findText(display_name)
     if index >= 0:
         combo_language.setCurrentIndex(index)
-        logger.debug(f"Set language dropdown to {display_name}")
+        logger.debug("Set language dropdown to %s", display_name)
     else:
         logger.warning(f"Could not find {display_name} in language dropdown")
@@ -4,13 +4,10 @@ This module contains all handlers for tandem-related functionality
 including adding, editing, and deleting tandems.
 """
 
-from PySide6.QtCore import QFile
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtWidgets import QComboBox, QLineEdit, QMessageBox, QPushButton, QSpinBox, QTableWidget, QWidget
+from PySide6.QtWidgets import QComboBox, QLabel, QLineEdit, QMessageBox, QPushButton, QSpinBox, QTableWidget, QWidget
 
 from app.config.logging_config import get_logger
 from app.storage import Storage
-from app.ui_teachers import refresh_children_table, refresh_tandems_table, refresh_teacher_table
 from app.utils import get_translations, show_error
 from app.validation import Validator
 
@@ -18,6 +15,39 @@ from .base_handler import BaseHandler
 
 logger = get_logger(__name__)
 
+_TANDEM_DIALOG_UI = "app/ui/add_tandem.ui"
+
+_DAYS: tuple[str, ...] = ("Mo", "Di", "Mi", "Do", "Fr")
+
+# Overlap result used when a child has no availability constraints (available all the time)
+_NO_DATA_OVERLAP = {
+    "has_overlap": True,
+    "limited_overlap": False,
+    "total_overlap_minutes": 0,
+    "overlap_count": 0,
+    "overlaps": [],
+    "overlap_summary": "",
+}
+
+# Confirmation texts shown while saving a tandem, filled in with str.format
+_WARN_TMPL = "The following warnings were found:\n\n{}\n\nDo you want to continue?"
+_NO_OVERLAP_TMPL = (
+    "Warning: {} and {} have no overlapping availability.\n\n"
+    "This tandem cannot be scheduled together.\n\n"
+    "Do you want to create the tandem anyway?"
+)
+_LIMITED_OVERLAP_TMPL = (
+    "Note: {} and {} have limited overlapping availability:\n\n"
+    "{}\n\n"
+    "The tandem will be created but scheduling options may be limited."
+)
+_EXISTING_TANDEMS_TMPL = (
+    "The selected children are already in the following tandems:\n\n"
+    "• {}\n\n"
+    "Creating this tandem will create conflicting pairings.\n\n"
+    "Do you want to continue?"
+)
+
 
 def _setup_tandem_dialog_translations(dialog: QWidget) -> None:
     """Set up translations for tandem dialog UI elements.
@@ -25,11 +55,9 @@ def _setup_tandem_dialog_translations(dialog: QWidget) -> None:
     Args:
         dialog: Tandem dialog widget
     """
-    from PySide6.QtWidgets import QComboBox, QLabel, QLineEdit, QPushButton
-
     from app.utils import get_current_language
 
-    logger.debug(f"Setting up tandem dialog translations for language: {get_current_language()}")
+    logger.debug("Setting up tandem dialog translations for language: %s", get_current_language())
 
     # Update button text
     save_btn = dialog.findChild(QPushButton, "buttonOk")
@@ -44,7 +72,7 @@ def _setup_tandem_dialog_translations(dialog: QWidget) -> None:
     description_label = dialog.findChild(QLabel, "descriptionLabel")
     if description_label:
         description_label.setText(get_translations("tandem_description"))
-        logger.debug(f"Updated tandem description label with text: {get_translations('tandem_description')[:50]}...")
+        logger.debug("Updated tandem description label with text: %s...", get_translations("tandem_description")[:50])
     else:
         logger.warning("descriptionLabel not found in tandem dialog")
 
@@ -98,22 +126,8 @@ def tandem_open_add_dialog(window: QWidget, storage: Storage) -> None:
     def _open_dialog():
         logger.info("Opening add tandem dialog")
 
-        loader = QUiLoader()
-        file = QFile("app/ui/add_tandem.ui")
-
-        if not file.open(QFile.ReadOnly):
-            error_msg = f"Cannot open add_tandem.ui: {file.errorString()}"
-            logger.error(error_msg)
-            show_error(error_msg, window)
-            return
-
-        add_tandem_dialog = loader.load(file, window)
-        file.close()
-
+        add_tandem_dialog = BaseHandler.load_ui_dialog(_TANDEM_DIALOG_UI, window)
         if not add_tandem_dialog:
-            error_msg = "Failed to load add_tandem.ui - loader returned None"
-            logger.error(error_msg)
-            show_error(error_msg, window)
             return
 
         add_tandem_dialog.setWindowTitle(get_translations("add_tandem"))
@@ -128,7 +142,7 @@ def tandem_open_add_dialog(window: QWidget, storage: Storage) -> None:
         # Show the dialog
         logger.debug("Showing tandem dialog")
         result = add_tandem_dialog.exec()
-        logger.debug(f"Tandem dialog closed with result: {result}")
+        logger.debug("Tandem dialog closed with result: %s", result)
 
         # Proper cleanup to prevent memory leaks
         BaseHandler.cleanup_widget(add_tandem_dialog)
@@ -136,6 +150,37 @@ def tandem_open_add_dialog(window: QWidget, storage: Storage) -> None:
     BaseHandler.safe_execute(_open_dialog, parent=window)
 
 
+def _selected_tandem_name(window: QWidget, no_selection_key: str) -> str | None:
+    """Get the name of the tandem selected in the tandems table.
+
+    Shows an error to the user when no tandem can be determined.
+
+    Args:
+        window: Main application window instance
+        no_selection_key: Translation key of the error shown when no row is selected
+
+    Returns:
+        Selected tandem name, or None if no tandem is selected
+    """
+    table = window.ui.findChild(QTableWidget, "tableTandems")
+    if not table:
+        show_error(get_translations("error_tandems_table_not_found"), window)
+        return None
+
+    selected_row = table.currentRow()
+    if selected_row < 0:
+        show_error(get_translations(no_selection_key), window)
+        return None
+
+    # Get tandem name from first column
+    name_item = table.item(selected_row, 0)
+    if not name_item:
+        show_error(get_translations("error_could_not_get_tandem_name"), window)
+        return None
+
+    return name_item.text()
+
+
 def tandem_edit_selected(window: QWidget, storage: Storage) -> None:
     """Edit the selected tandem.
 
@@ -145,27 +190,14 @@ def tandem_edit_selected(window: QWidget, storage: Storage) -> None:
     """
 
     def _edit_tandem():
-        table = window.ui.findChild(QTableWidget, "tableTandems")
-        if not table:
-            show_error(get_translations("error_tandems_table_not_found"), window)
-            return
-
-        selected_row = table.currentRow()
-        if selected_row < 0:
-            show_error(get_translations("error_please_select_tandem_edit"), window)
-            return
-
-        # Get tandem name from first column
-        name_item = table.item(selected_row, 0)
-        if not name_item:
-            show_error(get_translations("error_could_not_get_tandem_name"), window)
+        tandem_name = _selected_tandem_name(window, "error_please_select_tandem_edit")
+        if tandem_name is None:
             return
 
-        tandem_name = name_item.text()
-        logger.info(f"Opening edit dialog for tandem: {tandem_name}")
+        logger.info("Opening edit dialog for tandem: %s", tandem_name)
 
         # Load tandem data
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year) or storage.get_default_data_structure()
         tandem_data = data.get("tandems", {}).get(tandem_name)
 
@@ -188,24 +220,10 @@ def tandem_delete_selected(window: QWidget, storage: Storage) -> None:
     """
 
     def _delete_tandem():
-        table = window.ui.findChild(QTableWidget, "tableTandems")
-        if not table:
-            show_error(get_translations("error_tandems_table_not_found"), window)
+        tandem_name = _selected_tandem_name(window, "error_please_select_tandem_delete")
+        if tandem_name is None:
             return
 
-        selected_row = table.currentRow()
-        if selected_row < 0:
-            show_error(get_translations("error_please_select_tandem_delete"), window)
-            return
-
-        # Get tandem name from first column
-        name_item = table.item(selected_row, 0)
-        if not name_item:
-            show_error(get_translations("error_could_not_get_tandem_name"), window)
-            return
-
-        tandem_name = name_item.text()
-
         # Confirm deletion
         reply = QMessageBox.question(
             window,
@@ -220,28 +238,26 @@ def tandem_delete_selected(window: QWidget, storage: Storage) -> None:
             return
 
         # Delete tandem
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year) or storage.get_default_data_structure()
 
         if tandem_name in data.get("tandems", {}):
             del data["tandems"][tandem_name]
-            logger.info(f"Deleted tandem: {tandem_name}")
+            logger.info("Deleted tandem: %s", tandem_name)
 
             # Save and refresh
-            success = storage.save(year, data)
+            success = storage.mark_dirty(year, data)
             if success:
-                logger.info(f"Successfully deleted tandem: {tandem_name}")
+                logger.info("Successfully deleted tandem: %s", tandem_name)
 
-                # Refresh all tables
-                refresh_teacher_table(window.ui, data)
-                refresh_children_table(window.ui, data)
-                refresh_tandems_table(window.ui, data)
+                # Only the tandems table shows tandem data
+                window.bus.tandems_changed.emit({tandem_name})
 
                 BaseHandler.show_info(
                     window, "Tandem Deleted", f"Tandem '{tandem_name}' has been deleted successfully."
                 )
             else:
-                logger.error(f"Failed to delete tandem: {tandem_name}")
+                logger.error("Failed to delete tandem: %s", tandem_name)
                 show_error(get_translations("error_failed_delete_tandem").format(name=tandem_name), window)
         else:
             show_error(get_translations("error_tandem_not_found_in_data").format(name=tandem_name), window)
@@ -296,7 +312,7 @@ def _populate_children_dropdowns(dialog: QWidget, window: QWidget, storage: Stor
         return
 
     # Get current children data
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+    year = BaseHandler.get_current_year(window)
     data = storage.load(year) or storage.get_default_data_structure()
     children = data.get("children", {})
 
@@ -313,7 +329,7 @@ def _populate_children_dropdowns(dialog: QWidget, window: QWidget, storage: Stor
         child1_combo.addItem(child_name, child_name)
         child2_combo.addItem(child_name, child_name)
 
-    logger.debug(f"Populated {len(children)} children in tandem dropdowns")
+    logger.debug("Populated %s children in tandem dropdowns", len(children))
 
 
 def tandem_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage) -> None:
@@ -324,8 +340,11 @@ def tandem_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage)
         window: Main window instance
         storage: Storage instance for data persistence
     """
+    # Resolve all dialog fields in one traversal
+    widgets = BaseHandler.index_children(dialog)
+
     # Get tandem name
-    name_field = dialog.findChild(QLineEdit, "tandemNameLineEdit")
+    name_field = widgets.get("tandemNameLineEdit")
     if not name_field:
         show_error(get_translations("error_tandem_name_field_not_found"), dialog)
         return
@@ -336,8 +355,8 @@ def tandem_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage)
         return
 
     # Get child selections
-    child1_combo = dialog.findChild(QComboBox, "child1ComboBox")
-    child2_combo = dialog.findChild(QComboBox, "child2ComboBox")
+    child1_combo = widgets.get("child1ComboBox")
+    child2_combo = widgets.get("child2ComboBox")
 
     if not child1_combo or not child2_combo:
         show_error(get_translations("error_child_selection_dropdowns_not_found"), dialog)
@@ -351,7 +370,7 @@ def tandem_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage)
         return
 
     # Get priority
-    priority_spin = dialog.findChild(QSpinBox, "prioritySpinBox")
+    priority_spin = widgets.get("prioritySpinBox")
     priority = priority_spin.value() if priority_spin else 5
 
     # Validate tandem pair
@@ -365,7 +384,7 @@ def tandem_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage)
         reply = QMessageBox.question(
             dialog,
             "Tandem Warnings",
-            f"The following warnings were found:\n\n{tandem_validation.get_warning_message()}\n\nDo you want to continue?",
+            _WARN_TMPL.format(tandem_validation.get_warning_message()),
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.Yes,
         )
@@ -373,25 +392,26 @@ def tandem_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage)
             return
 
     # Check for availability overlap
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+    year = BaseHandler.get_current_year(window)
     data = storage.load(year) or storage.get_default_data_structure()
     children = data.get("children", {})
 
     child1_data = children.get(child1_name, {})
     child2_data = children.get(child2_name, {})
 
-    # Analyze availability overlap
-    overlap_analysis = _analyze_availability_overlap(
-        child1_data.get("availability", {}), child2_data.get("availability", {}), child1_name, child2_name
-    )
+    # Analyze availability overlap (children without availability are unconstrained)
+    avail1 = child1_data.get("availability")
+    avail2 = child2_data.get("availability")
+    if not avail1 or not avail2:
+        overlap_analysis = _NO_DATA_OVERLAP
+    else:
+        overlap_analysis = _analyze_availability_overlap(avail1, avail2, child1_name, child2_name)
 
     if not overlap_analysis["has_overlap"]:
         reply = QMessageBox.warning(
             dialog,
             "No Availability Overlap",
-            f"Warning: {child1_name} and {child2_name} have no overlapping availability.\n\n"
-            f"This tandem cannot be scheduled together.\n\n"
-            f"Do you want to create the tandem anyway?",
+            _NO_OVERLAP_TMPL.format(child1_name, child2_name),
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No,
         )
@@ -401,28 +421,17 @@ def tandem_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage)
         QMessageBox.information(
             dialog,
             "Limited Availability Overlap",
-            f"Note: {child1_name} and {child2_name} have limited overlapping availability:\n\n"
-            f"{overlap_analysis['overlap_summary']}\n\n"
-            f"The tandem will be created but scheduling options may be limited.",
+            _LIMITED_OVERLAP_TMPL.format(child1_name, child2_name, overlap_analysis["overlap_summary"]),
         )
 
     # Check for existing tandems with these children
-    existing_tandems = []
-    for existing_name, existing_data in data.get("tandems", {}).items():
-        if existing_data.get("child1") in [child1_name, child2_name] or existing_data.get("child2") in [
-            child1_name,
-            child2_name,
-        ]:
-            existing_tandems.append(existing_name)
+    existing_tandems = sorted(storage.get_tandems_for_children(year, child1_name, child2_name))
 
     if existing_tandems:
         reply = QMessageBox.question(
             dialog,
             "Existing Tandems Found",
-            f"The selected children are already in the following tandems:\n\n"
-            f"• {chr(10).join(existing_tandems)}\n\n"
-            f"Creating this tandem will create conflicting pairings.\n\n"
-            f"Do you want to continue?",
+            _EXISTING_TANDEMS_TMPL.format("\n".join(existing_tandems)),
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No,
         )
@@ -432,23 +441,40 @@ def tandem_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage)
     # Save tandem data
     data.setdefault("tandems", {})[tandem_name] = {"child1": child1_name, "child2": child2_name, "priority": priority}
 
-    success = storage.save(year, data)
+    success = storage.mark_dirty(year, data)
     if success:
-        logger.info(f"Successfully saved tandem: {tandem_name}")
+        logger.info("Successfully saved tandem: %s", tandem_name)
         dialog.accept()
 
-        # Refresh all tables
-        refresh_teacher_table(window.ui, data)
-        refresh_children_table(window.ui, data)
-        refresh_tandems_table(window.ui, data)
+        # Only the tandems table shows tandem data
+        window.bus.tandems_changed.emit({tandem_name})
 
-        if hasattr(window, "feedback_manager") and window.feedback_manager:
-            window.feedback_manager.show_success(get_translations("success_tandem_saved").format(name=tandem_name))
+        fm = window.feedback_manager
+        if fm:
+            fm.show_success(get_translations("success_tandem_saved").format(name=tandem_name))
     else:
-        logger.error(f"Failed to save tandem: {tandem_name}")
+        logger.error("Failed to save tandem: %s", tandem_name)
         show_error(get_translations("error_failed_save_tandem_data"), dialog)
 
 
+def _slots_in_minutes(slots: list) -> list[tuple[int, int]]:
+    """Convert "HH:MM" time slots to minutes since midnight.
+
+    Args:
+        slots: List of [start, end] time string pairs
+
+    Returns:
+        List of (start, end) minute pairs; malformed slots are skipped
+    """
+    result = []
+    for start, end in slots:
+        start_minutes = Validator.parse_minutes(start)
+        end_minutes = Validator.parse_minutes(end)
+        if start_minutes is not None and end_minutes is not None:
+            result.append((start_minutes, end_minutes))
+    return result
+
+
 def _analyze_availability_overlap(avail1: dict, avail2: dict, child1: str, child2: str) -> dict:
     """Analyze availability overlap between two children.
 
@@ -461,15 +487,13 @@ def _analyze_availability_overlap(avail1: dict, avail2: dict, child1: str, child
     Returns:
         Dictionary with overlap analysis results
     """
-    from datetime import datetime
-
     overlaps = []
     total_overlap_minutes = 0
 
     # Check each day for overlaps
-    for day in ["Mo", "Di", "Mi", "Do", "Fr"]:
-        day_slots1 = avail1.get(day, [])
-        day_slots2 = avail2.get(day, [])
+    for day in _DAYS:
+        day_slots1 = _slots_in_minutes(avail1.get(day, []))
+        day_slots2 = _slots_in_minutes(avail2.get(day, []))
 
         if not day_slots1 or not day_slots2:
             continue
@@ -477,31 +501,20 @@ def _analyze_availability_overlap(avail1: dict, avail2: dict, child1: str, child
         # Find overlapping time ranges
         for start1, end1 in day_slots1:
             for start2, end2 in day_slots2:
-                try:
-                    start1_dt = datetime.strptime(start1, "%H:%M")
-                    end1_dt = datetime.strptime(end1, "%H:%M")
-                    start2_dt = datetime.strptime(start2, "%H:%M")
-                    end2_dt = datetime.strptime(end2, "%H:%M")
-
-                    # Calculate overlap
-                    overlap_start = max(start1_dt, start2_dt)
-                    overlap_end = min(end1_dt, end2_dt)
-
-                    if overlap_start < overlap_end:
-                        overlap_minutes = (overlap_end - overlap_start).total_seconds() / 60
-                        if overlap_minutes >= 45:  # Minimum slot duration
-                            overlaps.append(
-                                {
-                                    "day": day,
-                                    "start": overlap_start.strftime("%H:%M"),
-                                    "end": overlap_end.strftime("%H:%M"),
-                                    "duration_minutes": overlap_minutes,
-                                }
-                            )
-                            total_overlap_minutes += overlap_minutes
-
-                except ValueError:
-                    continue  # Skip malformed time strings
+                overlap_start = max(start1, start2)
+                overlap_end = min(end1, end2)
+                overlap_minutes = overlap_end - overlap_start
+
+                if overlap_minutes >= 45:  # Minimum slot duration
+                    overlaps.append(
+                        {
+                            "day": day,
+                            "start": f"{overlap_start // 60:02d}:{overlap_start % 60:02d}",
+                            "end": f"{overlap_end // 60:02d}:{overlap_end % 60:02d}",
+                            "duration_minutes": overlap_minutes,
+                        }
+                    )
+                    total_overlap_minutes += overlap_minutes
 
     has_overlap = len(overlaps) > 0
     limited_overlap = has_overlap and total_overlap_minutes < 180  # Less than 3 hours total
@@ -534,24 +547,10 @@ def _open_tandem_edit_dialog(window: QWidget, storage: Storage, tandem_name: str
         tandem_name: Name of tandem to edit
         tandem_data: Existing tandem data
     """
-    logger.info(f"Opening edit dialog for tandem: {tandem_name}")
-
-    loader = QUiLoader()
-    file = QFile("app/ui/add_tandem.ui")
-
-    if not file.open(QFile.ReadOnly):
-        error_msg = f"Cannot open add_tandem.ui: {file.errorString()}"
-        logger.error(error_msg)
-        show_error(error_msg, window)
-        return
-
-    edit_tandem_dialog = loader.load(file, window)
-    file.close()
+    logger.info("Opening edit dialog for tandem: %s", tandem_name)
 
+    edit_tandem_dialog = BaseHandler.load_ui_dialog(_TANDEM_DIALOG_UI, window)
     if not edit_tandem_dialog:
-        error_msg = "Failed to load add_tandem.ui - loader returned None"
-        logger.error(error_msg)
-        show_error(error_msg, window)
         return
 
     edit_tandem_dialog.setWindowTitle(f"{get_translations('edit_tandem')}: {tandem_name}")
@@ -569,7 +568,7 @@ def _open_tandem_edit_dialog(window: QWidget, storage: Storage, tandem_name: str
     # Show the dialog
     logger.debug("Showing tandem edit dialog")
     result = edit_tandem_dialog.exec()
-    logger.debug(f"Tandem edit dialog closed with result: {result}")
+    logger.debug("Tandem edit dialog closed with result: %s", result)
 
     # Proper cleanup to prevent memory leaks
     BaseHandler.cleanup_widget(edit_tandem_dialog)
@@ -587,7 +586,7 @@ def _populate_tandem_edit_dialog(
         window: Main window instance
         storage: Storage instance
     """
-    logger.debug(f"Pre-populating tandem edit dialog for: {tandem_name}")
+    logger.debug("Pre-populating tandem edit dialog for: %s", tandem_name)
 
     # Set tandem name (enable editing with warning)
     name_field = dialog.findChild(QLineEdit, "tandemNameLineEdit")
@@ -598,7 +597,7 @@ def _populate_tandem_edit_dialog(
         name_field.setToolTip("⚠️ Changing the name will update all references to this tandem.")
 
     # Get current children for dropdowns
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+    year = BaseHandler.get_current_year(window)
     current_data = storage.load(year) or storage.get_default_data_structure()
     available_children = list(current_data.get("children", {}).keys())
 
@@ -606,8 +605,8 @@ def _populate_tandem_edit_dialog(
     child1_name = tandem_data.get("child1", "")
     child2_name = tandem_data.get("child2", "")
 
-    logger.debug(f"Available children for tandem edit: {available_children}")
-    logger.debug(f"Tandem children: child1='{child1_name}', child2='{child2_name}'")
+    logger.debug("Available children for tandem edit: %s", available_children)
+    logger.debug("Tandem children: child1='%s', child2='%s'", child1_name, child2_name)
 
     # If no children available, show warning
     if not available_children:
@@ -620,11 +619,11 @@ def _populate_tandem_edit_dialog(
     all_children_for_dropdown = available_children[:]
     if child1_name and child1_name not in all_children_for_dropdown and child1_name != "<No children available>":
         all_children_for_dropdown.append(f"{child1_name} (missing)")
-        logger.warning(f"Child1 '{child1_name}' not found in current children, adding as missing")
+        logger.warning("Child1 '%s' not found in current children, adding as missing", child1_name)
 
     if child2_name and child2_name not in all_children_for_dropdown and child2_name != "<No children available>":
         all_children_for_dropdown.append(f"{child2_name} (missing)")
-        logger.warning(f"Child2 '{child2_name}' not found in current children, adding as missing")
+        logger.warning("Child2 '%s' not found in current children, adding as missing", child2_name)
 
     # Set child 1
     child1_combo = dialog.findChild(QComboBox, "child1ComboBox")
@@ -641,7 +640,9 @@ def _populate_tandem_edit_dialog(
                 child1_combo.setCurrentText(f"{child1_name} (missing)")
 
         logger.debug(
-            f"Child1 combo populated with {len(all_children_for_dropdown)} items, current: '{child1_combo.currentText()}'"
+            "Child1 combo populated with %s items, current: '%s'",
+            len(all_children_for_dropdown),
+            child1_combo.currentText(),
         )
     else:
         logger.error("child1ComboBox not found in tandem edit dialog")
@@ -661,7 +662,9 @@ def _populate_tandem_edit_dialog(
                 child2_combo.setCurrentText(f"{child2_name} (missing)")
 
         logger.debug(
-            f"Child2 combo populated with {len(all_children_for_dropdown)} items, current: '{child2_combo.currentText()}'"
+            "Child2 combo populated with %s items, current: '%s'",
+            len(all_children_for_dropdown),
+            child2_combo.currentText(),
         )
     else:
         logger.error("child2ComboBox not found in tandem edit dialog")
@@ -673,7 +676,10 @@ def _populate_tandem_edit_dialog(
         priority_spin.setValue(priority)
 
     logger.debug(
-        f"Pre-populated tandem edit dialog: {child1_name} + {child2_name}, priority {tandem_data.get('priority', 5)}"
+        "Pre-populated tandem edit dialog: %s + %s, priority %s",
+        child1_name,
+        child2_name,
+        tandem_data.get("priority", 5),
     )
 
 
@@ -727,7 +733,7 @@ def tandem_update_from_edit_dialog(
         storage: Storage instance for data persistence
         original_tandem_name: Original name of the tandem being edited
     """
-    logger.debug(f"Updating tandem data for: {original_tandem_name}")
+    logger.debug("Updating tandem data for: %s", original_tandem_name)
 
     # Get the (possibly changed) tandem name
     name_field = dialog.findChild(QLineEdit, "tandemNameLineEdit")
@@ -743,19 +749,18 @@ def tandem_update_from_edit_dialog(
         return
 
     # Get current year and data
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+    year = BaseHandler.get_current_year(window)
     data = storage.load(year) or storage.get_default_data_structure()
+    tandems = data.setdefault("tandems", {})
 
     # Check for name conflicts (if name changed)
     name_changed = new_tandem_name != original_tandem_name
     if name_changed:
-        if new_tandem_name in data.get("tandems", {}):
+        if new_tandem_name in tandems:
             show_error(get_translations("error_tandem_already_exists").format(name=new_tandem_name), dialog)
             return
 
         # Confirm name change with user
-        from PySide6.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             dialog,
             "Confirm Name Change",
@@ -796,6 +801,13 @@ def tandem_update_from_edit_dialog(
     if child2_name.endswith(" (missing)"):
         child2_name = child2_name.replace(" (missing)", "")
 
+    # Nothing to save if the dialog was confirmed without changes
+    updated_tandem = {"child1": child1_name, "child2": child2_name, "priority": priority}
+    if not name_changed and tandems.get(original_tandem_name) == updated_tandem:
+        logger.debug("No changes for tandem: %s", original_tandem_name)
+        dialog.accept()
+        return
+
     # Validate tandem pair
     tandem_validation = Validator.validate_tandem_pair(child1_name, child2_name, priority)
     if not tandem_validation.is_valid:
@@ -810,7 +822,7 @@ def tandem_update_from_edit_dialog(
         reply = QMessageBox.question(
             dialog,
             "Tandem Warnings",
-            f"The following warnings were found:\n\n{tandem_validation.get_warning_message()}\n\nDo you want to continue?",
+            _WARN_TMPL.format(tandem_validation.get_warning_message()),
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.Yes,
         )
@@ -818,38 +830,28 @@ def tandem_update_from_edit_dialog(
             return
 
     # Handle name change (remove old entry if renamed)
-    if name_changed and original_tandem_name in data.get("tandems", {}):
-        del data["tandems"][original_tandem_name]
-        logger.info(f"Tandem rename: {original_tandem_name} -> {new_tandem_name}")
+    if name_changed and tandems.pop(original_tandem_name, None) is not None:
+        logger.info("Tandem rename: %s -> %s", original_tandem_name, new_tandem_name)
 
     # Update tandem data
-    data.setdefault("tandems", {})[new_tandem_name] = {
-        "child1": child1_name,
-        "child2": child2_name,
-        "priority": priority,
-    }
+    tandems[new_tandem_name] = updated_tandem
 
     # Save updated data
-    success = storage.save(year, data)
+    success = storage.mark_dirty(year, data)
     if success:
         action = "renamed and updated" if name_changed else "updated"
-        logger.info(f"Successfully {action} tandem: {original_tandem_name} -> {new_tandem_name}")
+        logger.info("Successfully %s tandem: %s -> %s", action, original_tandem_name, new_tandem_name)
         dialog.accept()
 
-        # Refresh all tables
-        refresh_teacher_table(window.ui, data)
-        refresh_children_table(window.ui, data)
-        refresh_tandems_table(window.ui, data)
+        # Only the tandems table shows tandem data
+        window.bus.tandems_changed.emit({original_tandem_name, new_tandem_name})
 
-        if hasattr(window, "feedback_manager") and window.feedback_manager:
+        fm = window.feedback_manager
+        if fm:
             if name_changed:
-                window.feedback_manager.show_success(
-                    f"Tandem renamed from '{original_tandem_name}' to '{new_tandem_name}' successfully"
-                )
+                fm.show_success(f"Tandem renamed from '{original_tandem_name}' to '{new_tandem_name}' successfully")
             else:
-                window.feedback_manager.show_success(
-                    get_translations("success_tandem_updated").format(name=new_tandem_name)
-                )
+                fm.show_success(get_translations("success_tandem_updated").format(name=new_tandem_name))
     else:
-        logger.error(f"Failed to update tandem: {new_tandem_name}")
+        logger.error("Failed to update tandem: %s", new_tandem_name)
         show_error(get_translations("error_failed_update_tandem_data"), dialog)
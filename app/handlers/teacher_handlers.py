@@ -4,13 +4,29 @@ This module contains all handlers for teacher-related functionality
 including adding, editing, and deleting teachers.
 """
 
-from PySide6.QtCore import QFile
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtWidgets import QComboBox, QLineEdit, QMessageBox, QPushButton, QTableWidget, QWidget
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QLineEdit,
+    QMessageBox,
+    QTableWidget,
+    QWidget,
+)
 
 from app.config.logging_config import get_logger
 from app.storage import Storage
-from app.ui_teachers import refresh_children_table, refresh_tandems_table, refresh_teacher_table
+from app.ui_teachers import (
+    DAY_OPTIONS,
+    DEFAULT_END_TIME,
+    DEFAULT_START_TIME,
+    TIME_OPTIONS,
+    ChoiceDelegate,
+    append_availability_row,
+    batched_updates,
+    fill_availability_table,
+    read_availability_rows,
+    refresh_children_table,
+    refresh_teacher_table,
+)
 from app.utils import get_translations, show_error
 from app.validation import Validator
 
@@ -18,16 +34,34 @@ from .base_handler import BaseHandler
 
 logger = get_logger(__name__)
 
+_TEACHER_DIALOG_UI = "app/ui/add_teacher.ui"
+
+# Object names of the buttons required by the teacher dialogs
+_TEACHER_DIALOG_BUTTONS = ("buttonAddSlot", "buttonRemoveSlot", "buttonOk", "buttonCancel")
+
+# Translation keys for the texts of the teacher dialog buttons and labels
+_TEACHER_DIALOG_TEXTS = {
+    "buttonAddSlot": "add_slot",
+    "buttonRemoveSlot": "remove_slot",
+    "buttonOk": "save_teacher",
+    "buttonCancel": "cancel",
+    "teacherNameLabel": "name",
+}
+
 
 def _setup_availability_table_headers(dialog: QWidget) -> None:
-    """Set up translated headers for the availability table in dialog.
+    """Set up translated headers and combo box editors for the availability table in dialog.
 
     Args:
         dialog: Dialog containing the availability table
     """
-    table = dialog.findChild(QTableWidget, "tableAvailability")
+    table = BaseHandler.get_availability_table(dialog)
     if table:
         table.setHorizontalHeaderLabels([get_translations("day"), get_translations("start"), get_translations("end")])
+        table.setItemDelegateForColumn(0, ChoiceDelegate(DAY_OPTIONS, table))
+        table.setItemDelegateForColumn(1, ChoiceDelegate(TIME_OPTIONS, table))
+        table.setItemDelegateForColumn(2, ChoiceDelegate(TIME_OPTIONS, table))
+        table.setEditTriggers(QAbstractItemView.AllEditTriggers)
 
 
 def _setup_teacher_dialog_translations(dialog: QWidget) -> None:
@@ -36,29 +70,12 @@ def _setup_teacher_dialog_translations(dialog: QWidget) -> None:
     Args:
         dialog: Teacher dialog widget
     """
-    from PySide6.QtWidgets import QLabel, QPushButton
-
-    # Update button text
-    add_slot_btn = dialog.findChild(QPushButton, "buttonAddSlot")
-    if add_slot_btn:
-        add_slot_btn.setText(get_translations("add_slot"))
-
-    remove_slot_btn = dialog.findChild(QPushButton, "buttonRemoveSlot")
-    if remove_slot_btn:
-        remove_slot_btn.setText(get_translations("remove_slot"))
-
-    save_btn = dialog.findChild(QPushButton, "buttonOk")
-    if save_btn:
-        save_btn.setText(get_translations("save_teacher"))
+    widgets = BaseHandler.index_children(dialog)
 
-    cancel_btn = dialog.findChild(QPushButton, "buttonCancel")
-    if cancel_btn:
-        cancel_btn.setText(get_translations("cancel"))
-
-    # Update labels
-    name_label = dialog.findChild(QLabel, "teacherNameLabel")
-    if name_label:
-        name_label.setText(get_translations("name"))
+    for object_name, translation_key in _TEACHER_DIALOG_TEXTS.items():
+        widget = widgets.get(object_name)
+        if widget:
+            widget.setText(get_translations(translation_key))
 
 
 def teacher_open_add_teacher_dialog(window: QWidget, storage: Storage) -> None:
@@ -72,22 +89,8 @@ def teacher_open_add_teacher_dialog(window: QWidget, storage: Storage) -> None:
     def _open_dialog():
         logger.info("Opening add teacher dialog")
 
-        loader = QUiLoader()
-        file = QFile("app/ui/add_teacher.ui")
-
-        if not file.open(QFile.ReadOnly):
-            error_msg = f"Cannot open add_teacher.ui: {file.errorString()}"
-            logger.error(error_msg)
-            show_error(error_msg, window)
-            return
-
-        add_teacher_dialog = loader.load(file, window)
-        file.close()
-
+        add_teacher_dialog = BaseHandler.load_ui_dialog(_TEACHER_DIALOG_UI, window)
         if not add_teacher_dialog:
-            error_msg = "Failed to load add_teacher.ui - loader returned None"
-            logger.error(error_msg)
-            show_error(error_msg, window)
             return
 
         add_teacher_dialog.setWindowTitle(get_translations("add_teacher"))
@@ -105,7 +108,7 @@ def teacher_open_add_teacher_dialog(window: QWidget, storage: Storage) -> None:
         # Show the dialog
         logger.debug("Showing teacher dialog")
         result = add_teacher_dialog.exec()
-        logger.debug(f"Teacher dialog closed with result: {result}")
+        logger.debug("Teacher dialog closed with result: %s", result)
 
         # Proper cleanup to prevent memory leaks
         BaseHandler.cleanup_widget(add_teacher_dialog)
@@ -113,6 +116,29 @@ def teacher_open_add_teacher_dialog(window: QWidget, storage: Storage) -> None:
     BaseHandler.safe_execute(_open_dialog, parent=window)
 
 
+def _get_teacher_dialog_fields(widgets: dict[str, QWidget], window: QWidget) -> tuple[QLineEdit, QTableWidget] | None:
+    """Get the name field and availability table of a teacher dialog.
+
+    Args:
+        widgets: Named dialog children as returned by BaseHandler.index_children
+        window: Window used as parent for error messages
+
+    Returns:
+        Tuple of (name field, availability table), or None if one is missing
+    """
+    name_field = widgets.get("teacherNameLineEdit")
+    if not name_field:
+        show_error(get_translations("error_teacher_name_field_not_found"), window)
+        return None
+
+    table = widgets.get("tableAvailability")
+    if not table:
+        show_error(get_translations("error_availability_table_not_found"), window)
+        return None
+
+    return name_field, table
+
+
 def _setup_teacher_dialog_buttons(dialog: QWidget, window: QWidget, storage: Storage) -> None:
     """Setup button connections for the teacher dialog.
 
@@ -121,21 +147,9 @@ def _setup_teacher_dialog_buttons(dialog: QWidget, window: QWidget, storage: Sto
         window: Main application window instance
         storage: Storage instance for data persistence
     """
-    # Find buttons with error checking
-    button_add_slot = dialog.findChild(QPushButton, "buttonAddSlot")
-    button_remove_slot = dialog.findChild(QPushButton, "buttonRemoveSlot")
-    button_save = dialog.findChild(QPushButton, "buttonOk")
-    button_cancel = dialog.findChild(QPushButton, "buttonCancel")
-
-    missing_buttons = []
-    if not button_add_slot:
-        missing_buttons.append("buttonAddSlot")
-    if not button_remove_slot:
-        missing_buttons.append("buttonRemoveSlot")
-    if not button_save:
-        missing_buttons.append("buttonOk")
-    if not button_cancel:
-        missing_buttons.append("buttonCancel")
+    # Find buttons with error checking, resolving all of them in one traversal
+    widgets = BaseHandler.index_children(dialog)
+    missing_buttons = [name for name in _TEACHER_DIALOG_BUTTONS if name not in widgets]
 
     if missing_buttons:
         error_msg = f"Missing buttons in add_teacher.ui: {', '.join(missing_buttons)}"
@@ -143,6 +157,17 @@ def _setup_teacher_dialog_buttons(dialog: QWidget, window: QWidget, storage: Sto
         show_error(error_msg, window)
         return
 
+    button_add_slot = widgets["buttonAddSlot"]
+    button_remove_slot = widgets["buttonRemoveSlot"]
+    button_save = widgets["buttonOk"]
+    button_cancel = widgets["buttonCancel"]
+
+    # Capture the fields read on save so each click skips the widget lookup
+    fields = _get_teacher_dialog_fields(widgets, window)
+    if not fields:
+        return
+    name_field, table = fields
+
     # Connect buttons with safe error handling
     button_add_slot.clicked.connect(
         lambda: BaseHandler.safe_execute(teacher_dialog_add_availability_row, dialog, parent=dialog)
@@ -152,62 +177,37 @@ def _setup_teacher_dialog_buttons(dialog: QWidget, window: QWidget, storage: Sto
     )
     button_cancel.clicked.connect(dialog.reject)
     button_save.clicked.connect(
-        lambda: BaseHandler.safe_execute(teacher_save_from_dialog, dialog, window, storage, parent=dialog)
+        lambda: BaseHandler.safe_execute(
+            teacher_save_from_dialog, dialog, window, storage, name_field, table, parent=dialog
+        )
     )
 
     logger.debug("Teacher dialog buttons connected")
 
 
-def teacher_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage) -> None:
+def teacher_save_from_dialog(
+    dialog: QWidget, window: QWidget, storage: Storage, name_field: QLineEdit, table: QTableWidget
+) -> None:
     """Save teacher data from the add teacher dialog.
 
     Args:
         dialog: Add teacher dialog instance
         window: Main application window instance
         storage: Storage instance for data persistence
+        name_field: Teacher name field of the dialog
+        table: Availability table of the dialog
     """
-    name_field = dialog.findChild(QLineEdit, "teacherNameLineEdit")
-    if not name_field:
-        show_error(get_translations("error_teacher_name_field_not_found"), dialog)
-        return
-
     name = name_field.text().replace(" ", "_").strip()
     if not name:
         show_error(get_translations("invalid_teacher_name"), dialog)
         return
 
-    table = dialog.findChild(QTableWidget, "tableAvailability")
-    if not table:
-        show_error(get_translations("error_availability_table_not_found"), dialog)
+    if table.rowCount() == 0:
+        show_error(get_translations("error_please_add_availability_slot"), dialog)
         return
 
-    availability = {}
-
-    for row in range(table.rowCount()):
-        day_widget = table.cellWidget(row, 0)
-        start_widget = table.cellWidget(row, 1)
-        end_widget = table.cellWidget(row, 2)
-
-        if any(w is None for w in [day_widget, start_widget, end_widget]):
-            continue  # skip incomplete rows
-
-        day = day_widget.currentText()
-        start = start_widget.currentText()
-        end = end_widget.currentText()
-
-        # Validate time slot
-        slot_validation = Validator.validate_time_slot(start, end)
-        if not slot_validation.is_valid:
-            show_error(
-                get_translations("invalid_time_slot_text").format(day=day, error=slot_validation.get_error_message()),
-                dialog,
-            )
-            return
-
-        availability.setdefault(day, []).append([start, end])
-
-    # Validate complete availability
-    availability_validation = Validator.validate_teacher_availability(availability)
+    # Validate the slots and the complete availability together
+    availability_validation, availability = Validator.validate_availability_rows(read_availability_rows(table))
     if not availability_validation.is_valid:
         show_error(
             get_translations("teacher_availability_validation_failed").format(
@@ -219,8 +219,6 @@ def teacher_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage)
 
     # Show warnings for availability if any
     if availability_validation.has_warnings:
-        from PySide6.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             dialog,
             "Availability Warnings",
@@ -232,19 +230,17 @@ def teacher_save_from_dialog(dialog: QWidget, window: QWidget, storage: Storage)
             return
 
     # Save teacher data
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+    year = BaseHandler.get_current_year(window)
     data = storage.load(year) or storage.get_default_data_structure()
     data.setdefault("teachers", {})[name] = {"availability": availability}
 
-    success = storage.save(year, data)
+    success = storage.mark_dirty(year, data)
     if success:
         logger.info(f"Successfully saved teacher: {name}")
         dialog.accept()
 
-        # Refresh all tables
-        refresh_teacher_table(window.ui, data)
-        refresh_children_table(window.ui, data)
-        refresh_tandems_table(window.ui, data)
+        # A new teacher only appears in the teachers table
+        refresh_teacher_table(window.ui, data, changed_keys={name})
     else:
         logger.error(f"Failed to save teacher: {name}")
         show_error(get_translations("error_failed_save_teacher_data"), dialog)
@@ -258,53 +254,7 @@ def teacher_dialog_add_availability_row(dialog: QWidget) -> None:
     """
     logger.debug("Adding availability row to teacher dialog")
 
-    table = dialog.findChild(QTableWidget, "tableAvailability")
-    if not table:
-        logger.error("tableAvailability not found in dialog")
-        return
-
-    row = table.rowCount()
-    table.insertRow(row)
-    logger.debug(f"Inserted row {row}")
-
-    # Setup day dropdown
-    combo_day = QComboBox()
-    combo_day.addItems(["Mo", "Di", "Mi", "Do", "Fr"])
-    combo_day.setCurrentIndex(0)
-    combo_day.setEditable(False)
-    table.setCellWidget(row, 0, combo_day)
-
-    # Generate time options (7:00 - 20:45 with 15min intervals)
-    times = []
-    for h in range(7, 21):
-        for m in (0, 15, 30, 45):
-            times.append(f"{h:02}:{m:02}")
-
-    logger.debug(f"Generated {len(times)} time options")
-
-    # Setup start time dropdown
-    combo_start = QComboBox()
-    combo_start.setEditable(False)
-    combo_start.addItems(times)
-    default_start_index = times.index("08:00") if "08:00" in times else 0
-    combo_start.setCurrentIndex(default_start_index)
-
-    # Add delayed event handling to prevent crashes
-    combo_start.currentTextChanged.connect(lambda text: logger.debug(f"Start time changed to: {text}"))
-    table.setCellWidget(row, 1, combo_start)
-
-    # Setup end time dropdown
-    combo_end = QComboBox()
-    combo_end.setEditable(False)
-    combo_end.addItems(times)
-    default_end_index = times.index("17:00") if "17:00" in times else len(times) - 1
-    combo_end.setCurrentIndex(default_end_index)
-
-    # Add delayed event handling to prevent crashes
-    combo_end.currentTextChanged.connect(lambda text: logger.debug(f"End time changed to: {text}"))
-    table.setCellWidget(row, 2, combo_end)
-
-    logger.debug("Availability row added successfully")
+    _add_teacher_availability_row_with_data(dialog, DAY_OPTIONS[0], DEFAULT_START_TIME, DEFAULT_END_TIME)
 
 
 def teacher_dialog_remove_selected_row(dialog: QWidget) -> None:
@@ -315,7 +265,7 @@ def teacher_dialog_remove_selected_row(dialog: QWidget) -> None:
     """
     logger.debug("Removing selected availability row")
 
-    table = dialog.findChild(QTableWidget, "tableAvailability")
+    table = BaseHandler.get_availability_table(dialog)
     if not table:
         logger.error("tableAvailability not found in dialog")
         return
@@ -323,7 +273,7 @@ def teacher_dialog_remove_selected_row(dialog: QWidget) -> None:
     selected = table.currentRow()
     if selected >= 0:
         table.removeRow(selected)
-        logger.debug(f"Removed row {selected}")
+        logger.debug("Removed row %d", selected)
     else:
         logger.debug("No row selected to remove")
         show_error(get_translations("error_please_select_row_remove"), dialog)
@@ -358,7 +308,7 @@ def teacher_edit_selected(window: QWidget, storage: Storage) -> None:
         logger.info(f"Opening edit dialog for teacher: {teacher_name}")
 
         # Load teacher data
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year) or storage.get_default_data_structure()
         teacher_data = data.get("teachers", {}).get(teacher_name)
 
@@ -367,7 +317,7 @@ def teacher_edit_selected(window: QWidget, storage: Storage) -> None:
             return
 
         # Open edit dialog with pre-populated data
-        _open_teacher_edit_dialog(window, storage, teacher_name, teacher_data)
+        _open_teacher_edit_dialog(window, storage, teacher_name, teacher_data, data)
 
     BaseHandler.safe_execute(_edit_teacher, parent=window)
 
@@ -400,28 +350,25 @@ def teacher_delete_selected(window: QWidget, storage: Storage) -> None:
         teacher_name = name_item.text()
 
         # Analyze dependencies
-        year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
+        year = BaseHandler.get_current_year(window)
         data = storage.load(year) or storage.get_default_data_structure()
 
-        # Find children who prefer this teacher
-        affected_children = []
-        for child_name, child_data in data.get("children", {}).items():
-            preferred_teachers = child_data.get("preferred_teachers", [])
-            if teacher_name in preferred_teachers:
-                affected_children.append(child_name)
+        # Find children who prefer this teacher, skipping any the loaded data no longer has
+        children = data.get("children", {})
+        affected_children = sorted(
+            child_name
+            for child_name in storage.get_children_preferring(year, teacher_name)
+            if teacher_name in children.get(child_name, {}).get("preferred_teachers", [])
+        )
 
         # Build confirmation message
-        message_parts = [f"Are you sure you want to delete teacher '{teacher_name}'?"]
-
+        message_parts = [f"Are you sure you want to delete teacher '{teacher_name}'?", ""]
         if affected_children:
-            message_parts.append(
-                f"\n\nThis teacher is preferred by {len(affected_children)} children:"
-                f"\n• {chr(10).join(affected_children)}"
-                f"\n\nThese preferences will be removed."
-            )
-
-        if not affected_children:
-            message_parts.append("\n\nThis teacher has no current preferences.")
+            message_parts.append(f"This teacher is preferred by {len(affected_children)} children:")
+            message_parts.extend(f"• {child_name}" for child_name in affected_children)
+            message_parts += ["", "These preferences will be removed."]
+        else:
+            message_parts.append("This teacher has no current preferences.")
 
         # Show detailed confirmation
         reply = QMessageBox.question(
@@ -442,27 +389,25 @@ def teacher_delete_selected(window: QWidget, storage: Storage) -> None:
 
         # Remove from children's preferences
         for child_name in affected_children:
-            child_data = data["children"][child_name]
-            preferred_teachers = child_data.get("preferred_teachers", [])
-            if teacher_name in preferred_teachers:
-                preferred_teachers.remove(teacher_name)
-                child_data["preferred_teachers"] = preferred_teachers
-                changes_made.append(f"Removed preference from child '{child_name}'")
+            children[child_name]["preferred_teachers"].remove(teacher_name)
+            changes_made.append(f"Removed preference from child '{child_name}'")
 
         # Save and refresh
-        success = storage.save(year, data)
+        success = storage.mark_dirty(year, data)
         if success:
             logger.info(f"Successfully deleted teacher {teacher_name} with {len(changes_made)} changes")
 
-            # Refresh all tables
-            refresh_teacher_table(window.ui, data)
-            refresh_children_table(window.ui, data)
-            refresh_tandems_table(window.ui, data)
+            # Children lose their preference for the deleted teacher; tandems are unaffected
+            with batched_updates(window.ui):
+                refresh_teacher_table(window.ui, data, changed_keys={teacher_name})
+                refresh_children_table(window.ui, data, changed_keys=set(affected_children))
 
             # Show detailed success message
-            success_message = f"Teacher '{teacher_name}' has been deleted successfully."
+            message_parts = [f"Teacher '{teacher_name}' has been deleted successfully."]
             if len(changes_made) > 1:
-                success_message += f"\n\nChanges made:\n• {chr(10).join(changes_made)}"
+                message_parts += ["", "Changes made:"]
+                message_parts.extend(f"• {change}" for change in changes_made)
+            success_message = "\n".join(message_parts)
 
             BaseHandler.show_info(window, "Teacher Deleted", success_message)
 
@@ -477,7 +422,9 @@ def teacher_delete_selected(window: QWidget, storage: Storage) -> None:
     BaseHandler.safe_execute(_delete_teacher, parent=window)
 
 
-def _open_teacher_edit_dialog(window: QWidget, storage: Storage, teacher_name: str, teacher_data: dict) -> None:
+def _open_teacher_edit_dialog(
+    window: QWidget, storage: Storage, teacher_name: str, teacher_data: dict, data: dict | None = None
+) -> None:
     """Open the teacher edit dialog with pre-populated data.
 
     Args:
@@ -485,25 +432,13 @@ def _open_teacher_edit_dialog(window: QWidget, storage: Storage, teacher_name: s
         storage: Storage instance
         teacher_name: Name of teacher to edit
         teacher_data: Existing teacher data
+        data: Data of the current year the teacher was read from; loaded from
+            storage on save if not given
     """
     logger.info(f"Opening edit dialog for teacher: {teacher_name}")
 
-    loader = QUiLoader()
-    file = QFile("app/ui/add_teacher.ui")
-
-    if not file.open(QFile.ReadOnly):
-        error_msg = f"Cannot open add_teacher.ui: {file.errorString()}"
-        logger.error(error_msg)
-        show_error(error_msg, window)
-        return
-
-    edit_teacher_dialog = loader.load(file, window)
-    file.close()
-
+    edit_teacher_dialog = BaseHandler.load_ui_dialog(_TEACHER_DIALOG_UI, window)
     if not edit_teacher_dialog:
-        error_msg = "Failed to load add_teacher.ui - loader returned None"
-        logger.error(error_msg)
-        show_error(error_msg, window)
         return
 
     edit_teacher_dialog.setWindowTitle(f"{get_translations('edit_teacher')}: {teacher_name}")
@@ -519,12 +454,12 @@ def _open_teacher_edit_dialog(window: QWidget, storage: Storage, teacher_name: s
     _populate_teacher_edit_dialog(edit_teacher_dialog, teacher_name, teacher_data)
 
     # Setup dialog functionality for editing
-    _setup_teacher_edit_dialog_buttons(edit_teacher_dialog, window, storage, teacher_name)
+    _setup_teacher_edit_dialog_buttons(edit_teacher_dialog, window, storage, teacher_name, data)
 
     # Show the dialog
     logger.debug("Showing teacher edit dialog")
     result = edit_teacher_dialog.exec()
-    logger.debug(f"Teacher edit dialog closed with result: {result}")
+    logger.debug("Teacher edit dialog closed with result: %s", result)
 
     # Proper cleanup to prevent memory leaks
     BaseHandler.cleanup_widget(edit_teacher_dialog)
@@ -538,7 +473,7 @@ def _populate_teacher_edit_dialog(dialog: QWidget, teacher_name: str, teacher_da
         teacher_name: Name of the teacher being edited
         teacher_data: Existing teacher data
     """
-    logger.debug(f"Pre-populating teacher edit dialog for: {teacher_name}")
+    logger.debug("Pre-populating teacher edit dialog for: %s", teacher_name)
 
     # Set teacher name (enable editing with warning)
     name_field = dialog.findChild(QLineEdit, "teacherNameLineEdit")
@@ -551,23 +486,15 @@ def _populate_teacher_edit_dialog(dialog: QWidget, teacher_name: str, teacher_da
         )
 
     # Populate availability table
-    availability_table = dialog.findChild(QTableWidget, "tableAvailability")
+    availability_table = BaseHandler.get_availability_table(dialog)
     if availability_table:
-        # Clear existing rows
-        availability_table.setRowCount(0)
-
-        # Add rows for existing availability
-        availability = teacher_data.get("availability", {})
-        for day, slots in availability.items():
-            for slot in slots:
-                if len(slot) == 2:
-                    _add_teacher_availability_row_with_data(dialog, day, slot[0], slot[1])
-
-        logger.debug(f"Pre-populated {sum(len(slots) for slots in availability.values())} availability slots")
+        # Replace any existing rows with the existing availability
+        slot_count = fill_availability_table(availability_table, teacher_data.get("availability", {}))
+        logger.debug("Pre-populated %d availability slots", slot_count)
 
 
 def _setup_teacher_edit_dialog_buttons(
-    dialog: QWidget, window: QWidget, storage: Storage, original_teacher_name: str
+    dialog: QWidget, window: QWidget, storage: Storage, original_teacher_name: str, data: dict | None = None
 ) -> None:
     """Setup button connections for the teacher edit dialog.
 
@@ -576,22 +503,11 @@ def _setup_teacher_edit_dialog_buttons(
         window: Main application window instance
         storage: Storage instance for data persistence
         original_teacher_name: The original name of the teacher being edited
+        data: Data of the current year, updated in place on save
     """
-    # Find buttons with error checking
-    button_add_slot = dialog.findChild(QPushButton, "buttonAddSlot")
-    button_remove_slot = dialog.findChild(QPushButton, "buttonRemoveSlot")
-    button_save = dialog.findChild(QPushButton, "buttonOk")
-    button_cancel = dialog.findChild(QPushButton, "buttonCancel")
-
-    missing_buttons = []
-    if not button_add_slot:
-        missing_buttons.append("buttonAddSlot")
-    if not button_remove_slot:
-        missing_buttons.append("buttonRemoveSlot")
-    if not button_save:
-        missing_buttons.append("buttonOk")
-    if not button_cancel:
-        missing_buttons.append("buttonCancel")
+    # Find buttons with error checking, resolving all of them in one traversal
+    widgets = BaseHandler.index_children(dialog)
+    missing_buttons = [name for name in _TEACHER_DIALOG_BUTTONS if name not in widgets]
 
     if missing_buttons:
         error_msg = f"Missing buttons in teacher edit dialog: {', '.join(missing_buttons)}"
@@ -599,6 +515,17 @@ def _setup_teacher_edit_dialog_buttons(
         show_error(error_msg, window)
         return
 
+    button_add_slot = widgets["buttonAddSlot"]
+    button_remove_slot = widgets["buttonRemoveSlot"]
+    button_save = widgets["buttonOk"]
+    button_cancel = widgets["buttonCancel"]
+
+    # Capture the fields read on save so each click skips the widget lookup
+    fields = _get_teacher_dialog_fields(widgets, window)
+    if not fields:
+        return
+    name_field, table = fields
+
     # Connect buttons with safe error handling
     button_add_slot.clicked.connect(
         lambda: BaseHandler.safe_execute(teacher_dialog_add_availability_row, dialog, parent=dialog)
@@ -609,7 +536,15 @@ def _setup_teacher_edit_dialog_buttons(
     button_cancel.clicked.connect(dialog.reject)
     button_save.clicked.connect(
         lambda: BaseHandler.safe_execute(
-            teacher_update_from_edit_dialog, dialog, window, storage, original_teacher_name, parent=dialog
+            teacher_update_from_edit_dialog,
+            dialog,
+            window,
+            storage,
+            original_teacher_name,
+            name_field,
+            table,
+            data,
+            parent=dialog,
         )
     )
 
@@ -617,7 +552,13 @@ def _setup_teacher_edit_dialog_buttons(
 
 
 def teacher_update_from_edit_dialog(
-    dialog: QWidget, window: QWidget, storage: Storage, original_teacher_name: str
+    dialog: QWidget,
+    window: QWidget,
+    storage: Storage,
+    original_teacher_name: str,
+    name_field: QLineEdit,
+    table: QTableWidget,
+    data: dict | None = None,
 ) -> None:
     """Update teacher data from the edit dialog.
 
@@ -626,15 +567,14 @@ def teacher_update_from_edit_dialog(
         window: Main window instance
         storage: Storage instance for data persistence
         original_teacher_name: Original name of the teacher being edited
+        name_field: Teacher name field of the dialog
+        table: Availability table of the dialog
+        data: Data of the current year loaded when the dialog was opened; loaded
+            from storage if not given
     """
-    logger.debug(f"Updating teacher data for: {original_teacher_name}")
+    logger.debug("Updating teacher data for: %s", original_teacher_name)
 
     # Get the (possibly changed) teacher name
-    name_field = dialog.findChild(QLineEdit, "teacherNameLineEdit")
-    if not name_field:
-        show_error(get_translations("error_teacher_name_field_not_found"), dialog)
-        return
-
     new_teacher_name = name_field.text().replace(" ", "_").strip()
 
     # Validate the name
@@ -643,9 +583,14 @@ def teacher_update_from_edit_dialog(
         show_error(name_validation.get_error_message(), dialog)
         return
 
+    if table.rowCount() == 0:
+        show_error(get_translations("error_please_add_availability_slot"), dialog)
+        return
+
     # Get current year and data
-    year = window.ui.findChild(QComboBox, "comboYearSelect").currentText()
-    data = storage.load(year) or storage.get_default_data_structure()
+    year = BaseHandler.get_current_year(window)
+    if data is None:
+        data = storage.load(year) or storage.get_default_data_structure()
 
     # Check for name conflicts (if name changed)
     name_changed = new_teacher_name != original_teacher_name
@@ -655,8 +600,6 @@ def teacher_update_from_edit_dialog(
             return
 
         # Confirm name change with user
-        from PySide6.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             dialog,
             "Confirm Name Change",
@@ -670,39 +613,15 @@ def teacher_update_from_edit_dialog(
 
     teacher_name = new_teacher_name
 
-    # Get availability from table
-    table = dialog.findChild(QTableWidget, "tableAvailability")
-    if not table:
-        show_error(get_translations("error_availability_table_not_found"), dialog)
-        return
-
-    availability = {}
-
-    for row in range(table.rowCount()):
-        day_widget = table.cellWidget(row, 0)
-        start_widget = table.cellWidget(row, 1)
-        end_widget = table.cellWidget(row, 2)
+    # Validate the slots and the complete availability together
+    availability_validation, availability = Validator.validate_availability_rows(read_availability_rows(table))
 
-        if any(w is None for w in [day_widget, start_widget, end_widget]):
-            continue  # skip incomplete rows
-
-        day = day_widget.currentText()
-        start = start_widget.currentText()
-        end = end_widget.currentText()
-
-        # Validate time slot
-        slot_validation = Validator.validate_time_slot(start, end)
-        if not slot_validation.is_valid:
-            show_error(
-                get_translations("invalid_time_slot_text").format(day=day, error=slot_validation.get_error_message()),
-                dialog,
-            )
-            return
-
-        availability.setdefault(day, []).append([start, end])
+    # Confirming the dialog without changes needs no save or table refresh
+    if not name_changed and data.get("teachers", {}).get(teacher_name, {}).get("availability") == availability:
+        logger.debug("Teacher %s unchanged, nothing to save", teacher_name)
+        dialog.accept()
+        return
 
-    # Validate complete availability
-    availability_validation = Validator.validate_teacher_availability(availability)
     if not availability_validation.is_valid:
         show_error(
             get_translations("teacher_availability_validation_failed").format(
@@ -714,8 +633,6 @@ def teacher_update_from_edit_dialog(
 
     # Show warnings for availability if any
     if availability_validation.has_warnings:
-        from PySide6.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             dialog,
             "Availability Warnings",
@@ -727,49 +644,53 @@ def teacher_update_from_edit_dialog(
             return
 
     # Handle name change and update all references
+    renamed_children: set[str] = set()
     if name_changed:
-        changes_made = []
-
         # Remove old teacher entry
-        if original_teacher_name in data.get("teachers", {}):
-            del data["teachers"][original_teacher_name]
-            changes_made.append(f"Removed old teacher entry: {original_teacher_name}")
-
-        # Update children's preferred teacher references
-        children_updated = 0
-        for child_name, child_data in data.get("children", {}).items():
-            preferred_teachers = child_data.get("preferred_teachers", [])
+        data.get("teachers", {}).pop(original_teacher_name, None)
+
+        # Update children's preferred teacher references, skipping any the loaded data no longer has
+        children = data.get("children", {})
+        for child_name in storage.get_children_preferring(year, original_teacher_name):
+            preferred_teachers = children.get(child_name, {}).get("preferred_teachers", [])
             if original_teacher_name in preferred_teachers:
                 preferred_teachers[preferred_teachers.index(original_teacher_name)] = teacher_name
-                children_updated += 1
-                changes_made.append(f"Updated child '{child_name}' preferred teacher reference")
+                renamed_children.add(child_name)
+        children_updated = len(renamed_children)
 
-        # Update schedule references (if any exist)
+        # Update schedule references (if any exist), located through the index
+        schedule = data.get("schedule", {})
         schedules_updated = 0
-        for day, day_schedule in data.get("schedule", {}).items():
-            for time_slot, assignment in day_schedule.items():
-                if assignment.get("teacher") == original_teacher_name:
-                    assignment["teacher"] = teacher_name
-                    schedules_updated += 1
-                    changes_made.append(f"Updated schedule reference for {day} {time_slot}")
+        for day, time_slot in storage.get_schedule_slots_for_teacher(year, original_teacher_name):
+            assignment = schedule.get(day, {}).get(time_slot)
+            if assignment and assignment.get("teacher") == original_teacher_name:
+                assignment["teacher"] = teacher_name
+                schedules_updated += 1
 
         logger.info(
-            f"Teacher rename: {original_teacher_name} -> {teacher_name}, {children_updated} children updated, {schedules_updated} schedule entries updated"
+            "Teacher rename: %s -> %s, %d children updated, %d schedule entries updated",
+            original_teacher_name,
+            teacher_name,
+            children_updated,
+            schedules_updated,
         )
 
     # Update teacher data
     data.setdefault("teachers", {})[teacher_name] = {"availability": availability}
 
-    success = storage.save(year, data)
+    success = storage.mark_dirty(year, data)
     if success:
         action = "renamed and updated" if name_changed else "updated"
         logger.info(f"Successfully {action} teacher: {original_teacher_name} -> {teacher_name}")
         dialog.accept()
 
-        # Refresh all tables
-        refresh_teacher_table(window.ui, data)
-        refresh_children_table(window.ui, data)
-        refresh_tandems_table(window.ui, data)
+        # Children show preferred teacher names, so a rename affects their rows too
+        if name_changed:
+            with batched_updates(window.ui):
+                refresh_teacher_table(window.ui, data, changed_keys={original_teacher_name, teacher_name})
+                refresh_children_table(window.ui, data, changed_keys=renamed_children)
+        else:
+            refresh_teacher_table(window.ui, data, changed_keys={teacher_name})
 
         if hasattr(window, "feedback_manager") and window.feedback_manager:
             if name_changed:
@@ -794,41 +715,11 @@ def _add_teacher_availability_row_with_data(dialog: QWidget, day: str, start_tim
         start_time: Start time
         end_time: End time
     """
-    table = dialog.findChild(QTableWidget, "tableAvailability")
+    table = BaseHandler.get_availability_table(dialog)
     if not table:
         logger.error("tableAvailability not found in dialog")
         return
 
-    row = table.rowCount()
-    table.insertRow(row)
-
-    # Setup day dropdown
-    combo_day = QComboBox()
-    combo_day.addItems(["Mo", "Di", "Mi", "Do", "Fr"])
-    combo_day.setCurrentText(day)
-    combo_day.setEditable(False)
-    table.setCellWidget(row, 0, combo_day)
-
-    # Generate time options (7:00 - 20:45 with 15min intervals)
-    times = []
-    for h in range(7, 21):
-        for m in (0, 15, 30, 45):
-            times.append(f"{h:02}:{m:02}")
-
-    # Setup start time dropdown
-    combo_start = QComboBox()
-    combo_start.setEditable(False)
-    combo_start.addItems(times)
-    combo_start.setCurrentText(start_time)
-    combo_start.currentTextChanged.connect(lambda text: logger.debug(f"Start time changed to: {text}"))
-    table.setCellWidget(row, 1, combo_start)
-
-    # Setup end time dropdown
-    combo_end = QComboBox()
-    combo_end.setEditable(False)
-    combo_end.addItems(times)
-    combo_end.setCurrentText(end_time)
-    combo_end.currentTextChanged.connect(lambda text: logger.debug(f"End time changed to: {text}"))
-    table.setCellWidget(row, 2, combo_end)
-
-    logger.debug(f"Added pre-populated teacher availability row: {day} {start_time}-{end_time}")
+    row = append_availability_row(table, day, start_time, end_time)
+
+    logger.debug("Added teacher availability row %d: %s %s-%s", row, day, start_time, end_time)
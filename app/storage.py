@@ -4,20 +4,173 @@ This module handles JSON-based data persistence for teachers, children,
 tandems, optimization weights, and scheduling results.
 """
 
+import contextlib
+import copy
 import json
 import os
 import re
+import shutil
+from collections.abc import Callable
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, QRunnable, QThreadPool, QTimer, Signal
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from app.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+def _write_json(file_path: str, data: dict[str, Any], pretty: bool = True) -> bytes:
+    """Serialize data and atomically replace a JSON file with it.
+
+    The data is written to a temporary file next to the target and flushed to
+    disk before it replaces the target, so neither an interrupted write nor a
+    crash right after it leaves a truncated file behind.
+
+    Args:
+        file_path: Path of the file to write
+        data: Dictionary to serialize
+        pretty: Indent the output for reading by hand; compact output is smaller
+            and faster to write
+
+    Returns:
+        The bytes written to the file
+
+    Raises:
+        OSError: If the file cannot be written
+        TypeError: If the data is not JSON serializable
+    """
+    if ORJSON_AVAILABLE:
+        # Non-string keys are written as strings, like the json module does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        payload = orjson.dumps(data, option=option)
+    elif pretty:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # The process ID keeps concurrent writers from sharing a temporary file
+    tmp_path = f"{file_path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return payload
+
+
+def _parse_json(payload: bytes) -> Any:
+    """Parse JSON file contents, using orjson when it is available.
+
+    Args:
+        payload: UTF-8 encoded JSON
+
+    Returns:
+        Parsed data
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON (orjson's error is a subclass)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Built-in optimization weights; read-only so callers copy it instead of mutating the shared template
+DEFAULT_WEIGHTS = MappingProxyType(
+    {
+        "preferred_teacher": 5,
+        "priority_early_slot": 3,
+        "tandem_fulfilled": 4,
+        "teacher_pause_respected": 1,
+        "preserve_existing_plan": 10,
+    }
+)
+
+# Custom default weights saved from the settings tab, relative to the working directory
+_DEFAULT_WEIGHTS_FILE = "default_weights.json"
+
+# Fields of a schedule result stored in its own file; the year file keeps only the summary
+_RESULT_BODY_FIELDS = ("schedule", "violations", "weights_used", "optimization_info")
+
+# Schedule result IDs are timestamps like 20240915_143000
+_SCHEDULE_ID_PATTERN = re.compile(r"^[0-9_]+$")
+
+
+def _find_schedule_result(data: dict[str, Any], schedule_id: str) -> dict[str, Any] | None:
+    """Find a schedule result by ID in already loaded year data.
+
+    Args:
+        data: Year data containing the schedule results
+        schedule_id: ID of the schedule result
+
+    Returns:
+        Schedule result data or None if not found
+    """
+    for result in data.get("schedule_results", []):
+        if result.get("id") == schedule_id:
+            return result
+    return None
+
+
+class _SaveSignals(QObject):
+    """Signals used by background save tasks to report back to the GUI thread."""
+
+    # year, written data, success
+    finished = Signal(str, object, bool)
+
+
+class _SaveTask(QRunnable):
+    """Writes the data of one school year on a worker thread."""
+
+    def __init__(self, year: str, file_path: str, data: dict[str, Any], signals: _SaveSignals):
+        """Initialize the task.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            file_path: Path of the JSON file to write
+            data: Year data to write; must not be mutated while the task runs
+            signals: Signals object used to report completion
+        """
+        super().__init__()
+        self._year = year
+        self._file_path = file_path
+        self._data = data
+        self._signals = signals
+
+    def run(self) -> None:
+        """Write the data and report the result."""
+        try:
+            _write_json(self._file_path, self._data)
+            success = True
+        except (OSError, TypeError) as e:
+            logger.error("Error saving data for %s: %s", self._year, e)
+            success = False
+        self._signals.finished.emit(self._year, self._data, success)
+
+
 class Storage:
     """Handles data persistence for SlotPlanner application data."""
 
+    # Delay before pending (debounced) saves are written to disk
+    SAVE_DEBOUNCE_MS = 250
+    # Delay before a failed background write is tried again
+    SAVE_RETRY_MS = 2000
+
     def __init__(self, data_dir: str = None, export_dir: str = None):
         """Initialize storage with data and export directories.
 
@@ -25,20 +178,74 @@ class Storage:
             data_dir: Directory to store JSON files (default: absolute path to ./data)
             export_dir: Directory to store PDF exports (default: absolute path to ./exports)
         """
-        self.data_dir = data_dir or os.path.abspath("data")
+        self._data_dir = data_dir or os.path.abspath("data")
         self.export_dir = export_dir or os.path.abspath("exports")
+        # Inverted index per year: child name -> names of tandems containing that child
+        self._child_tandem_index: dict[str, dict[str, set[str]]] = {}
+        # Inverted index per year: teacher name -> names of children preferring that teacher
+        self._teacher_child_index: dict[str, dict[str, set[str]]] = {}
+        # Inverted index per year: teacher name -> (day, time slot) of their schedule entries
+        self._teacher_schedule_index: dict[str, dict[str, list[tuple[str, str]]]] = {}
+        # Data scheduled for a debounced write, keyed by year
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._flush_scheduled = False
+        # Data handed to the background writer and not yet on disk, keyed by year
+        self._writing: dict[str, dict[str, Any]] = {}
+        # A single writer thread keeps writes for the same year in order
+        self._write_pool = QThreadPool()
+        self._write_pool.setMaxThreadCount(1)
+        self._save_signals = _SaveSignals()
+        self._save_signals.finished.connect(self._on_background_save_finished)
+        # Last file contents read or written per year, keyed by (mtime_ns, size) of the file;
+        # a hit also means the indexes were built from exactly this content
+        self._load_cache: dict[str, tuple[tuple[int, int], bytes]] = {}
+        # Last custom default weights read, keyed by (mtime_ns, size) of their file
+        self._custom_weights_cache: tuple[tuple[int, int], dict[str, Any]] | None = None
+        # Called with the year when a debounced write fails
+        self.on_save_error: Callable[[str], None] | None = None
         self._ensure_data_dir()
         self._ensure_export_dir()
 
+    @property
+    def data_dir(self) -> str:
+        """Directory holding the year files."""
+        return self._data_dir
+
+    @data_dir.setter
+    def data_dir(self, data_dir: str) -> None:
+        """Switch to another data directory.
+
+        Pending saves are written to the previous directory first, and the cached
+        file contents and indexes are dropped because they describe its files.
+
+        Args:
+            data_dir: Directory to store JSON files
+        """
+        self.flush()
+        self._data_dir = data_dir
+        self._child_tandem_index.clear()
+        self._teacher_child_index.clear()
+        self._teacher_schedule_index.clear()
+        self._load_cache.clear()
+
+    def _forget_year(self, year: str) -> None:
+        """Drop the cached file contents and indexes of a year whose file is gone or unreadable.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+        """
+        self._child_tandem_index.pop(year, None)
+        self._teacher_child_index.pop(year, None)
+        self._teacher_schedule_index.pop(year, None)
+        self._load_cache.pop(year, None)
+
     def _ensure_data_dir(self) -> None:
         """Create data directory if it doesn't exist."""
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
 
     def _ensure_export_dir(self) -> None:
         """Create export directory if it doesn't exist."""
-        if not os.path.exists(self.export_dir):
-            os.makedirs(self.export_dir)
+        os.makedirs(self.export_dir, exist_ok=True)
 
     def _validate_year_format(self, year: str) -> bool:
         """Validate that year follows the expected YYYY_YYYY format.
@@ -130,6 +337,36 @@ class Storage:
 
         return file_path
 
+    def _get_result_file_path(self, year: str, schedule_id: str) -> str:
+        """Get the path of the file holding the body of a schedule result.
+
+        Results live next to the year file in "<year>/results/<schedule_id>.json".
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            schedule_id: ID of the schedule result
+
+        Returns:
+            Full path to the result file
+
+        Raises:
+            ValueError: If the year or schedule ID is invalid
+        """
+        if not _SCHEDULE_ID_PATTERN.match(schedule_id):
+            raise ValueError(f"Invalid schedule result ID: '{schedule_id}'")
+        year_dir = os.path.splitext(self._get_file_path(year))[0]
+        return os.path.join(year_dir, "results", f"{schedule_id}.json")
+
+    def _remove_result_file(self, year: str, schedule_id: str) -> None:
+        """Remove the file holding the body of a schedule result, if there is one.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            schedule_id: ID of the schedule result
+        """
+        with contextlib.suppress(OSError, ValueError):
+            os.remove(self._get_result_file_path(year, schedule_id))
+
     def load(self, year: str) -> dict[str, Any] | None:
         """Load data for a specific school year.
 
@@ -145,19 +382,40 @@ class Storage:
             logger.error(f"Invalid year format for loading: {e}")
             return None
 
-        if not os.path.exists(file_path):
+        # Data waiting for a debounced or background write is newer than the file
+        if year in self._pending:
+            return copy.deepcopy(self._pending[year])
+        if year in self._writing:
+            return copy.deepcopy(self._writing[year])
+
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self._forget_year(year)
             return None
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
-                # Basic validation of loaded data structure
-                if not isinstance(data, dict):
-                    logger.error(f"Invalid data format in {year}.json - expected dictionary")
-                    return None
-                return data
+            # Skip the read and index rebuild if the file is unchanged since the last load
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = self._load_cache.get(year)
+            if cached and cached[0] == stamp:
+                return _parse_json(cached[1])
+
+            # Unbuffered: read() sizes one read from fstat, so a buffer layer would only copy
+            with open(file_path, "rb", buffering=0) as f:
+                payload = f.read()
+            data = _parse_json(payload)
+            # Basic validation of loaded data structure
+            if not isinstance(data, dict):
+                logger.error(f"Invalid data format in {year}.json - expected dictionary")
+                self._forget_year(year)
+                return None
+            self._build_indexes(year, data)
+            self._load_cache[year] = (stamp, payload)
+            return data
         except (OSError, json.JSONDecodeError) as e:
             logger.error(f"Error loading data for {year}: {e}")
+            self._forget_year(year)
             return None
 
     def save(self, year: str, data: dict[str, Any]) -> bool:
@@ -181,41 +439,211 @@ class Storage:
             logger.error(f"Invalid data type for saving: expected dict, got {type(data)}")
             return False
 
+        # A direct save supersedes any pending debounced write; let a running
+        # background write finish first so it cannot overwrite this one
+        if year in self._writing:
+            self._wait_for_background_writes()
+        self._pending.pop(year, None)
+
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            payload = _write_json(file_path, data)
+            self._build_indexes(year, data)
+            # The file now holds exactly this data, so the next load can parse it from memory
+            stat = os.stat(file_path)
+            self._load_cache[year] = ((stat.st_mtime_ns, stat.st_size), payload)
             return True
         except (OSError, TypeError) as e:
             logger.error(f"Error saving data for {year}: {e}")
             return False
 
+    def mark_dirty(self, year: str, data: dict[str, Any]) -> bool:
+        """Schedule data for a specific school year to be saved shortly.
+
+        Rapid successive edits are coalesced into a single write, which runs on a
+        background thread. Until the write has finished, load() returns the unsaved
+        data. Without a running Qt application the data is written immediately.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            data: Dictionary containing all data to save
+
+        Returns:
+            True if the save was scheduled (or written), False if the input is invalid
+        """
+        if not self._validate_year_format(year):
+            logger.error(f"Invalid year format for saving: '{year}'")
+            return False
+
+        if not isinstance(data, dict):
+            logger.error(f"Invalid data type for saving: expected dict, got {type(data)}")
+            return False
+
+        if QCoreApplication.instance() is None:
+            return self.save(year, data)
+
+        self._pending[year] = data
+        self._build_indexes(year, data)
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(self.SAVE_DEBOUNCE_MS, self._flush_in_background)
+        return True
+
+    def _flush_in_background(self) -> None:
+        """Hand all pending debounced saves to the background writer."""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+
+        for year, data in pending.items():
+            self._writing[year] = data
+            self._write_pool.start(_SaveTask(year, self._get_file_path(year), data, self._save_signals))
+
+    def _on_background_save_finished(self, year: str, data: dict[str, Any], success: bool) -> None:
+        """Handle completion of a background write.
+
+        Args:
+            year: School year that was written
+            data: Data that was written
+            success: Whether the write succeeded
+        """
+        # A newer write for the same year may already be queued
+        if self._writing.get(year) is data:
+            del self._writing[year]
+        if success:
+            return
+
+        # Keep the unsaved data visible to load() and retry it, unless newer data supersedes it
+        if year not in self._pending and year not in self._writing:
+            self._pending[year] = data
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                QTimer.singleShot(self.SAVE_RETRY_MS, self._flush_in_background)
+        if self.on_save_error:
+            self.on_save_error(year)
+
+    def _wait_for_background_writes(self) -> None:
+        """Block until all background writes have finished."""
+        self._write_pool.waitForDone()
+        # Deliver the queued finished signals now, so failed writes are back in
+        # _pending before the caller decides what still needs writing
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.MetaCall)
+        self._writing.clear()
+
+    def flush(self) -> bool:
+        """Write all pending debounced saves to disk and wait for background writes.
+
+        Returns:
+            True if all pending data was written, False if any write failed
+        """
+        self._wait_for_background_writes()
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+
+        success = True
+        for year, data in pending.items():
+            if not self.save(year, data):
+                success = False
+                if self.on_save_error:
+                    self.on_save_error(year)
+        return success
+
+    def _build_indexes(self, year: str, data: dict[str, Any]) -> None:
+        """Rebuild the child-to-tandems, teacher-to-children and teacher-to-schedule indexes for a year.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            data: Year data containing the tandems, children and schedule sections
+        """
+        # The cached file text no longer matches the data the indexes describe
+        self._load_cache.pop(year, None)
+
+        tandem_index: dict[str, set[str]] = {}
+        for tandem_name, tandem_data in data.get("tandems", {}).items():
+            for key in ("child1", "child2"):
+                child_name = tandem_data.get(key)
+                if child_name:
+                    tandem_index.setdefault(child_name, set()).add(tandem_name)
+        self._child_tandem_index[year] = tandem_index
+
+        teacher_index: dict[str, set[str]] = {}
+        for child_name, child_data in data.get("children", {}).items():
+            for teacher_name in child_data.get("preferred_teachers", []):
+                teacher_index.setdefault(teacher_name, set()).add(child_name)
+        self._teacher_child_index[year] = teacher_index
+
+        schedule_index: dict[str, list[tuple[str, str]]] = {}
+        for day, day_schedule in data.get("schedule", {}).items():
+            for time_slot, assignment in day_schedule.items():
+                teacher_name = assignment.get("teacher")
+                if teacher_name:
+                    schedule_index.setdefault(teacher_name, []).append((day, time_slot))
+        self._teacher_schedule_index[year] = schedule_index
+
+    def get_tandems_for_children(self, year: str, *child_names: str) -> set[str]:
+        """Get the names of all tandems that contain any of the given children.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            *child_names: Names of the children to look up
+
+        Returns:
+            Set of tandem names referencing at least one of the children
+        """
+        index = self._child_tandem_index.get(year)
+        if index is None:
+            if self.load(year) is None:
+                return set()
+            index = self._child_tandem_index[year]
+
+        tandems: set[str] = set()
+        for child_name in child_names:
+            tandems |= index.get(child_name, set())
+        return tandems
+
+    def get_children_preferring(self, year: str, teacher_name: str) -> set[str]:
+        """Get the names of all children that list a teacher as preferred.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            teacher_name: Name of the teacher to look up
+
+        Returns:
+            Set of child names whose preferred teachers include the teacher
+        """
+        index = self._teacher_child_index.get(year)
+        if index is None:
+            if self.load(year) is None:
+                return set()
+            index = self._teacher_child_index[year]
+
+        return set(index.get(teacher_name, set()))
+
+    def get_schedule_slots_for_teacher(self, year: str, teacher_name: str) -> list[tuple[str, str]]:
+        """Get the schedule entries assigned to a teacher.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            teacher_name: Name of the teacher to look up
+
+        Returns:
+            List of (day, time slot) keys of the teacher's entries in the schedule
+        """
+        index = self._teacher_schedule_index.get(year)
+        if index is None:
+            if self.load(year) is None:
+                return []
+            index = self._teacher_schedule_index[year]
+
+        return list(index.get(teacher_name, []))
+
     def get_default_data_structure(self) -> dict[str, Any]:
         """Get the default data structure for a new year.
 
         Returns:
             Dictionary with default empty structure
         """
-        # Load custom default weights if they exist
-        default_weights = {
-            "preferred_teacher": 5,
-            "priority_early_slot": 3,
-            "tandem_fulfilled": 4,
-            "teacher_pause_respected": 1,
-            "preserve_existing_plan": 10,
-        }
-
-        try:
-            import json
-
-            config_file = "default_weights.json"
-            if os.path.exists(config_file):
-                with open(config_file, encoding="utf-8") as f:
-                    custom_weights = json.load(f)
-                    # Merge with defaults, prioritizing custom values
-                    default_weights.update(custom_weights)
-                    logger.debug("Loaded custom default weights")
-        except Exception as e:
-            logger.warning(f"Failed to load custom default weights: {e}")
+        # Merge custom default weights over the built-in ones, prioritizing custom values
+        default_weights = {**DEFAULT_WEIGHTS, **self._load_custom_default_weights()}
 
         return {
             "teachers": {},
@@ -226,6 +654,34 @@ class Storage:
             "current_schedule_id": None,  # ID of currently selected schedule result
         }
 
+    def _load_custom_default_weights(self) -> dict[str, Any]:
+        """Read the custom default weights, reusing the last read while the file is unchanged.
+
+        Returns:
+            Custom weights from default_weights.json, or an empty dict if it is missing or invalid
+        """
+        try:
+            stat = os.stat(_DEFAULT_WEIGHTS_FILE)
+        except OSError:
+            return {}
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._custom_weights_cache and self._custom_weights_cache[0] == stamp:
+            return self._custom_weights_cache[1]
+
+        try:
+            with open(_DEFAULT_WEIGHTS_FILE, "rb") as f:
+                custom_weights = _parse_json(f.read())
+            if not isinstance(custom_weights, dict):
+                raise ValueError("expected a JSON object")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load custom default weights: {e}")
+            return {}
+
+        self._custom_weights_cache = (stamp, custom_weights)
+        logger.debug("Loaded custom default weights")
+        return custom_weights
+
     def exists(self, year: str) -> bool:
         """Check if data file exists for a specific year.
 
@@ -235,6 +691,9 @@ class Storage:
         Returns:
             True if file exists, False otherwise
         """
+        if year in self._pending or year in self._writing:
+            return True
+
         try:
             return os.path.exists(self._get_file_path(year))
         except ValueError:
@@ -246,14 +705,12 @@ class Storage:
         Returns:
             List of school year strings
         """
-        if not os.path.exists(self.data_dir):
-            return []
+        # Years with a pending debounced save may not have a file yet
+        years = set(self._pending) | set(self._writing)
 
-        years = []
-        for filename in os.listdir(self.data_dir):
-            if filename.endswith(".json"):
-                year = filename[:-5]  # Remove .json extension
-                years.append(year)
+        # Directory entries carry their file type, so skipping the results directories needs no extra stat
+        with contextlib.suppress(FileNotFoundError), os.scandir(self.data_dir) as entries:
+            years.update(entry.name[:-5] for entry in entries if entry.name.endswith(".json") and entry.is_file())
 
         return sorted(years)
 
@@ -273,9 +730,16 @@ class Storage:
             return False
 
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                return True
+            # Wait for a running background write so it cannot recreate the file
+            if year in self._writing:
+                self._wait_for_background_writes()
+            self._pending.pop(year, None)
+            # Schedule result files of the year live in a directory named like the year file
+            shutil.rmtree(os.path.splitext(file_path)[0], ignore_errors=True)
+            self._forget_year(year)
+            os.remove(file_path)
+            return True
+        except FileNotFoundError:
             return False
         except OSError as e:
             logger.error(f"Error deleting data for {year}: {e}")
@@ -288,9 +752,13 @@ class Storage:
         violations: list[str],
         weights_used: dict[str, Any],
         optimization_info: dict[str, Any] = None,
-    ) -> str:
+    ) -> str | None:
         """Save a new schedule result with timestamp.
 
+        The schedule, violations, weights and optimization info go to a file of
+        their own, so the year file only grows by a short summary per result and
+        saving a result never rewrites the earlier ones.
+
         Args:
             year: School year in format "YYYY_YYYY"
             schedule_data: The computed schedule assignments
@@ -299,13 +767,24 @@ class Storage:
             optimization_info: Additional info (solver status, runtime, etc.)
 
         Returns:
-            The ID of the saved schedule result
+            The ID of the saved schedule result, or None if it could not be saved
         """
+        if not self._validate_year_format(year):
+            logger.error(f"Invalid year format for saving schedule result: '{year}'")
+            return None
+
         data = self.load(year) or self.get_default_data_structure()
 
-        # Generate unique ID based on timestamp
+        # Generate unique ID based on timestamp; it names the result file, so a
+        # second result within the same second gets a numeric suffix
         timestamp = datetime.now()
-        schedule_id = timestamp.strftime("%Y%m%d_%H%M%S")
+        base_id = timestamp.strftime("%Y%m%d_%H%M%S")
+        taken_ids = {result.get("id") for result in data.get("schedule_results", [])}
+        schedule_id = base_id
+        suffix = 1
+        while schedule_id in taken_ids or os.path.exists(self._get_result_file_path(year, schedule_id)):
+            suffix += 1
+            schedule_id = f"{base_id}_{suffix}"
 
         # Create schedule result entry
         schedule_result = {
@@ -319,31 +798,90 @@ class Storage:
             "description": f"Schedule computed on {timestamp.strftime('%Y-%m-%d at %H:%M')}",
         }
 
+        try:
+            summary = self._store_result_body(year, schedule_result)
+            # Results kept inline by older versions move to their own files on the way
+            results = [self._store_result_body(year, result) for result in data.get("schedule_results", [])]
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Failed to write schedule result {schedule_id} for year {year}: {e}")
+            self._remove_result_file(year, schedule_id)
+            return None
+
         # Add to results list (most recent first)
-        if "schedule_results" not in data:
-            data["schedule_results"] = []
-        data["schedule_results"].insert(0, schedule_result)
+        data["schedule_results"] = [summary, *results]
 
         # Set as current schedule
         data["current_schedule_id"] = schedule_id
 
-        # Save to file
-        success = self.save(year, data)
-        if success:
-            logger.info(f"Saved schedule result {schedule_id} for year {year}")
-        else:
+        # Save to file; without the summary in the year file the result file would be orphaned
+        if not self.save(year, data):
             logger.error(f"Failed to save schedule result {schedule_id} for year {year}")
+            self._remove_result_file(year, schedule_id)
+            return None
 
+        logger.info(f"Saved schedule result {schedule_id} for year {year}")
         return schedule_id
 
+    def _store_result_body(self, year: str, result: dict[str, Any]) -> dict[str, Any]:
+        """Write the body of a schedule result to its own file.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            result: Schedule result, either complete or already a summary
+
+        Returns:
+            The summary of the result to keep in the year file
+
+        Raises:
+            OSError: If the result file cannot be written
+            TypeError: If the result is not JSON serializable
+            ValueError: If the year is invalid
+        """
+        body = {field: result[field] for field in _RESULT_BODY_FIELDS if field in result}
+        # Results with unexpected IDs stay inline, as older versions stored them
+        if not body or not _SCHEDULE_ID_PATTERN.match(str(result.get("id", ""))):
+            return result
+
+        file_path = self._get_result_file_path(year, result["id"])
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # Result bodies are machine-only data, so they are written compactly
+        _write_json(file_path, body, pretty=False)
+        return {key: value for key, value in result.items() if key not in _RESULT_BODY_FIELDS}
+
+    def _load_result_body(self, year: str, summary: dict[str, Any]) -> dict[str, Any]:
+        """Combine a schedule result summary with the body stored in its own file.
+
+        Args:
+            year: School year in format "YYYY_YYYY"
+            summary: Summary of the result from the year file
+
+        Returns:
+            The complete schedule result; results stored inline are returned as they are
+        """
+        if any(field in summary for field in _RESULT_BODY_FIELDS) or not _SCHEDULE_ID_PATTERN.match(
+            str(summary.get("id", ""))
+        ):
+            return summary
+
+        try:
+            with open(self._get_result_file_path(year, summary["id"]), "rb", buffering=0) as f:
+                body = _parse_json(f.read())
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading schedule result {summary.get('id')} for {year}: {e}")
+            body = {}
+        return {**summary, **body}
+
     def get_schedule_results(self, year: str) -> list[dict[str, Any]]:
-        """Get all saved schedule results for a year.
+        """Get the summaries of all saved schedule results for a year.
+
+        Summaries hold the ID, timestamps and description; use
+        get_schedule_result_by_id() for the complete result.
 
         Args:
             year: School year in format "YYYY_YYYY"
 
         Returns:
-            List of schedule results, most recent first
+            List of schedule result summaries, most recent first
         """
         data = self.load(year)
         if not data:
@@ -360,15 +898,18 @@ class Storage:
         Returns:
             Schedule result data or None if not found
         """
-        results = self.get_schedule_results(year)
-        for result in results:
-            if result.get("id") == schedule_id:
-                return result
-        return None
+        data = self.load(year)
+        if not data:
+            return None
+        summary = _find_schedule_result(data, schedule_id)
+        return self._load_result_body(year, summary) if summary else None
 
     def set_current_schedule(self, year: str, schedule_id: str) -> bool:
         """Set the currently active schedule result.
 
+        The change is saved through mark_dirty, so quickly switching between
+        results writes the year file once.
+
         Args:
             year: School year in format "YYYY_YYYY"
             schedule_id: ID of the schedule result to set as current
@@ -381,12 +922,15 @@ class Storage:
             return False
 
         # Verify the schedule exists
-        if not self.get_schedule_result_by_id(year, schedule_id):
+        if not _find_schedule_result(data, schedule_id):
             logger.error(f"Schedule result {schedule_id} not found for year {year}")
             return False
 
+        if data.get("current_schedule_id") == schedule_id:
+            return True
+
         data["current_schedule_id"] = schedule_id
-        success = self.save(year, data)
+        success = self.mark_dirty(year, data)
         if success:
             logger.info(f"Set current schedule to {schedule_id} for year {year}")
         return success
@@ -408,7 +952,8 @@ class Storage:
         if not current_id:
             return None
 
-        return self.get_schedule_result_by_id(year, current_id)
+        summary = _find_schedule_result(data, current_id)
+        return self._load_result_body(year, summary) if summary else None
 
     def delete_schedule_result(self, year: str, schedule_id: str) -> bool:
         """Delete a specific schedule result.
@@ -439,5 +984,6 @@ class Storage:
 
         success = self.save(year, data)
         if success:
+            self._remove_result_file(year, schedule_id)
             logger.info(f"Deleted schedule result {schedule_id} for year {year}")
         return success
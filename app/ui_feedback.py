@@ -50,7 +50,7 @@ class StatusManager:
             duration: Duration in milliseconds (0 for permanent)
             show_progress: Whether to show progress bar
         """
-        logger.debug(f"Status: {message}")
+        logger.debug("Status: %s", message)
         self.status_label.setText(message)
 
         if show_progress:
@@ -213,7 +213,7 @@ class TableUpdateManager:
         refresh_func = self._pending_updates.get(table)
         if refresh_func:
             try:
-                logger.debug(f"Refreshing table: {table.objectName()}")
+                logger.debug("Refreshing table: %s", table.objectName())
                 refresh_func()
                 self._show_table_updated_feedback(table)
             except Exception as e:
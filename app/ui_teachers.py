@@ -4,21 +4,215 @@ This module handles the display and updates of teacher information in the UI,
 particularly focusing on the teacher table widget.
 """
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QHeaderView, QTableWidget, QTableWidgetItem, QWidget
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from functools import cache
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, QStringListModel, Qt
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHeaderView,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableWidget,
+    QTableWidgetItem,
+    QWidget,
+)
 
 from app.config.logging_config import get_logger
 from app.utils import get_translations
 
 logger = get_logger(__name__)
 
+# Choices offered in the availability tables of the teacher and child dialogs
+DAY_OPTIONS: tuple[str, ...] = ("Mo", "Di", "Mi", "Do", "Fr")
+# 7:00 - 20:45 with 15min intervals
+TIME_OPTIONS: tuple[str, ...] = tuple(f"{h:02}:{m:02}" for h in range(7, 21) for m in (0, 15, 30, 45))
+# Times of a newly added availability row
+DEFAULT_START_TIME = "08:00"
+DEFAULT_END_TIME = "17:00"
+
+
+@cache
+def shared_choice_model(choices: tuple[str, ...]) -> QStringListModel:
+    """Get a list model of fixed choices shared by all combo boxes offering them.
+
+    Combo boxes using the shared model need no items of their own, so creating
+    one costs no per-item inserts. They must not be editable, since an edit
+    would change the choices of every combo box.
+
+    Args:
+        choices: Values offered in the combo boxes
+
+    Returns:
+        QStringListModel holding the choices
+    """
+    return QStringListModel(list(choices))
+
+
+class ChoiceDelegate(QStyledItemDelegate):
+    """Edits table cells with a combo box restricted to a fixed list of choices.
+
+    The cells themselves hold plain items; a combo box only exists while a
+    cell is being edited, instead of one widget per cell.
+    """
+
+    def __init__(self, choices: Sequence[str], parent: QObject | None = None):
+        """Initialize the delegate.
+
+        Args:
+            choices: Values offered in the combo box
+            parent: Optional Qt parent object
+        """
+        super().__init__(parent)
+        self._choices = tuple(choices)
+        # Position of each choice, so selecting a value needs no search through the combo box
+        self._choice_index = {choice: i for i, choice in enumerate(self._choices)}
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+        """Create the combo box used to edit a cell."""
+        combo = QComboBox(parent)
+        combo.setModel(shared_choice_model(self._choices))
+        # Commit as soon as a value is picked, like the cell widgets used to
+        combo.activated.connect(lambda _: self.commitData.emit(combo))
+        return combo
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex) -> None:
+        """Select the cell's current value in the combo box."""
+        choice_index = self._choice_index.get(index.data())
+        if choice_index is not None:
+            editor.setCurrentIndex(choice_index)
+
+    def setModelData(self, editor: QWidget, model: QAbstractItemModel, index: QModelIndex) -> None:
+        """Store the selected value in the cell."""
+        model.setData(index, editor.currentText())
+
+
+def _set_availability_row(table: QTableWidget, row: int, day: str, start_time: str, end_time: str) -> None:
+    """Fill one existing row of an availability table.
+
+    Args:
+        table: Availability table widget
+        row: Row index to fill
+        day: Day of week
+        start_time: Start time
+        end_time: End time
+    """
+    table.setItem(row, 0, QTableWidgetItem(day))
+    table.setItem(row, 1, QTableWidgetItem(start_time))
+    table.setItem(row, 2, QTableWidgetItem(end_time))
+
+
+def append_availability_row(table: QTableWidget, day: str, start_time: str, end_time: str) -> int:
+    """Append one row to an availability table.
+
+    Args:
+        table: Availability table widget
+        day: Day of week
+        start_time: Start time
+        end_time: End time
+
+    Returns:
+        Index of the new row
+    """
+    row = table.rowCount()
+    table.insertRow(row)
+    _set_availability_row(table, row, day, start_time, end_time)
+    return row
+
+
+def fill_availability_table(table: QTableWidget, availability: Mapping[str, Sequence[Sequence[str]]]) -> int:
+    """Replace the rows of an availability table with existing slots.
+
+    All rows are allocated at once and the table is repainted once at the end,
+    instead of inserting and repainting row by row. Malformed slots are skipped.
+
+    Args:
+        table: Availability table widget
+        availability: Dictionary with days as keys and [start, end] slot lists as values
+
+    Returns:
+        Number of rows filled
+    """
+    slots = [(day, slot[0], slot[1]) for day, day_slots in availability.items() for slot in day_slots if len(slot) == 2]
+
+    with batched_updates(table):
+        table.setRowCount(0)
+        table.setRowCount(len(slots))
+        for row, (day, start_time, end_time) in enumerate(slots):
+            _set_availability_row(table, row, day, start_time, end_time)
+
+    return len(slots)
+
+
+def read_availability_rows(table: QTableWidget) -> list[tuple[str, str, str]]:
+    """Read the slots entered in an availability table.
+
+    Args:
+        table: Availability table widget
+
+    Returns:
+        (day, start, end) tuples in table order, skipping incomplete rows
+    """
+    rows = []
+    for row in range(table.rowCount()):
+        items = [table.item(row, col) for col in range(3)]
+        if any(item is None for item in items):
+            continue  # skip incomplete rows
+        rows.append((items[0].text(), items[1].text(), items[2].text()))
+    return rows
+
+
+@contextmanager
+def _sorting_suspended(table: QTableWidget) -> Iterator[None]:
+    """Disable sorting while a table is being filled and restore it afterwards.
+
+    Args:
+        table: Table widget that is about to be mutated
+    """
+    sorting = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    try:
+        yield
+    finally:
+        table.setSortingEnabled(sorting)
+
 
-def refresh_teacher_table(window: QWidget, data: dict) -> None:
+@contextmanager
+def batched_updates(window: QWidget) -> Iterator[None]:
+    """Suspend repaints of a window while several tables are refreshed.
+
+    Args:
+        window: Widget containing the tables
+    """
+    window.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        window.setUpdatesEnabled(True)
+
+
+def refresh_all_tables(window: QWidget, data: dict) -> None:
+    """Refresh the teacher, children and tandems tables in one repaint.
+
+    Args:
+        window: Main application window instance
+        data (dict): Application data
+    """
+    with batched_updates(window):
+        refresh_teacher_table(window, data)
+        refresh_children_table(window, data)
+        refresh_tandems_table(window, data)
+
+
+def refresh_teacher_table(window: QWidget, data: dict, changed_keys: set[str] | None = None) -> None:
     """Refresh the teacher table with updated data.
 
     Args:
         window: Main application window instance
         data (dict): Application data containing teacher information
+        changed_keys: Names of teachers that were added, updated or removed. When given,
+            only the affected rows are touched instead of rebuilding the whole table.
     """
     table = window.findChild(QTableWidget, "tableTeachers")
     if data:
@@ -26,34 +220,64 @@ def refresh_teacher_table(window: QWidget, data: dict) -> None:
     else:
         teachers = {}
 
+    if changed_keys is not None and table.columnCount() == 2:
+        with _sorting_suspended(table):
+            _update_rows(table, teachers, changed_keys, _set_teacher_row)
+        return
+
     table.setRowCount(len(teachers))
     table.setColumnCount(2)
     table.setHorizontalHeaderLabels([get_translations("name"), get_translations("availability")])
     table.horizontalHeader().setStretchLastSection(True)
     table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-    for row, (name, info) in enumerate(teachers.items()):
-        availability = info.get("availability", {})
-        avail_text = []
-        for day, slots in availability.items():
-            slot_text = ", ".join(f"{start}–{end}" for start, end in slots)
-            avail_text.append(f"{day}: {slot_text}")
-
-        table.setItem(row, 0, QTableWidgetItem(name))
-        item = QTableWidgetItem("\n".join(avail_text))
-        item.setTextAlignment(Qt.AlignTop)
-        table.setItem(row, 1, item)
+    with _sorting_suspended(table):
+        for row, (name, info) in enumerate(teachers.items()):
+            _set_teacher_row(table, row, name, info)
 
     table.setWordWrap(False)
     table.resizeRowsToContents()
 
 
-def refresh_children_table(window: QWidget, data: dict) -> None:
+def _format_availability(availability: dict) -> str:
+    """Format availability as one line per day for display in a table cell.
+
+    Args:
+        availability: Dictionary with days as keys and [start, end] slot lists as values
+
+    Returns:
+        Availability text
+    """
+    avail_text = []
+    for day, slots in availability.items():
+        slot_text = ", ".join(f"{start}–{end}" for start, end in slots)
+        avail_text.append(f"{day}: {slot_text}")
+    return "\n".join(avail_text)
+
+
+def _set_teacher_row(table: QTableWidget, row: int, name: str, info: dict) -> None:
+    """Fill one row of the teacher table.
+
+    Args:
+        table: Teacher table widget
+        row: Row index to fill
+        name: Teacher name
+        info: Teacher data
+    """
+    table.setItem(row, 0, QTableWidgetItem(name))
+    item = QTableWidgetItem(_format_availability(info.get("availability", {})))
+    item.setTextAlignment(Qt.AlignTop)
+    table.setItem(row, 1, item)
+
+
+def refresh_children_table(window: QWidget, data: dict, changed_keys: set[str] | None = None) -> None:
     """Refresh the children table with updated data.
 
     Args:
         window: Main application window instance
         data (dict): Application data containing children information
+        changed_keys: Names of children that were added, updated or removed. When given,
+            only the affected rows are touched instead of rebuilding the whole table.
     """
     table = window.findChild(QTableWidget, "tableChildren")
     if data:
@@ -61,6 +285,11 @@ def refresh_children_table(window: QWidget, data: dict) -> None:
     else:
         children = {}
 
+    if changed_keys is not None and table.columnCount() == 4:
+        with _sorting_suspended(table):
+            _update_rows(table, children, changed_keys, _set_child_row)
+        return
+
     table.setRowCount(len(children))
     table.setColumnCount(4)
     table.setHorizontalHeaderLabels(
@@ -73,38 +302,47 @@ def refresh_children_table(window: QWidget, data: dict) -> None:
     )
     table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-    for row, (name, info) in enumerate(children.items()):
-        # Name
-        table.setItem(row, 0, QTableWidgetItem(name))
+    with _sorting_suspended(table):
+        for row, (name, info) in enumerate(children.items()):
+            _set_child_row(table, row, name, info)
+
+    table.resizeRowsToContents()
 
-        # Early preference
-        early_pref = get_translations("yes") if info.get("early_preference", False) else get_translations("no")
-        table.setItem(row, 1, QTableWidgetItem(early_pref))
 
-        # Preferred teachers
-        preferred = ", ".join(info.get("preferred_teachers", []))
-        table.setItem(row, 2, QTableWidgetItem(preferred))
+def _set_child_row(table: QTableWidget, row: int, name: str, info: dict) -> None:
+    """Fill one row of the children table.
 
-        # Availability
-        availability = info.get("availability", {})
-        avail_text = []
-        for day, slots in availability.items():
-            slot_text = ", ".join(f"{start}–{end}" for start, end in slots)
-            avail_text.append(f"{day}: {slot_text}")
+    Args:
+        table: Children table widget
+        row: Row index to fill
+        name: Child name
+        info: Child data
+    """
+    # Name
+    table.setItem(row, 0, QTableWidgetItem(name))
 
-        item = QTableWidgetItem("\n".join(avail_text))
-        item.setTextAlignment(Qt.AlignTop)
-        table.setItem(row, 3, item)
+    # Early preference
+    early_pref = get_translations("yes") if info.get("early_preference", False) else get_translations("no")
+    table.setItem(row, 1, QTableWidgetItem(early_pref))
 
-    table.resizeRowsToContents()
+    # Preferred teachers
+    preferred = ", ".join(info.get("preferred_teachers", []))
+    table.setItem(row, 2, QTableWidgetItem(preferred))
 
+    # Availability
+    item = QTableWidgetItem(_format_availability(info.get("availability", {})))
+    item.setTextAlignment(Qt.AlignTop)
+    table.setItem(row, 3, item)
 
-def refresh_tandems_table(window: QWidget, data: dict) -> None:
+
+def refresh_tandems_table(window: QWidget, data: dict, changed_keys: set[str] | None = None) -> None:
     """Refresh the tandems table with updated data.
 
     Args:
         window: Main application window instance
         data (dict): Application data containing tandems information
+        changed_keys: Names of tandems that were added, updated or removed. When given,
+            only the affected rows are touched instead of rebuilding the whole table.
     """
     table = window.findChild(QTableWidget, "tableTandems")
     if data:
@@ -112,6 +350,11 @@ def refresh_tandems_table(window: QWidget, data: dict) -> None:
     else:
         tandems = {}
 
+    if changed_keys is not None and table.columnCount() == 4:
+        with _sorting_suspended(table):
+            _update_rows(table, tandems, changed_keys, _set_tandem_row)
+        return
+
     table.setRowCount(len(tandems))
     table.setColumnCount(4)
     table.setHorizontalHeaderLabels(
@@ -124,18 +367,74 @@ def refresh_tandems_table(window: QWidget, data: dict) -> None:
     )
     table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-    for row, (name, info) in enumerate(tandems.items()):
-        # Tandem name
-        table.setItem(row, 0, QTableWidgetItem(name))
+    with _sorting_suspended(table):
+        for row, (name, info) in enumerate(tandems.items()):
+            _set_tandem_row(table, row, name, info)
 
-        # Child 1
-        table.setItem(row, 1, QTableWidgetItem(info.get("child1", "")))
+    table.resizeRowsToContents()
 
-        # Child 2
-        table.setItem(row, 2, QTableWidgetItem(info.get("child2", "")))
 
-        # Priority
-        priority = str(info.get("priority", 5))
-        table.setItem(row, 3, QTableWidgetItem(priority))
+def _set_tandem_row(table: QTableWidget, row: int, name: str, info: dict) -> None:
+    """Fill one row of the tandems table.
 
-    table.resizeRowsToContents()
+    Args:
+        table: Tandems table widget
+        row: Row index to fill
+        name: Tandem name
+        info: Tandem data
+    """
+    # Tandem name
+    table.setItem(row, 0, QTableWidgetItem(name))
+
+    # Child 1
+    table.setItem(row, 1, QTableWidgetItem(info.get("child1", "")))
+
+    # Child 2
+    table.setItem(row, 2, QTableWidgetItem(info.get("child2", "")))
+
+    # Priority
+    priority = str(info.get("priority", 5))
+    table.setItem(row, 3, QTableWidgetItem(priority))
+
+
+def _update_rows(
+    table: QTableWidget,
+    entries: dict,
+    changed_keys: set[str],
+    set_row: Callable[[QTableWidget, int, str, dict], None],
+) -> None:
+    """Apply changes for specific entries to an already populated table keyed by name.
+
+    Removed entries lose their row, updated entries are rewritten in place and
+    new entries are appended, matching the order a full refresh would produce.
+
+    Args:
+        table: Table widget with entry names in the first column
+        entries: Current entries of the table by name
+        changed_keys: Names of entries that changed
+        set_row: Function filling one row from a name and its data
+    """
+    rows = {}
+    for row in range(table.rowCount()):
+        item = table.item(row, 0)
+        if item and item.text() in changed_keys:
+            rows[item.text()] = row
+
+    # Rewrite existing rows in place first, while row indices are still valid
+    for name, row in rows.items():
+        if name in entries:
+            set_row(table, row, name, entries[name])
+            table.resizeRowToContents(row)
+
+    # Remove rows from the bottom up so earlier indices stay valid
+    for row in sorted((row for name, row in rows.items() if name not in entries), reverse=True):
+        table.removeRow(row)
+
+    # Append new entries in data order
+    new_names = changed_keys - rows.keys()
+    if new_names:
+        for name in [name for name in entries if name in new_names]:
+            row = table.rowCount()
+            table.insertRow(row)
+            set_row(table, row, name, entries[name])
+            table.resizeRowToContents(row)
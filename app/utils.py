@@ -4,6 +4,7 @@ This module provides utility functions for translations and error message displa
 """
 
 import json
+from functools import lru_cache
 from typing import Optional
 
 from PySide6.QtWidgets import QMessageBox, QWidget
@@ -15,6 +16,12 @@ logger = get_logger(__name__)
 # Default language can be changed here
 _current_language = "de"  # Changed default to German
 
+# Default translations for key messages, used when the translations file has no entry
+_DEFAULT_TRANSLATIONS = {
+    "invalid_teacher_name": "Invalid teacher name. Please enter a valid name.",
+    "invalid_time_range": "Invalid time range. Time slots must be at least 45 minutes and end time must be after start time.",
+}
+
 
 def set_language(language_code: str) -> None:
     """Set the current language for translations.
@@ -36,6 +43,19 @@ def get_current_language() -> str:
     return _current_language
 
 
+@lru_cache(maxsize=1)
+def _load_translations() -> dict[str, dict[str, str]]:
+    """Load the translations file once and keep the parsed table in memory.
+
+    Failed loads raise and are therefore not cached, so a later call retries.
+
+    Returns:
+        dict: Mapping of language code to translation table
+    """
+    with open("app/config/translations.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def get_translations(message_key: str) -> str:
     """Get translated text for a given message key.
 
@@ -45,28 +65,19 @@ def get_translations(message_key: str) -> str:
     Returns:
         str: The translated text for the given key
     """
-    # Default translations for key messages
-    default_translations = {
-        "invalid_teacher_name": "Invalid teacher name. Please enter a valid name.",
-        "invalid_time_range": "Invalid time range. Time slots must be at least 45 minutes and end time must be after start time.",
-    }
-
     try:
-        with open("app/config/translations.json", encoding="utf-8") as f:
-            translations = json.load(f)
-            return translations[_current_language][message_key]
+        return _load_translations()[_current_language][message_key]
     except (FileNotFoundError, KeyError, json.JSONDecodeError):
         logger.warning(f"Translation not found for '{message_key}' in language '{_current_language}'. Using fallback.")
         # Try English as fallback
         try:
-            with open("app/config/translations.json", encoding="utf-8") as f:
-                translations = json.load(f)
-                if "en" in translations and message_key in translations["en"]:
-                    return translations["en"][message_key]
+            translations = _load_translations()
+            if "en" in translations and message_key in translations["en"]:
+                return translations["en"][message_key]
         except Exception:
             pass
         # Use hardcoded defaults as final fallback
-        return default_translations.get(message_key, f"Missing translation: {message_key}")
+        return _DEFAULT_TRANSLATIONS.get(message_key, f"Missing translation: {message_key}")
 
 
 def show_error(message: str, parent: Optional["QWidget"] = None) -> None:
@@ -5,13 +5,37 @@ including teachers, children, tandems, and settings.
 """
 
 import re
-from dataclasses import dataclass
-from datetime import datetime
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import pairwise
 
 from app.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Time of day in HH:MM format (hour may have one digit)
+_TIME_PATTERN = re.compile(r"^([0-1]?[0-9]|2[0-3]):([0-5][0-9])$")
+
+
+@lru_cache(maxsize=256)
+def _parse_minutes(time_str: str) -> int | None:
+    """Parse an "HH:MM" string to minutes since midnight, remembering recent results.
+
+    Availability only uses the few times of the 15-minute grid, so after the
+    first parse each time is a cache lookup instead of a regex match.
+
+    Args:
+        time_str: Time string to parse
+
+    Returns:
+        Minutes since midnight, or None if the string is not a valid time
+    """
+    match = _TIME_PATTERN.match(time_str)
+    if not match:
+        return None
+    return int(match.group(1)) * 60 + int(match.group(2))
+
 
 @dataclass
 class ValidationResult:
@@ -20,6 +44,9 @@ class ValidationResult:
     is_valid: bool
     errors: list[str]
     warnings: list[str] = None
+    # Joined messages, built on first access (results are not mutated after creation)
+    _error_message: str | None = field(default=None, init=False, repr=False, compare=False)
+    _warning_message: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.warnings is None:
@@ -37,15 +64,15 @@ class ValidationResult:
 
     def get_error_message(self) -> str:
         """Get formatted error message for display."""
-        if not self.has_errors:
-            return ""
-        return "\n".join(self.errors)
+        if self._error_message is None:
+            self._error_message = "\n".join(self.errors)
+        return self._error_message
 
     def get_warning_message(self) -> str:
         """Get formatted warning message for display."""
-        if not self.has_warnings:
-            return ""
-        return "\n".join(self.warnings)
+        if self._warning_message is None:
+            self._warning_message = "\n".join(self.warnings)
+        return self._warning_message
 
 
 class Validator:
@@ -114,62 +141,80 @@ class Validator:
         errors = []
         warnings = []
 
-        # Format validation
-        time_pattern = r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$"
+        # Format validation, parsing each time once into minutes since midnight
+        start_minutes = Validator.parse_minutes(start_time)
+        end_minutes = Validator.parse_minutes(end_time)
 
-        if not re.match(time_pattern, start_time):
+        if start_minutes is None:
             errors.append(f"Invalid start time format: '{start_time}'. Use HH:MM format")
 
-        if not re.match(time_pattern, end_time):
+        if end_minutes is None:
             errors.append(f"Invalid end time format: '{end_time}'. Use HH:MM format")
 
         if errors:
             return ValidationResult(is_valid=False, errors=errors, warnings=warnings)
 
-        try:
-            # Parse times
-            start_dt = datetime.strptime(start_time, "%H:%M")
-            end_dt = datetime.strptime(end_time, "%H:%M")
-
-            # Basic time logic validation
-            if start_dt >= end_dt:
-                errors.append("End time must be after start time")
-
-            # Duration validation
-            duration = (end_dt - start_dt).total_seconds() / 60
-            if duration < Validator.MIN_SLOT_DURATION:
-                errors.append(f"Time slot must be at least {Validator.MIN_SLOT_DURATION} minutes long")
-
-            # Working hours validation
-            work_start = datetime.strptime(f"{Validator.WORK_DAY_START:02d}:00", "%H:%M")
-            work_end = datetime.strptime(f"{Validator.WORK_DAY_END:02d}:00", "%H:%M")
-
-            if start_dt < work_start:
-                warnings.append(
-                    f"Start time {start_time} is before typical working hours ({Validator.WORK_DAY_START:02d}:00)"
-                )
-
-            if end_dt > work_end:
-                warnings.append(f"End time {end_time} is after typical working hours ({Validator.WORK_DAY_END:02d}:00)")
-
-            # Time raster validation
-            for time_str, time_dt, label in [(start_time, start_dt, "Start"), (end_time, end_dt, "End")]:
-                if time_dt.minute % Validator.TIME_RASTER != 0:
-                    warnings.append(
-                        f"{label} time {time_str} is not aligned with {Validator.TIME_RASTER}-minute raster"
-                    )
+        return Validator._check_slot_minutes(start_time, end_time, start_minutes, end_minutes)
+
+    @staticmethod
+    def _check_slot_minutes(start_time: str, end_time: str, start_minutes: int, end_minutes: int) -> ValidationResult:
+        """Check the duration, working hours and raster of a parsed time slot.
+
+        Args:
+            start_time: Start time as shown in messages
+            end_time: End time as shown in messages
+            start_minutes: Start time in minutes since midnight
+            end_minutes: End time in minutes since midnight
+
+        Returns:
+            ValidationResult with validation status
+        """
+        errors = []
+        warnings = []
+
+        # Basic time logic validation
+        if start_minutes >= end_minutes:
+            errors.append("End time must be after start time")
 
-            # Duration warnings
-            if duration > 480:  # 8 hours
-                warnings.append("Time slot longer than 8 hours may indicate an error")
+        # Duration validation
+        duration = end_minutes - start_minutes
+        if duration < Validator.MIN_SLOT_DURATION:
+            errors.append(f"Time slot must be at least {Validator.MIN_SLOT_DURATION} minutes long")
 
-        except ValueError as e:
-            errors.append(f"Error parsing time values: {e}")
+        # Working hours validation
+        if start_minutes < Validator.WORK_DAY_START * 60:
+            warnings.append(
+                f"Start time {start_time} is before typical working hours ({Validator.WORK_DAY_START:02d}:00)"
+            )
+
+        if end_minutes > Validator.WORK_DAY_END * 60:
+            warnings.append(f"End time {end_time} is after typical working hours ({Validator.WORK_DAY_END:02d}:00)")
+
+        # Time raster validation
+        for time_str, minutes, label in [(start_time, start_minutes, "Start"), (end_time, end_minutes, "End")]:
+            if minutes % 60 % Validator.TIME_RASTER != 0:
+                warnings.append(f"{label} time {time_str} is not aligned with {Validator.TIME_RASTER}-minute raster")
+
+        # Duration warnings
+        if duration > 480:  # 8 hours
+            warnings.append("Time slot longer than 8 hours may indicate an error")
 
         return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
 
     @staticmethod
-    def validate_teacher_availability(availability: dict[str, list[list[str]]]) -> ValidationResult:
+    def parse_minutes(time_str: str) -> int | None:
+        """Parse an "HH:MM" string to minutes since midnight.
+
+        Args:
+            time_str: Time string to parse
+
+        Returns:
+            Minutes since midnight, or None if the string is not a valid time
+        """
+        return _parse_minutes(time_str)
+
+    @staticmethod
+    def validate_teacher_availability(availability: Mapping[str, Sequence[Sequence[str]]]) -> ValidationResult:
         """Validate complete teacher availability data.
 
         Args:
@@ -217,20 +262,20 @@ class Validator:
                 else:
                     has_valid_slots = True
 
-                # Track for overlap detection
-                try:
-                    start_dt = datetime.strptime(start_time, "%H:%M")
-                    end_dt = datetime.strptime(end_time, "%H:%M")
-                    day_slots.append((start_dt, end_dt))
-                    day_duration += (end_dt - start_dt).total_seconds() / 3600  # hours
-                except ValueError:
-                    continue
+                # Track for overlap detection as minutes since midnight (format already validated)
+                start_minutes = Validator.parse_minutes(start_time)
+                end_minutes = Validator.parse_minutes(end_time)
+                day_slots.append((start_minutes, end_minutes, start_time, end_time))
+                day_duration += (end_minutes - start_minutes) / 60  # hours
 
-            # Check for overlapping slots
+            # Check for overlapping slots in one sweep over the slots sorted by start time
             day_slots.sort()
-            for i in range(len(day_slots) - 1):
-                if day_slots[i][1] > day_slots[i + 1][0]:
-                    errors.append(f"Overlapping time slots on day '{day}': {day_slots[i]} and {day_slots[i + 1]}")
+            for previous, current in pairwise(day_slots):
+                if previous[1] > current[0]:
+                    errors.append(
+                        f"Overlapping time slots on day '{day}': "
+                        f"{previous[2]}-{previous[3]} and {current[2]}-{current[3]}"
+                    )
 
             total_hours += day_duration
 
@@ -253,6 +298,28 @@ class Validator:
 
         return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
 
+    @staticmethod
+    def validate_availability_rows(
+        rows: Iterable[tuple[str, str, str]],
+    ) -> tuple[ValidationResult, dict[str, list[list[str]]]]:
+        """Group availability table rows by day and validate them in one pass.
+
+        Each slot is checked once together with the day-level checks, instead of
+        validating every row on its own before validating the whole availability.
+
+        Args:
+            rows: (day, start, end) tuples in table order
+
+        Returns:
+            Tuple of the ValidationResult and the availability grouped by day
+        """
+        # Slots stay [start, end] lists, as loaded from JSON, so unchanged availability compares equal
+        availability: dict[str, list[list[str]]] = {}
+        for day, start_time, end_time in rows:
+            availability.setdefault(day, []).append([start_time, end_time])
+
+        return Validator.validate_teacher_availability(availability), availability
+
     @staticmethod
     def validate_child_name(name: str) -> ValidationResult:
         """Validate child name input.
@@ -0,0 +1,33 @@
+"""
+Data bus tests for SlotPlanner.
+Tests that change notifications are merged into a single refresh.
+"""
+
+from PySide6.QtCore import QCoreApplication
+
+from app.data_bus import DataBus, DirtyKeyQueue
+
+
+class TestDirtyKeyQueue:
+    """Test coalescing of changed keys published on the data bus."""
+
+    def test_keys_merged_into_one_flush(self, qapp):
+        """Several emits before the event loop runs produce one callback with all keys."""
+        calls = []
+        bus = DataBus()
+        queue = DirtyKeyQueue(calls.append)
+        bus.tandems_changed.connect(queue.add)
+
+        bus.tandems_changed.emit({"T1"})
+        bus.tandems_changed.emit({"T1", "T2"})
+        bus.tandems_changed.emit(set())
+        assert calls == []
+
+        QCoreApplication.processEvents()
+        assert calls == [{"T1", "T2"}]
+
+    def test_flush_without_keys_is_noop(self, qapp):
+        """Flushing an empty queue does not call the callback."""
+        calls = []
+        DirtyKeyQueue(calls.append).flush()
+        assert calls == []
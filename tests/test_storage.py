@@ -0,0 +1,401 @@
+"""
+Storage layer tests for SlotPlanner.
+Tests JSON persistence and the lookup indexes maintained by Storage.
+"""
+
+import pytest
+from PySide6.QtTest import QTest
+
+import app.storage as storage_module
+
+YEAR = "2024_2025"
+
+
+class TestTandemIndex:
+    """Test the child-to-tandems index maintained by Storage."""
+
+    def test_index_built_on_save(self, temp_storage):
+        """Saved tandems are found by either of their children."""
+        data = temp_storage.get_default_data_structure()
+        data["tandems"] = {
+            "T1": {"child1": "Anna", "child2": "Ben", "priority": 5},
+            "T2": {"child1": "Clara", "child2": "Anna", "priority": 3},
+        }
+        assert temp_storage.save(YEAR, data)
+
+        assert temp_storage.get_tandems_for_children(YEAR, "Anna") == {"T1", "T2"}
+        assert temp_storage.get_tandems_for_children(YEAR, "Ben", "Clara") == {"T1", "T2"}
+        assert temp_storage.get_tandems_for_children(YEAR, "David") == set()
+
+    def test_index_built_lazily_on_load(self, temp_storage, tmp_path):
+        """A fresh Storage instance builds the index from the file on first query."""
+        data = temp_storage.get_default_data_structure()
+        data["tandems"] = {"T1": {"child1": "Anna", "child2": "Ben", "priority": 5}}
+        assert temp_storage.save(YEAR, data)
+
+        fresh = type(temp_storage)(data_dir=str(tmp_path))
+        assert fresh.get_tandems_for_children(YEAR, "Ben") == {"T1"}
+
+    def test_index_for_missing_year(self, temp_storage):
+        """Querying a year without data returns an empty set."""
+        assert temp_storage.get_tandems_for_children(YEAR, "Anna") == set()
+
+
+class TestTeacherIndex:
+    """Test the teacher indexes maintained by Storage."""
+
+    def test_children_preferring_teacher(self, temp_storage, tmp_path):
+        """Children are found by each of their preferred teachers, also after a fresh load."""
+        data = temp_storage.get_default_data_structure()
+        data["children"] = {
+            "Anna": {"preferred_teachers": ["Frau Müller", "Herr Schmidt"]},
+            "Ben": {"preferred_teachers": ["Herr Schmidt"]},
+            "Clara": {},
+        }
+        assert temp_storage.save(YEAR, data)
+
+        assert temp_storage.get_children_preferring(YEAR, "Herr Schmidt") == {"Anna", "Ben"}
+        assert temp_storage.get_children_preferring(YEAR, "Frau Müller") == {"Anna"}
+        assert temp_storage.get_children_preferring(YEAR, "Nobody") == set()
+
+        fresh = type(temp_storage)(data_dir=str(tmp_path))
+        assert fresh.get_children_preferring(YEAR, "Herr Schmidt") == {"Anna", "Ben"}
+
+    def test_schedule_slots_for_teacher(self, temp_storage):
+        """Schedule entries are found by their teacher."""
+        data = temp_storage.get_default_data_structure()
+        data["schedule"] = {
+            "Mo": {"08:00": {"teacher": "Herr Schmidt", "children": ["Anna"]}},
+            "Di": {"09:00": {"teacher": "Frau Müller"}, "10:00": {"teacher": "Herr Schmidt"}},
+        }
+        assert temp_storage.save(YEAR, data)
+
+        assert sorted(temp_storage.get_schedule_slots_for_teacher(YEAR, "Herr Schmidt")) == [
+            ("Di", "10:00"),
+            ("Mo", "08:00"),
+        ]
+        assert temp_storage.get_schedule_slots_for_teacher(YEAR, "Nobody") == []
+
+    def test_indexes_dropped_when_file_is_gone(self, temp_storage, tmp_path):
+        """A year whose file was removed or replaced by invalid data no longer answers from its old index."""
+        data = temp_storage.get_default_data_structure()
+        data["children"] = {"Anna": {"preferred_teachers": ["T"]}}
+        data["schedule"] = {"Mo": {"08:00": {"teacher": "T"}}}
+        assert temp_storage.save(YEAR, data)
+
+        (tmp_path / f"{YEAR}.json").unlink()
+        assert temp_storage.load(YEAR) is None
+        assert temp_storage.get_children_preferring(YEAR, "T") == set()
+        assert temp_storage.get_schedule_slots_for_teacher(YEAR, "T") == []
+
+        assert temp_storage.save(YEAR, data)
+        (tmp_path / f"{YEAR}.json").write_text("[]")
+        assert temp_storage.load(YEAR) is None
+        assert temp_storage.get_children_preferring(YEAR, "T") == set()
+
+    def test_indexes_dropped_when_data_dir_changes(self, temp_storage, tmp_path):
+        """Switching the data directory forgets the indexes built from the previous one."""
+        data = temp_storage.get_default_data_structure()
+        data["children"] = {"Anna": {"preferred_teachers": ["T"]}}
+        assert temp_storage.save(YEAR, data)
+
+        temp_storage.data_dir = str(tmp_path / "other")
+        assert temp_storage.get_children_preferring(YEAR, "T") == set()
+
+
+class TestDebouncedSave:
+    """Test debounced saves scheduled with mark_dirty."""
+
+    def test_pending_data_visible_before_flush(self, qapp, temp_storage, tmp_path):
+        """Pending data is returned by load and only written on flush."""
+        data = temp_storage.get_default_data_structure()
+        data["tandems"] = {"T1": {"child1": "Anna", "child2": "Ben", "priority": 5}}
+
+        assert temp_storage.mark_dirty(YEAR, data)
+        assert not (tmp_path / f"{YEAR}.json").exists()
+        assert temp_storage.load(YEAR)["tandems"] == data["tandems"]
+        assert temp_storage.exists(YEAR)
+
+        assert temp_storage.flush()
+        assert (tmp_path / f"{YEAR}.json").exists()
+
+        fresh = type(temp_storage)(data_dir=str(tmp_path))
+        assert fresh.load(YEAR)["tandems"] == data["tandems"]
+
+    def test_loaded_pending_data_is_a_copy(self, qapp, temp_storage):
+        """Mutating loaded data does not change the pending write."""
+        data = temp_storage.get_default_data_structure()
+        assert temp_storage.mark_dirty(YEAR, data)
+
+        loaded = temp_storage.load(YEAR)
+        loaded["tandems"]["T1"] = {"child1": "Anna", "child2": "Ben", "priority": 5}
+
+        assert temp_storage.load(YEAR)["tandems"] == {}
+
+    def test_written_in_background_after_debounce(self, qapp, temp_storage, tmp_path):
+        """Without an explicit flush, pending data is written once the event loop runs."""
+        data = temp_storage.get_default_data_structure()
+        data["tandems"] = {"T1": {"child1": "Anna", "child2": "Ben", "priority": 5}}
+        assert temp_storage.mark_dirty(YEAR, data)
+
+        for _ in range(100):
+            QTest.qWait(20)
+            if (tmp_path / f"{YEAR}.json").exists() and not temp_storage._writing:
+                break
+        assert (tmp_path / f"{YEAR}.json").exists()
+
+        fresh = type(temp_storage)(data_dir=str(tmp_path))
+        assert fresh.load(YEAR)["tandems"] == data["tandems"]
+        assert temp_storage.load(YEAR)["tandems"] == data["tandems"]
+
+    def test_failed_background_write_is_kept_and_retried(self, qapp, temp_storage, tmp_path, monkeypatch):
+        """Data whose background write failed stays loadable and is written by the next flush."""
+        write_json = storage_module._write_json
+
+        def fail_write(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(storage_module, "_write_json", fail_write)
+        failed_years = []
+        temp_storage.on_save_error = failed_years.append
+        data = temp_storage.get_default_data_structure()
+        data["teachers"] = {"Anna": {"availability": {}}}
+        assert temp_storage.mark_dirty(YEAR, data)
+
+        for _ in range(100):
+            QTest.qWait(20)
+            if failed_years:
+                break
+        assert failed_years == [YEAR]
+        assert temp_storage.load(YEAR)["teachers"] == data["teachers"]
+
+        monkeypatch.setattr(storage_module, "_write_json", write_json)
+        assert temp_storage.flush()
+        fresh = type(temp_storage)(data_dir=str(tmp_path))
+        assert fresh.load(YEAR)["teachers"] == data["teachers"]
+
+    def test_write_failing_during_flush_is_retried(self, qapp, temp_storage, tmp_path, monkeypatch):
+        """A background write that fails while flush() waits for it is written by that flush."""
+        write_json = storage_module._write_json
+        calls = []
+
+        def fail_first_write(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise OSError("disk full")
+            return write_json(*args, **kwargs)
+
+        monkeypatch.setattr(storage_module, "_write_json", fail_first_write)
+        data = temp_storage.get_default_data_structure()
+        data["teachers"] = {"Anna": {"availability": {}}}
+        assert temp_storage.mark_dirty(YEAR, data)
+        temp_storage._flush_in_background()
+
+        assert temp_storage.flush()
+        assert len(calls) == 2
+        fresh = type(temp_storage)(data_dir=str(tmp_path))
+        assert fresh.load(YEAR)["teachers"] == data["teachers"]
+
+    def test_invalid_year_rejected(self, qapp, temp_storage):
+        """Invalid years are rejected without scheduling a write."""
+        assert not temp_storage.mark_dirty("invalid", {})
+
+
+class TestScheduleResults:
+    """Test selecting and looking up saved schedule results."""
+
+    def test_switching_current_result_is_debounced(self, qapp, temp_storage, tmp_path):
+        """Selecting results marks the year dirty instead of rewriting the file each time."""
+        data = temp_storage.get_default_data_structure()
+        data["schedule_results"] = [{"id": "a"}, {"id": "b"}]
+        data["current_schedule_id"] = "a"
+        assert temp_storage.save(YEAR, data)
+        written = (tmp_path / f"{YEAR}.json").read_bytes()
+
+        assert temp_storage.set_current_schedule(YEAR, "b")
+        assert temp_storage.set_current_schedule(YEAR, "a")
+        assert not temp_storage.set_current_schedule(YEAR, "missing")
+
+        assert (tmp_path / f"{YEAR}.json").read_bytes() == written
+        assert temp_storage.get_current_schedule_result(YEAR) == {"id": "a"}
+        assert temp_storage.flush()
+        assert temp_storage.get_schedule_result_by_id(YEAR, "b") == {"id": "b"}
+
+    def test_result_body_stored_in_own_file(self, temp_storage, tmp_path):
+        """A saved result keeps only its summary in the year file and moves inline results out too."""
+        data = temp_storage.get_default_data_structure()
+        legacy = {"id": "20240101_080000", "readable_timestamp": "2024-01-01 08:00:00", "schedule": {"Mo": {}}}
+        data["schedule_results"] = [legacy]
+        assert temp_storage.save(YEAR, data)
+
+        schedule_id = temp_storage.save_schedule_result(YEAR, {"Di": {}}, ["late"], {"tandem_fulfilled": 4})
+
+        results = temp_storage.get_schedule_results(YEAR)
+        assert [result["id"] for result in results] == [schedule_id, "20240101_080000"]
+        assert all("schedule" not in result for result in results)
+        result_files = sorted(p.name for p in (tmp_path / YEAR / "results").iterdir())
+        assert result_files == sorted([f"{schedule_id}.json", "20240101_080000.json"])
+        assert b"\n" not in (tmp_path / YEAR / "results" / f"{schedule_id}.json").read_bytes()
+
+        current = temp_storage.get_current_schedule_result(YEAR)
+        assert (current["schedule"], current["violations"]) == ({"Di": {}}, ["late"])
+        assert temp_storage.get_schedule_result_by_id(YEAR, "20240101_080000")["schedule"] == {"Mo": {}}
+
+        assert temp_storage.delete_schedule_result(YEAR, schedule_id)
+        assert not (tmp_path / YEAR / "results" / f"{schedule_id}.json").exists()
+
+    def test_results_within_one_second_keep_their_own_files(self, temp_storage, monkeypatch):
+        """A second result saved in the same second gets its own ID instead of overwriting the first."""
+        now = storage_module.datetime(2024, 9, 15, 14, 30, 0)
+        monkeypatch.setattr(storage_module, "datetime", type("FixedDatetime", (), {"now": staticmethod(lambda: now)}))
+
+        first = temp_storage.save_schedule_result(YEAR, {"Mo": {}}, [], {})
+        second = temp_storage.save_schedule_result(YEAR, {"Di": {}}, [], {})
+
+        assert (first, second) == ("20240915_143000", "20240915_143000_2")
+        assert temp_storage.get_schedule_result_by_id(YEAR, first)["schedule"] == {"Mo": {}}
+        assert temp_storage.get_schedule_result_by_id(YEAR, second)["schedule"] == {"Di": {}}
+
+    def test_failed_year_save_removes_result_file(self, temp_storage, tmp_path, monkeypatch):
+        """A result whose summary cannot be saved leaves no file behind."""
+        monkeypatch.setattr(temp_storage, "save", lambda year, data: False)
+
+        assert temp_storage.save_schedule_result(YEAR, {"Mo": {}}, [], {}) is None
+        assert list((tmp_path / YEAR / "results").iterdir()) == []
+
+    def test_list_years_ignores_result_directories(self, temp_storage, tmp_path):
+        """Only year files are listed, not the directories holding their results or other files."""
+        assert temp_storage.save(YEAR, temp_storage.get_default_data_structure())
+        assert temp_storage.save_schedule_result(YEAR, {}, [], {})
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / "old.json").mkdir()
+
+        assert temp_storage.list_years() == [YEAR]
+
+    def test_delete_removes_year_and_reports_missing(self, temp_storage, tmp_path):
+        """Deleting removes the year file and its results; deleting again reports nothing to delete."""
+        assert temp_storage.save(YEAR, temp_storage.get_default_data_structure())
+        assert temp_storage.save_schedule_result(YEAR, {}, [], {})
+
+        assert temp_storage.delete(YEAR)
+        assert not (tmp_path / f"{YEAR}.json").exists()
+        assert not (tmp_path / YEAR).exists()
+        assert not temp_storage.delete(YEAR)
+
+
+class TestSerialization:
+    """Test that both JSON backends produce equivalent files."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, temp_storage, monkeypatch, use_orjson):
+        """Saved data loads back unchanged with either serializer."""
+        if use_orjson and not storage_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(storage_module, "ORJSON_AVAILABLE", use_orjson)
+
+        data = temp_storage.get_default_data_structure()
+        data["teachers"] = {"Jürgen": {"availability": {"Mo": [["08:00", "12:00"]]}}}
+        assert temp_storage.save(YEAR, data)
+
+        assert temp_storage.load(YEAR) == data
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_non_string_keys_written_as_strings(self, temp_storage, monkeypatch, use_orjson):
+        """Integer keys are stored as strings by both serializers."""
+        if use_orjson and not storage_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(storage_module, "ORJSON_AVAILABLE", use_orjson)
+
+        data = temp_storage.get_default_data_structure()
+        data["optimization_info"] = {1: "first run"}
+        assert temp_storage.save(YEAR, data)
+
+        assert temp_storage.load(YEAR)["optimization_info"] == {"1": "first run"}
+
+    def test_failed_save_keeps_previous_file(self, temp_storage, tmp_path, monkeypatch):
+        """A write that fails before replacing the file leaves the previous file intact and no temporary file behind."""
+        data = temp_storage.get_default_data_structure()
+        assert temp_storage.save(YEAR, data)
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(storage_module.os, "replace", fail_replace)
+        changed = temp_storage.get_default_data_structure()
+        changed["teachers"] = {"Anna": {"availability": {"Mo": [["08:00", "12:00"]]}}}
+        assert not temp_storage.save(YEAR, changed)
+        monkeypatch.undo()
+
+        assert temp_storage.load(YEAR) == data
+        assert [p.name for p in tmp_path.iterdir() if p.is_file()] == [f"{YEAR}.json"]
+
+
+class TestLoadCache:
+    """Test reuse of file contents between loads of an unchanged year."""
+
+    def test_repeated_loads_are_independent(self, temp_storage):
+        """Each load returns a fresh dict, so callers may mutate it freely."""
+        data = temp_storage.get_default_data_structure()
+        data["teachers"] = {"Anna": {"availability": {}}}
+        assert temp_storage.save(YEAR, data)
+
+        first = temp_storage.load(YEAR)
+        first["teachers"].clear()
+
+        assert temp_storage.load(YEAR) == data
+
+    def test_external_change_is_picked_up(self, temp_storage, tmp_path):
+        """A file changed by another Storage instance is read again."""
+        data = temp_storage.get_default_data_structure()
+        assert temp_storage.save(YEAR, data)
+        assert temp_storage.load(YEAR) == data
+
+        data["children"] = {"Ben": {"preferred_teachers": ["Anna"]}}
+        other = type(temp_storage)(data_dir=str(tmp_path))
+        assert other.save(YEAR, data)
+
+        assert temp_storage.load(YEAR) == data
+        assert temp_storage.get_children_preferring(YEAR, "Anna") == {"Ben"}
+
+    def test_load_after_save_reuses_written_contents(self, temp_storage, monkeypatch):
+        """Loading a year right after saving it parses the written bytes without reading the file."""
+        data = temp_storage.get_default_data_structure()
+        data["teachers"] = {"Anna": {"availability": {"Mo": [["08:00", "12:00"]]}}}
+        assert temp_storage.save(YEAR, data)
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("file was read again")
+
+        monkeypatch.setattr(storage_module, "open", fail_open, raising=False)
+        assert temp_storage.load(YEAR) == data
+
+
+class TestDefaultWeights:
+    """Test custom default weights for new years."""
+
+    def test_custom_weights_reread_only_when_changed(self, temp_storage, tmp_path, monkeypatch):
+        """The weights file is parsed once while unchanged and picked up again after an edit."""
+        monkeypatch.chdir(tmp_path)
+        weights_file = tmp_path / "default_weights.json"
+        weights_file.write_text('{"preferred_teacher": 7}')
+        assert temp_storage.get_default_data_structure()["weights"]["preferred_teacher"] == 7
+
+        parse_calls = []
+        parse = storage_module._parse_json
+        monkeypatch.setattr(
+            storage_module, "_parse_json", lambda payload: parse_calls.append(payload) or parse(payload)
+        )
+        assert temp_storage.get_default_data_structure()["weights"]["preferred_teacher"] == 7
+        assert parse_calls == []
+
+        weights_file.write_text('{"preferred_teacher": 10}')
+        assert temp_storage.get_default_data_structure()["weights"]["preferred_teacher"] == 10
+
+    def test_new_year_weights_do_not_share_the_template(self, temp_storage, tmp_path, monkeypatch):
+        """Editing one year's weights leaves the built-in defaults and later years untouched."""
+        monkeypatch.chdir(tmp_path)
+        weights = temp_storage.get_default_data_structure()["weights"]
+        weights["preferred_teacher"] = 99
+
+        assert storage_module.DEFAULT_WEIGHTS["preferred_teacher"] == 5
+        assert temp_storage.get_default_data_structure()["weights"]["preferred_teacher"] == 5
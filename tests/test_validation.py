@@ -0,0 +1,108 @@
+"""
+Validation tests for SlotPlanner.
+Tests availability validation used by the teacher, child and tandem dialogs.
+"""
+
+from app.handlers.tandem_handlers import _analyze_availability_overlap
+from app.validation import Validator
+
+
+class TestTeacherAvailability:
+    """Test overlap detection in teacher availability validation."""
+
+    def test_overlap_reported_regardless_of_order(self):
+        """Overlapping slots are found even when entered out of order."""
+        result = Validator.validate_teacher_availability(
+            {"Mo": [["10:00", "12:00"], ["13:00", "15:00"], ["08:00", "10:30"]]}
+        )
+
+        assert not result.is_valid
+        assert result.errors == ["Overlapping time slots on day 'Mo': 08:00-10:30 and 10:00-12:00"]
+
+    def test_adjacent_slots_do_not_overlap(self):
+        """A slot ending exactly when the next one starts is valid."""
+        result = Validator.validate_teacher_availability({"Mo": [["08:00", "10:00"], ["10:00", "12:00"]]})
+
+        assert result.is_valid
+
+    def test_rows_grouped_by_day_and_slot_errors_reported(self):
+        """Table rows are grouped by day, and invalid slots fail with their day as context."""
+        result, availability = Validator.validate_availability_rows(
+            [("Mo", "08:00", "10:00"), ("Di", "09:00", "12:00"), ("Mo", "13:00", "15:00")]
+        )
+
+        assert result.is_valid
+        assert availability == {"Mo": [["08:00", "10:00"], ["13:00", "15:00"]], "Di": [["09:00", "12:00"]]}
+
+        result, _ = Validator.validate_availability_rows([("Mo", "10:00", "09:00")])
+        assert not result.is_valid
+        assert "Day 'Mo': End time must be after start time" in result.errors
+
+
+class TestTimeSlot:
+    """Test single time slot validation."""
+
+    def test_valid_slot(self):
+        """A slot inside working hours on the raster passes without warnings."""
+        result = Validator.validate_time_slot("08:00", "09:30")
+
+        assert result.is_valid
+        assert result.warnings == []
+
+    def test_invalid_format(self):
+        """Malformed times are reported before any other check."""
+        result = Validator.validate_time_slot("8.00", "24:00")
+
+        assert result.errors == [
+            "Invalid start time format: '8.00'. Use HH:MM format",
+            "Invalid end time format: '24:00'. Use HH:MM format",
+        ]
+
+    def test_end_before_start(self):
+        """An end time before the start time is rejected."""
+        result = Validator.validate_time_slot("10:00", "9:00")
+
+        assert not result.is_valid
+        assert "End time must be after start time" in result.errors
+
+    def test_warnings_for_hours_and_raster(self):
+        """Slots outside working hours or off the raster produce warnings only."""
+        result = Validator.validate_time_slot("06:50", "20:10")
+
+        assert result.is_valid
+        assert result.warnings == [
+            "Start time 06:50 is before typical working hours (07:00)",
+            "End time 20:10 is after typical working hours (20:00)",
+            "Start time 06:50 is not aligned with 15-minute raster",
+            "End time 20:10 is not aligned with 15-minute raster",
+            "Time slot longer than 8 hours may indicate an error",
+        ]
+
+    def test_parse_minutes_is_stable_across_calls(self):
+        """Repeated parses return the same minutes, and invalid times stay invalid."""
+        for _ in range(2):
+            assert Validator.parse_minutes("7:45") == 465
+            assert Validator.parse_minutes("20:45") == 1245
+            assert Validator.parse_minutes("24:00") is None
+
+
+class TestAvailabilityOverlap:
+    """Test the availability overlap analysis shown when creating tandems."""
+
+    def test_overlaps_computed_per_day(self):
+        """Overlaps of at least 45 minutes are reported with their times and duration."""
+        avail1 = {"Mo": [["08:00", "12:00"]], "Di": [["08:00", "09:00"]]}
+        avail2 = {"Mo": [["10:30", "14:00"], ["7:00", "8:30"]], "Di": [["08:30", "10:00"]]}
+
+        result = _analyze_availability_overlap(avail1, avail2, "Anna", "Ben")
+
+        assert result["overlaps"] == [{"day": "Mo", "start": "10:30", "end": "12:00", "duration_minutes": 90}]
+        assert result["total_overlap_minutes"] == 90
+        assert result["limited_overlap"]
+        assert result["overlap_summary"] == "Mo: 10:30-12:00 (90 min)"
+
+    def test_malformed_slots_are_skipped(self):
+        """Slots that are not valid times are ignored."""
+        result = _analyze_availability_overlap({"Mo": [["bad", "12:00"]]}, {"Mo": [["08:00", "12:00"]]}, "A", "B")
+
+        assert not result["has_overlap"]
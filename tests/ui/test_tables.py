@@ -0,0 +1,172 @@
+"""
+Table refresh tests for SlotPlanner.
+Tests that targeted table updates match a full rebuild.
+"""
+
+import gc
+
+import pytest
+from PySide6.QtWidgets import QStyleOptionViewItem, QTableWidget, QWidget
+
+from app.handlers import child_handlers
+from app.handlers.teacher_handlers import _setup_availability_table_headers, teacher_dialog_add_availability_row
+from app.ui_teachers import (
+    fill_availability_table,
+    refresh_children_table,
+    refresh_tandems_table,
+    refresh_teacher_table,
+)
+
+pytestmark = pytest.mark.ui
+
+
+def _make_window(object_name="tableTandems"):
+    """Create a bare widget hosting a table with the given object name."""
+    window = QWidget()
+    table = QTableWidget(window)
+    table.setObjectName(object_name)
+    return window, table
+
+
+def _table_contents(table):
+    """Read all cell texts from a table."""
+    return [[table.item(row, col).text() for col in range(table.columnCount())] for row in range(table.rowCount())]
+
+
+class TestTandemsTable:
+    """Test targeted updates of the tandems table."""
+
+    def test_changed_keys_match_full_refresh(self, qapp):
+        """Adding, renaming and removing tandems via changed_keys matches a full rebuild."""
+        data = {
+            "tandems": {
+                "T1": {"child1": "Anna", "child2": "Ben", "priority": 5},
+                "T2": {"child1": "Clara", "child2": "David", "priority": 3},
+                "T3": {"child1": "Emil", "child2": "Finn", "priority": 7},
+            }
+        }
+        window, table = _make_window()
+        refresh_tandems_table(window, data)
+
+        # Update T1, rename T2 -> T4, remove T3
+        data["tandems"]["T1"]["priority"] = 9
+        data["tandems"]["T4"] = data["tandems"].pop("T2")
+        del data["tandems"]["T3"]
+        refresh_tandems_table(window, data, changed_keys={"T1", "T2", "T3", "T4"})
+
+        expected_window, expected_table = _make_window()
+        refresh_tandems_table(expected_window, data)
+
+        assert _table_contents(table) == _table_contents(expected_table)
+
+
+class TestTeacherAndChildrenTables:
+    """Test targeted updates of the teacher and children tables after a teacher rename."""
+
+    def test_rename_with_changed_keys_matches_full_refresh(self, qapp):
+        """Renaming a teacher via changed_keys matches a full rebuild of both tables."""
+        data = {
+            "teachers": {
+                "Anna": {"availability": {"Mo": [["08:00", "12:00"]]}},
+                "Bert": {"availability": {"Di": [["09:00", "11:00"]]}},
+            },
+            "children": {
+                "Clara": {"early_preference": True, "preferred_teachers": ["Anna"], "availability": {}},
+                "David": {"early_preference": False, "preferred_teachers": ["Bert"], "availability": {}},
+            },
+        }
+        window, teacher_table = _make_window("tableTeachers")
+        children_table = QTableWidget(window)
+        children_table.setObjectName("tableChildren")
+        refresh_teacher_table(window, data)
+        refresh_children_table(window, data)
+
+        # Rename Anna -> Anja, as the edit dialog does
+        data["teachers"]["Anja"] = data["teachers"].pop("Anna")
+        data["children"]["Clara"]["preferred_teachers"] = ["Anja"]
+        refresh_teacher_table(window, data, changed_keys={"Anna", "Anja"})
+        refresh_children_table(window, data, changed_keys={"Clara"})
+
+        expected_window, expected_teachers = _make_window("tableTeachers")
+        expected_children = QTableWidget(expected_window)
+        expected_children.setObjectName("tableChildren")
+        refresh_teacher_table(expected_window, data)
+        refresh_children_table(expected_window, data)
+
+        assert _table_contents(teacher_table) == _table_contents(expected_teachers)
+        assert _table_contents(children_table) == _table_contents(expected_children)
+
+
+class TestAvailabilityTable:
+    """Test the availability table edited through combo box delegates."""
+
+    def test_rows_are_items_edited_by_delegate(self, qapp):
+        """New rows hold plain items with defaults, and the delegate writes picked values back."""
+        dialog = QWidget()
+        table = QTableWidget(0, 3, dialog)
+        table.setObjectName("tableAvailability")
+        _setup_availability_table_headers(dialog)
+        gc.collect()
+
+        teacher_dialog_add_availability_row(dialog)
+        assert table.cellWidget(0, 1) is None
+        assert [table.item(0, col).text() for col in range(3)] == ["Mo", "08:00", "17:00"]
+
+        index = table.model().index(0, 1)
+        delegate = table.itemDelegateForColumn(1)
+        editor = delegate.createEditor(table.viewport(), QStyleOptionViewItem(), index)
+        delegate.setEditorData(editor, index)
+        assert editor.currentText() == "08:00"
+
+        editor.setCurrentText("09:15")
+        delegate.setModelData(editor, table.model(), index)
+        assert table.item(0, 1).text() == "09:15"
+
+        # A value outside the choices leaves the editor on its first choice
+        table.item(0, 1).setText("7:30")
+        editor = delegate.createEditor(table.viewport(), QStyleOptionViewItem(), index)
+        delegate.setEditorData(editor, index)
+        assert editor.currentIndex() == 0
+
+    def test_editors_share_one_choice_model(self, qapp):
+        """All editors of a column offer the same choices from one shared model."""
+        dialog = QWidget()
+        table = QTableWidget(0, 3, dialog)
+        table.setObjectName("tableAvailability")
+        _setup_availability_table_headers(dialog)
+        teacher_dialog_add_availability_row(dialog)
+
+        index = table.model().index(0, 2)
+        delegate = table.itemDelegateForColumn(2)
+        first = delegate.createEditor(table.viewport(), QStyleOptionViewItem(), index)
+        second = delegate.createEditor(table.viewport(), QStyleOptionViewItem(), index)
+
+        assert first.model() is second.model()
+        assert first.count() == 56
+        assert first.itemText(0) == "07:00"
+
+    def test_child_rows_are_items_edited_by_delegate(self, qapp):
+        """The child dialog table uses the same item rows and delegates as the teacher dialog."""
+        dialog = QWidget()
+        table = QTableWidget(0, 3, dialog)
+        table.setObjectName("tableAvailability")
+        child_handlers._setup_availability_table_headers(dialog)
+
+        child_handlers.child_dialog_add_availability_row(dialog)
+        child_handlers._add_availability_row_with_data(dialog, "Do", "7:30", "09:00")
+
+        assert table.cellWidget(0, 0) is None
+        assert [[table.item(row, col).text() for col in range(3)] for row in range(2)] == [
+            ["Mo", "08:00", "17:00"],
+            ["Do", "7:30", "09:00"],
+        ]
+        assert table.itemDelegateForColumn(0) is not None
+
+    def test_fill_replaces_rows_and_skips_malformed_slots(self, qapp):
+        """Filling from existing data replaces previous rows in data order."""
+        table = QTableWidget(2, 3)
+
+        count = fill_availability_table(table, {"Mo": [["08:00", "09:00"], ["10:00"]], "Fr": [["13:00", "14:00"]]})
+
+        assert count == 2
+        assert _table_contents(table) == [["Mo", "08:00", "09:00"], ["Fr", "13:00", "14:00"]]